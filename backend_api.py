@@ -9,7 +9,7 @@ from fastapi.middleware.cors import CORSMiddleware
 from fastapi.staticfiles import StaticFiles
 from fastapi.responses import FileResponse
 from pydantic import BaseModel
-from typing import Optional, Dict, Set
+from typing import Optional, Dict, List, Set
 import sys
 import os
 import traceback
@@ -23,6 +23,7 @@ from services.gator_solana import (
     analyze_execution_profile,
     fetch_transaction,
     fetch_signatures,
+    activity_histograms,
     analyze_wallet as analyze_wallet_solana,
     detect_sleep_window as detect_sleep_window_solana,
     calculate_probabilities as calculate_probabilities_solana,
@@ -70,22 +71,32 @@ async def on_wallet_activity(event: dict):
     Callback triggered when a watched wallet becomes active.
     Broadcasts event to all connected WebSocket clients.
     """
-    print(f"[API] 🚨 Wallet activity detected: {event['wallet'][:10]}...")
+    await on_wallet_activity_batch([event])
+
+
+async def on_wallet_activity_batch(events: List[dict]):
+    """
+    Batch callback: the stalkers coalesce bursts of activity into one call.
+    Each event is serialized once and broadcast to all connected WebSocket clients.
+    """
+    for event in events:
+        print(f"[API] 🚨 Wallet activity detected: {event['wallet'][:10]}...")
     
     # TODO: Optionally trigger automatic profile scan here
     # scan_result = await trigger_profile_scan(event['wallet'], event['chain'])
     # event['scan_result'] = scan_result
     
     # Broadcast to all connected clients
-    message = json.dumps({
+    messages = [json.dumps({
         "type": "wallet_activity",
         "data": event
-    })
+    }) for event in events]
     
     disconnected = set()
     for connection in active_stalker_connections:
         try:
-            await connection.send_text(message)
+            for message in messages:
+                await connection.send_text(message)
         except Exception:
             disconnected.add(connection)
     
@@ -187,11 +198,7 @@ def analyze_wallet_comprehensive(request: WalletAnalysisRequest):
             raise HTTPException(status_code=404, detail="No transactions found for this wallet")
         
         # Calculate hourly and daily counts
-        hourly_counts = [0] * 24
-        daily_counts = [0] * 7
-        for _, row in df.iterrows():
-            hourly_counts[row["hour"]] += 1
-            daily_counts[row["day_of_week"]] += 1
+        hourly_counts, daily_counts = activity_histograms(df)
         
         # Detect sleep window
         sleep = detect_sleep(hourly_counts)
@@ -437,8 +444,8 @@ async def stalker_websocket(websocket: WebSocket):
                     stalker = await get_stalker(chain)
                     
                     # Register callback if not already set
-                    if not stalker.on_activity:
-                        stalker.on_activity = on_wallet_activity
+                    if not stalker.on_activity_batch:
+                        stalker.on_activity_batch = on_wallet_activity_batch
                     
                     # Subscribe to wallet
                     success = await stalker.watch_wallet(wallet)
@@ -1,15 +1,43 @@
+import asyncio
+import atexit
 import csv
+import json
 import time
 import requests
-import math
 import sys
 import os
+import threading
+import numpy as np
 from datetime import datetime
+from collections import OrderedDict, deque
 from solana.rpc.api import Client
+from solana.rpc.websocket_api import connect
 from solders.pubkey import Pubkey
 from solders.signature import Signature
+from solders.transaction_status import EncodedConfirmedTransactionWithStatusMeta
+from solders.rpc.config import RpcTransactionLogsFilterMentions
+from solders.rpc.responses import LogsNotification
 from dotenv import load_dotenv
 
+# Optional libuv-based event loop for the wallet stream (not available on Windows)
+try:
+    import uvloop
+    UVLOOP_SUPPORTED = True
+except ImportError:
+    UVLOOP_SUPPORTED = False
+
+# Base58 decoding for JSON-encoded instruction data (Rust-backed based58 preferred)
+try:
+    from based58 import b58decode
+    BASE58_SUPPORTED = True
+except ImportError:
+    try:
+        from base58 import b58decode
+        BASE58_SUPPORTED = True
+    except ImportError:
+        BASE58_SUPPORTED = False
+        print("[!] Warning: base58 decoding not available - method IDs will show as N/A (pip install based58 or base58)")
+
 load_dotenv()
 
 # --- CONFIGURATION ---
@@ -21,6 +49,10 @@ if not HELIUS_API_KEY:
 
 RPC_HTTPS_URL = f"https://mainnet.helius-rpc.com/?api-key={HELIUS_API_KEY}"
 
+# Client-side RPC request budget (free-tier Helius keys allow 10 requests/second)
+HELIUS_RPS = int(os.getenv("HELIUS_RPS", "10"))
+RPC_WSS_URL = f"wss://mainnet.helius-rpc.com/?api-key={HELIUS_API_KEY}"
+
 # FINGERPRINTS
 KNOWN_PROGRAMS = {
     "675kPX9MHTjS2zt1qfr1NYHuzeLXfQM9H24wFSUt1Mp8": "Raydium V4",
@@ -35,7 +67,7 @@ KNOWN_PROGRAMS = {
     "E2uCGJ4TtYyKPGaK57UMfbs9sgaumwDEZF1aAY6fF3mS": "MEV Bot Proxy (E2uC)",
 }
 
-JITO_TIP_ACCOUNTS = [
+JITO_TIP_ACCOUNTS = frozenset({
     "96gYZGLnJYVFmbjzopPSU6QiEV5fGqZNyN9nmNhvrZU5",
     "HFqU5x63VTqvTsszeoPhtUYj9rdag4djXeFQiDmJzTMX",
     "Cw8CFyM9FkoPhlTnrKMhTHqXheqJZNs4Fl31iWBP6UBu",
@@ -44,7 +76,7 @@ JITO_TIP_ACCOUNTS = [
     "3AVi9Tg9Uo68tJfuvoKvqKNWKkC5wPdSSdeBnIzKZ6jJ",
     "DoPtqvycNsD9nuNSqMZ5J1GzV91qfQ4t7x1qF4aPiPce",
     "Ma1aHg66C61q1pF9n2c8bJqQ5tV4r4m1wW6d2t1p1X2"
-]
+})
 
 JITO_HUBS = {
     "Tokyo": (35.6762, 139.6503),
@@ -53,27 +85,133 @@ JITO_HUBS = {
     "Frankfurt": (50.1109, 8.6821),
     "SLC": (40.7608, -111.8910)
 }
+HUB_NAMES = list(JITO_HUBS.keys())
+_hub_coords = np.radians(np.array(list(JITO_HUBS.values()), dtype=np.float64))
+HUB_LAT_R, HUB_LON_R = _hub_coords[:, 0], _hub_coords[:, 1]
+HUB_COS_LAT = np.cos(HUB_LAT_R)
 
 OUTPUT_FILE = "target_lock_v11.csv"
 
+# Confirmed transactions never change - keep the most recent ones in memory
+TX_CACHE_SIZE = 4096
+
+# Signatures remembered by the wallet monitor (oldest evicted first)
+PROCESSED_SIGS_SIZE = 1000
+
+# ip-api.com resolves up to 100 IPs per batch request
+GEOIP_BATCH_URL = "http://ip-api.com/batch?fields=status,city,countryCode,lat,lon,query"
+GEOIP_BATCH_SIZE = 100
+
+# A pushed signature can arrive before getTransaction has indexed it - retry this many times, 1s apart
+MONITOR_TX_RETRIES = 3
+
+# Validator map (and GeoIP cache) refresh period
+CLUSTER_REFRESH_SECONDS = 600
+
+# One-shot analysis waits this long for the first network map (the monitor never waits)
+MAP_WAIT_SECONDS = 60
+
+# Flush the CSV log after this many rows or seconds, whichever comes first
+CSV_FLUSH_ROWS = 20
+CSV_FLUSH_SECONDS = 2.0
+
+# Leaders hold consecutive slots - fetch a few ahead per get_slot_leaders call
+LEADER_PREFETCH = 4
+LEADER_CACHE_SIZE = 4096
+
+class TokenBucket:
+    """Thread-safe token-bucket rate limiter"""
+
+    def __init__(self, rate, burst):
+        self.rate = rate
+        self.capacity = burst
+        self._tokens = float(burst)
+        self._updated = time.monotonic()
+        self._lock = threading.Lock()
+
+    def take(self):
+        """Block until a token is available, then consume it"""
+        while True:
+            with self._lock:
+                now = time.monotonic()
+                self._tokens = min(self.capacity, self._tokens + (now - self._updated) * self.rate)
+                self._updated = now
+                if self._tokens >= 1:
+                    self._tokens -= 1
+                    return
+                wait = (1 - self._tokens) / self.rate
+            time.sleep(wait)
+
+# One token per HTTP request (a whole batch counts once) - replaces fixed sleeps between calls
+RPC_BUCKET = TokenBucket(HELIUS_RPS, HELIUS_RPS)
+
+RPC_SESSION = requests.Session()
+
+def rpc_single(method, params, timeout=30):
+    """One JSON-RPC call; returns its result (None on error)"""
+    RPC_BUCKET.take()
+    try:
+        r = RPC_SESSION.post(RPC_HTTPS_URL, json={"jsonrpc": "2.0", "id": 0, "method": method, "params": params}, timeout=timeout)
+        return r.json().get("result") if r.ok else None
+    except (requests.RequestException, ValueError):
+        return None
+
+def rpc_batch(methods_and_params, timeout=30):
+    """POST several JSON-RPC calls in one request. Results come back in call order (None on error)."""
+    payload = [
+        {"jsonrpc": "2.0", "id": i, "method": method, "params": params}
+        for i, (method, params) in enumerate(methods_and_params)
+    ]
+    RPC_BUCKET.take()
+    r = RPC_SESSION.post(RPC_HTTPS_URL, json=payload, timeout=timeout)
+    try:
+        data = r.json() if r.ok else None
+    except ValueError:
+        data = None
+    if not isinstance(data, list):
+        # Batching not supported/allowed on this plan - one call at a time (rate-limited)
+        return [rpc_single(method, params, timeout) for method, params in methods_and_params]
+    # The spec allows responses in any order - re-sort by id
+    results = [None] * len(payload)
+    for resp in data:
+        if isinstance(resp, dict) and isinstance(resp.get("id"), int) and 0 <= resp["id"] < len(results):
+            results[resp["id"]] = resp.get("result")
+    return results
+
 class JitoTargetLockV11:
     def __init__(self):
         self.client = Client(RPC_HTTPS_URL)
         self.cluster_map = {} 
         self.geo_cache = {}   
         self.processed_sigs = set()
+        self._sig_order = deque(maxlen=PROCESSED_SIGS_SIZE)  # insertion order of processed_sigs
+        self.tx_cache = OrderedDict()  # signature -> transaction, LRU order
+        self.slot_leaders = OrderedDict()  # slot -> leader pubkey
+        self.leader_hubs = {}  # leader pubkey -> hub string (only resolved ones)
         
-        self.csv_file = open(OUTPUT_FILE, mode='a', newline='', encoding='utf-8')
+        self.csv_file = open(OUTPUT_FILE, mode='a', newline='', encoding='utf-8', buffering=1 << 16)
         self.writer = csv.writer(self.csv_file)
         if self.csv_file.tell() == 0:
             self.writer.writerow(["Timestamp", "Target", "Programs", "Method_ID", "Full_Log", "Tip", "Hub", "Sig"])
             self.csv_file.flush()
+        self._rows_since_flush = 0
+        self._last_flush = time.time()
+        atexit.register(self.csv_file.flush)
+
+        # Map the network in the background - mode selection and tx fetches don't need it
+        print("[*] TargetLock V11 (Profiler) Initialized. Mapping Network in background...")
+        self._map_ready = threading.Event()
+        threading.Thread(target=self._refresh_loop, daemon=True).start()
 
-        print("[*] TargetLock V11 (Profiler) Initialized. Mapping Network...")
-        self.refresh_cluster_nodes()
+    def _refresh_loop(self):
+        while True:
+            self.refresh_cluster_nodes()
+            self._map_ready.set()
+            time.sleep(CLUSTER_REFRESH_SECONDS)
 
     def refresh_cluster_nodes(self):
         try:
+            RPC_BUCKET.take()
             nodes = self.client.get_cluster_nodes()
             count = 0
             for node in nodes.value:
@@ -84,6 +222,22 @@ class JitoTargetLockV11:
             print(f"[*] Map Ready: {count} active validators.")
         except Exception as e:
             print(f"[!] Map update failed: {e}")
+        self.warm_geo_cache()
+
+    def warm_geo_cache(self):
+        """Batch-resolve every validator IP not yet in geo_cache, so get_geoip is a cache hit on the hot path"""
+        new_ips = [ip for ip in set(self.cluster_map.values()) if ip not in self.geo_cache]
+        for start in range(0, len(new_ips), GEOIP_BATCH_SIZE):
+            chunk = new_ips[start:start + GEOIP_BATCH_SIZE]
+            try:
+                r = requests.post(GEOIP_BATCH_URL, json=[{"query": ip} for ip in chunk], timeout=10)
+                if r.status_code != 200:
+                    break  # rate limited - remaining IPs fall back to get_geoip
+                for data in r.json():
+                    if data.get("status") == "success":
+                        self.geo_cache[data["query"]] = (data.get('city', '?'), data.get('countryCode', '?'), data.get('lat', 0), data.get('lon', 0))
+            except Exception:
+                break
 
     def get_geoip(self, ip):
         if ip in self.geo_cache: return self.geo_cache[ip]
@@ -100,75 +254,59 @@ class JitoTargetLockV11:
 
     def classify_hub(self, lat, lon):
         if lat == 0: return "Unknown"
-        min_dist = float('inf')
-        best_hub = "Unknown"
-        for hub_name, (h_lat, h_lon) in JITO_HUBS.items():
-            dist = math.sqrt((lat - h_lat)**2 + (lon - h_lon)**2)
-            if dist < min_dist:
-                min_dist = dist
-                best_hub = hub_name
-        return best_hub
-
-    def detect_jito_tip(self, tx_value):
+        # Haversine term a grows monotonically with great-circle distance - argmin on it directly
+        lat_r, lon_r = np.radians(lat), np.radians(lon)
+        a = np.sin((HUB_LAT_R - lat_r) / 2)**2 + np.cos(lat_r) * HUB_COS_LAT * np.sin((HUB_LON_R - lon_r) / 2)**2
+        return HUB_NAMES[int(a.argmin())]
+
+    def unpack_tx(self, tx_value):
+        """Split a transaction once into (account keys as str incl. loaded, instructions, pre_balances, post_balances)"""
+        msg = tx_value.transaction.transaction.message
+        meta = tx_value.transaction.meta
+        
+        all_keys = [str(k) for k in msg.account_keys]
+        pre_balances, post_balances = [], []
+        if meta:
+            if meta.loaded_addresses:
+                all_keys += [str(k) for k in meta.loaded_addresses.writable]
+                all_keys += [str(k) for k in meta.loaded_addresses.readonly]
+            pre_balances, post_balances = meta.pre_balances, meta.post_balances
+        return all_keys, msg.instructions, pre_balances, post_balances
+
+    def detect_jito_tip(self, all_keys, pre_balances, post_balances):
         try:
-            meta = tx_value.transaction.meta
-            static_keys = tx_value.transaction.transaction.message.account_keys
-            
-            loaded_keys = []
-            if hasattr(meta, "loaded_addresses") and meta.loaded_addresses:
-                loaded_keys = meta.loaded_addresses.writable + meta.loaded_addresses.readonly
-            
-            all_keys = list(static_keys) + loaded_keys
-            
-            pre_balances = meta.pre_balances
-            post_balances = meta.post_balances
-            
-            for i, key in enumerate(all_keys):
-                if i < len(pre_balances) and str(key) in JITO_TIP_ACCOUNTS:
+            # Only keys with a balance entry can be tip accounts
+            for i, key in enumerate(all_keys[:len(pre_balances)]):
+                if key in JITO_TIP_ACCOUNTS:
                     tip = (post_balances[i] - pre_balances[i]) / 1000000000.0
                     return True, tip
             return False, 0.0
         except Exception as e:
             return False, 0.0
 
-    def deep_decode(self, tx_value):
+    def deep_decode(self, all_keys, instructions):
         invoked_programs = set()
         method_id = "N/A"
         
+        n_keys = len(all_keys)
         try:
-            msg = tx_value.transaction.transaction.message
-            meta = tx_value.transaction.meta
-            
-            static_keys = msg.account_keys
-            loaded_keys = []
-            if hasattr(meta, "loaded_addresses") and meta.loaded_addresses:
-                loaded_keys = meta.loaded_addresses.writable + meta.loaded_addresses.readonly
-            
-            all_keys = list(static_keys) + loaded_keys
-            instructions = msg.instructions
-
             for i, ix in enumerate(instructions):
                 prog_index = ix.program_id_index
                 
-                if prog_index < len(all_keys):
-                    prog_id = str(all_keys[prog_index])
+                if prog_index < n_keys:
+                    prog_id = all_keys[prog_index]
                     name = KNOWN_PROGRAMS.get(prog_id, f"Unknown ({prog_id[:4]}...)")
                     invoked_programs.add(name)
                     
-                    if "Compute" not in name and "System" not in name and method_id == "N/A":
-                        # ROBUST BYTES CONVERSION
+                    if method_id == "N/A" and "Compute" not in name and "System" not in name:
+                        # JSON-encoded transactions carry instruction data as base58 text
                         try:
-                            if isinstance(ix.data, bytes):
-                                raw_data = ix.data
-                            elif isinstance(ix.data, str):
-                                raw_data = ix.data.encode('utf-8', errors='ignore')
-                            else:
-                                raw_data = bytes(ix.data)
-                                
-                            if len(raw_data) >= 8:
+                            raw_data = ix.data
+                            if isinstance(raw_data, str):
+                                raw_data = b58decode(raw_data.encode()) if BASE58_SUPPORTED else b""
+                            # Anchor discriminators are 8 bytes; shorter SPL tags slice to what exists
+                            if raw_data:
                                 method_id = raw_data[:8].hex()
-                            elif len(raw_data) >= 4:
-                                method_id = raw_data[:4].hex()
                         except Exception:
                             method_id = "ParseErr"
                 else:
@@ -179,6 +317,56 @@ class JitoTargetLockV11:
         
         return list(invoked_programs), method_id
 
+    def mark_processed(self, sig_str):
+        if len(self._sig_order) == PROCESSED_SIGS_SIZE:
+            self.processed_sigs.discard(self._sig_order[0])  # deque append drops it next
+        self._sig_order.append(sig_str)
+        self.processed_sigs.add(sig_str)
+
+    def cache_tx(self, sig_str, tx_value):
+        self.tx_cache[sig_str] = tx_value
+        self.tx_cache.move_to_end(sig_str)
+        if len(self.tx_cache) > TX_CACHE_SIZE:
+            self.tx_cache.popitem(last=False)
+
+    def get_tx(self, signature, sig_str=None):
+        """Fetch a transaction through the LRU cache. Not-found results are not cached (may be unindexed yet)."""
+        if sig_str is None:
+            sig_str = str(signature)
+        tx_value = self.tx_cache.get(sig_str)
+        if tx_value is not None:
+            self.tx_cache.move_to_end(sig_str)
+            return tx_value
+        RPC_BUCKET.take()
+        tx_value = self.client.get_transaction(signature, commitment="confirmed", max_supported_transaction_version=0).value
+        if tx_value:
+            self.cache_tx(sig_str, tx_value)
+        return tx_value
+
+    def leader_for_slot(self, slot):
+        leader_pub = self.slot_leaders.get(slot)
+        if leader_pub is None:
+            RPC_BUCKET.take()
+            leaders = self.client.get_slot_leaders(slot, LEADER_PREFETCH).value
+            for offset, pub in enumerate(leaders):
+                self.slot_leaders[slot + offset] = str(pub)
+            while len(self.slot_leaders) > LEADER_CACHE_SIZE:
+                self.slot_leaders.popitem(last=False)
+            leader_pub = self.slot_leaders.get(slot)
+        return leader_pub
+
+    def hub_for_leader(self, leader_pub):
+        hub_str = self.leader_hubs.get(leader_pub)
+        if hub_str is None:
+            leader_ip = self.cluster_map.get(leader_pub, None)
+            if not leader_ip:
+                return "Unmapped Node"  # not cached - may appear after a map refresh
+            city, country, lat, lon = self.get_geoip(leader_ip)
+            hub_str = f"{self.classify_hub(lat, lon)} ({country})"
+            if country != "??":
+                self.leader_hubs[leader_pub] = hub_str
+        return hub_str
+
     # --- MODE 3: PROFILER LOGIC ---
     def run_profiler(self, wallet_str):
         print(f"\n[*] PROFILING BOT: {wallet_str}")
@@ -188,25 +376,39 @@ class JitoTargetLockV11:
         stats = {"Total": 0, "Check/Bail": 0, "Trade/Success": 0, "Failures": 0}
         
         try:
+            RPC_BUCKET.take()
             response = self.client.get_signatures_for_address(target, limit=50)
             
             print(f"\n{'SIG (Last 8)':<12} | {'METHOD / STRATEGY':<30} | {'CU':<8} | {'RESULT'}")
             print("-" * 75)
 
-            for item in response.value:
+            # Fetch all uncached transactions in one batched round-trip
+            # Signatures are already parsed - base58-encode each one once for cache keys and the batch
+            items = response.value
+            sig_strs = [str(item.signature) for item in items]
+            missing = [sig for sig in sig_strs if sig not in self.tx_cache]
+            tx_config = {"encoding": "json", "maxSupportedTransactionVersion": 0}
+            raw_txs = rpc_batch([("getTransaction", [sig, tx_config]) for sig in missing]) if missing else []
+            for sig, raw_tx in zip(missing, raw_txs):
+                if raw_tx:
+                    self.cache_tx(sig, EncodedConfirmedTransactionWithStatusMeta.from_json(json.dumps(raw_tx)))
+
+            for item, sig in zip(items, sig_strs):
                 stats["Total"] += 1
-                sig = str(item.signature)
                 
-                # Fetch TX
-                tx = self.client.get_transaction(item.signature, max_supported_transaction_version=0)
-                if not tx.value: continue
+                tx_value = self.tx_cache.get(sig)
+                if not tx_value: continue
 
                 # Extract Data
                 cu = 0
-                if tx.value.transaction.meta and tx.value.transaction.meta.compute_units_consumed:
-                    cu = tx.value.transaction.meta.compute_units_consumed
+                if tx_value.transaction.meta and tx_value.transaction.meta.compute_units_consumed:
+                    cu = tx_value.transaction.meta.compute_units_consumed
                 
-                _, method_id = self.deep_decode(tx.value)
+                try:
+                    all_keys, instructions, _, _ = self.unpack_tx(tx_value)
+                    _, method_id = self.deep_decode(all_keys, instructions)
+                except Exception:
+                    method_id = "Error"
                 
                 # Classify
                 strategy = "Unknown"
@@ -224,7 +426,6 @@ class JitoTargetLockV11:
                     status = "PROFIT"
 
                 print(f"{sig[:8]}...   | {strategy:<30} | {cu:<8} | {status} (Method: {method_id})")
-                time.sleep(0.1)
 
             print("\n--- INTELLIGENCE REPORT ---")
             print(f"Target: {wallet_str}")
@@ -239,43 +440,71 @@ class JitoTargetLockV11:
         print(f"\n[*] Analyzing Transaction: {sig_str}")
         try:
             sig = Signature.from_string(sig_str)
-            tx = self.client.get_transaction(sig, max_supported_transaction_version=0)
-            if not tx.value:
+            tx_value = self.get_tx(sig, sig_str)
+            if not tx_value:
                 print("[!] Transaction too old or not found.")
                 return
 
-            self.print_analysis(tx.value, sig_str)
+            # A one-shot run has no later transaction to show the validator for - wait for the map
+            if not self._map_ready.is_set():
+                print("[*] Waiting for network map...")
+                self._map_ready.wait(MAP_WAIT_SECONDS)
+            self.print_analysis(tx_value, sig_str)
         except Exception as e:
             print(f"[!] Error: {e}")
 
     def run_wallet_monitor(self, wallet_str):
         print(f"\n[*] LOCKING ON WALLET: {wallet_str}")
         print("[*] Waiting for movement...")
-        target = Pubkey.from_string(wallet_str)
+        try:
+            if UVLOOP_SUPPORTED:
+                uvloop.install()
+            asyncio.run(self.stream_wallet(Pubkey.from_string(wallet_str)))
+        except KeyboardInterrupt:
+            return
+
+    async def stream_wallet(self, target):
+        """Push-based monitor: logsSubscribe on the wallet instead of polling getSignaturesForAddress"""
         while True:
             try:
-                response = self.client.get_signatures_for_address(target, limit=5)
-                new_items = []
-                for item in response.value:
-                    if str(item.signature) not in self.processed_sigs:
-                        self.processed_sigs.add(str(item.signature))
-                        new_items.append(item)
-                if len(self.processed_sigs) > 1000: self.processed_sigs.clear()
-                for item in reversed(new_items):
-                    tx = self.client.get_transaction(item.signature, max_supported_transaction_version=0)
-                    if tx.value:
-                        self.print_analysis(tx.value, str(item.signature))
-                    time.sleep(1) 
-                time.sleep(2) 
-            except KeyboardInterrupt:
-                return
+                async with connect(RPC_WSS_URL) as websocket:
+                    await websocket.logs_subscribe(
+                        filter_=RpcTransactionLogsFilterMentions(target),
+                        commitment="confirmed"
+                    )
+                    async for messages in websocket:
+                        for item in messages:
+                            if not isinstance(item, LogsNotification):
+                                continue  # subscription confirmation
+                            sig = item.result.value.signature
+                            sig_str = str(sig)
+                            if sig_str in self.processed_sigs:
+                                continue
+                            self.mark_processed(sig_str)
+                            # Blocking RPC + CSV work off the event loop, one tx at a time
+                            await asyncio.to_thread(self.analyze_pushed_tx, sig, sig_str)
             except Exception as e:
-                time.sleep(2)
+                print(f"[!] Stream error: {e} - reconnecting")
+                await asyncio.sleep(2)
+
+    def analyze_pushed_tx(self, sig, sig_str):
+        for attempt in range(MONITOR_TX_RETRIES):
+            tx_value = self.get_tx(sig, sig_str)
+            if tx_value:
+                self.print_analysis(tx_value, sig_str)
+                return
+            time.sleep(1)
 
     def print_analysis(self, tx_value, sig_str):
-        programs, method_id = self.deep_decode(tx_value)
+        # Keys/balances are shared by the decoder and the tip detector - unpack once
+        try:
+            all_keys, instructions, pre_balances, post_balances = self.unpack_tx(tx_value)
+            programs, method_id = self.deep_decode(all_keys, instructions)
+            is_jito, tip_amount = self.detect_jito_tip(all_keys, pre_balances, post_balances)
+        except Exception as e:
+            programs, method_id = [f"Decode Error: {e}"], "Error"
+            is_jito, tip_amount = False, 0.0
         prog_str = ", ".join(programs)
-        is_jito, tip_amount = self.detect_jito_tip(tx_value)
         jito_str = f"{tip_amount:.5f} SOL" if is_jito else "NO"
 
         logs = tx_value.transaction.meta.log_messages
@@ -287,18 +516,15 @@ class JitoTargetLockV11:
 
         slot = tx_value.slot
         hub_str = "Unknown"
-        try:
-            leader_list = self.client.get_slot_leaders(slot, 1).value
-            if leader_list:
-                leader_pub = str(leader_list[0])
-                leader_ip = self.cluster_map.get(leader_pub, None)
-                if leader_ip:
-                    city, country, lat, lon = self.get_geoip(leader_ip)
-                    hub_str = f"{self.classify_hub(lat, lon)} ({country})"
-                else:
-                    hub_str = "Unmapped Node"
-        except:
-            pass
+        if not self._map_ready.is_set():
+            hub_str = "Map loading"  # the monitor doesn't block on the first cluster refresh
+        else:
+            try:
+                leader_pub = self.leader_for_slot(slot)
+                if leader_pub:
+                    hub_str = self.hub_for_leader(leader_pub)
+            except:
+                pass
 
         print("-" * 60)
         print(f"Signature: {sig_str}")
@@ -309,7 +535,12 @@ class JitoTargetLockV11:
         print(f"VALIDATOR: {hub_str}")
         print("-" * 60)
         self.writer.writerow([datetime.now().strftime("%H:%M:%S"), "Target", prog_str, method_id, full_log, jito_str, hub_str, sig_str])
-        self.csv_file.flush()
+        self._rows_since_flush += 1
+        now = time.time()
+        if self._rows_since_flush >= CSV_FLUSH_ROWS or now - self._last_flush > CSV_FLUSH_SECONDS:
+            self.csv_file.flush()
+            self._rows_since_flush = 0
+            self._last_flush = now
 
 if __name__ == "__main__":
     lock = JitoTargetLockV11()
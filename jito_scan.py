@@ -1,17 +1,38 @@
 import asyncio
-import json
 import csv
-import math
+import functools
 import requests
 import os
+import random
+import sqlite3
 import sys
+import numpy as np
+import time
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime
 from solana.rpc.websocket_api import connect
-from solana.rpc.api import Client
+from solana.rpc.async_api import AsyncClient
 from solders.pubkey import Pubkey
 from solders.rpc.config import RpcTransactionLogsFilterMentions
+from solders.rpc.responses import LogsNotification
+from websockets.exceptions import ConnectionClosed
 from dotenv import load_dotenv
 
+# Optional libuv-based event loop (not available on Windows - falls back to asyncio's default loop)
+try:
+    import uvloop
+    UVLOOP_SUPPORTED = True
+except ImportError:
+    UVLOOP_SUPPORTED = False
+
+# Optional async HTTP client for GeoIP lookups (falls back to requests on a worker thread)
+try:
+    import httpx
+    HTTPX_SUPPORTED = True
+except ImportError:
+    HTTPX_SUPPORTED = False
+
 load_dotenv()
 
 # --- CONFIGURATION ---
@@ -31,21 +52,137 @@ JITO_HUBS = {
     "Frankfurt (EU-Central)": (50.1109, 8.6821),
     "Salt Lake City (US-West)": (40.7608, -111.8910)
 }
+HUB_NAMES = list(JITO_HUBS.keys())
+_hub_coords = np.radians(np.array(list(JITO_HUBS.values()), dtype=np.float64))
+HUB_LAT_R, HUB_LON_R = _hub_coords[:, 0], _hub_coords[:, 1]
+HUB_COS_LAT = np.cos(HUB_LAT_R)
+
+GEOIP_BATCH_URL = "http://ip-api.com/batch"
+GEOIP_FIELDS = "status,lat,lon,city,countryCode,query"
+GEOIP_BATCH_SIZE = 100
+GEOIP_COALESCE_SECONDS = 0.05  # collect lookups for this long, then resolve them in one batch request
+UNKNOWN_GEO = ("Unknown", "??", 0, 0)
+
+# Geolocations persisted across restarts (ip-api allows 45 requests/min); set GATOR_GEO_CACHE="" to disable
+GEO_DISK_CACHE_PATH = os.path.expanduser(os.getenv("GATOR_GEO_CACHE", "~/.gator/geo_cache.sqlite"))
+GEO_DISK_CACHE_TTL = 86400
+
+# Validator map / leader location refresh period
+CLUSTER_REFRESH_SECONDS = 600
+
+# Cache bounds: IP geolocation rarely changes (kept as long as the disk cache keeps it, so
+# map refreshes do not re-query ip-api); slot leaders only matter while bundles for that slot arrive
+GEO_CACHE_SIZE, GEO_CACHE_TTL = 5000, GEO_DISK_CACHE_TTL
+LEADER_CACHE_SIZE, LEADER_CACHE_TTL = 2048, 60
+
+# Bundles waiting for analysis (the socket reader blocks when full) and the workers draining them
+BUNDLE_QUEUE_SIZE = 1024
+BUNDLE_WORKERS = 16
+BUNDLE_BATCH = 64  # max queued bundles a worker drains at once
+HTTP_FALLBACK_WORKERS = 32  # dedicated threads for blocking requests calls when httpx is missing
+
+# Retry delays (seconds) for a leader lookup that fails or comes back empty
+LEADER_RETRY_DELAYS = (0.1, 0.2, 0.4, 0.8)
+
+# Print a dot per raw packet (noisy; off by default - a packets/s line is printed instead)
+DEBUG_DOTS = os.getenv("JITO_DEBUG_DOTS") == "1"
+
+# WebSocket tuning (passed through to websockets): 4 MB frames so log bursts are never
+# rejected, a deeper frame queue, keepalive pings, and no per-frame deflate CPU cost
+WS_BACKOFF_MAX = 30  # seconds, cap on the reconnect backoff (plus up to 1s jitter)
+WS_CONNECT_KWARGS = dict(max_size=2**22, max_queue=1024, ping_interval=20, ping_timeout=20, compression=None)
 
 # We watch the main Tip Account
 TARGET_ACCOUNT = "96gYZGLnJYVFmbjzopPSU6QiEV5fGqZNyN9nmNhvrZU5"
 
+class TTLCache:
+    """LRU cache whose entries expire ttl seconds after insertion"""
+
+    def __init__(self, maxsize, ttl):
+        self.maxsize = maxsize
+        self.ttl = ttl
+        self._data = OrderedDict()
+
+    def get(self, key):
+        entry = self._data.get(key)
+        if entry is None:
+            return None
+        value, stored_at = entry
+        if time.monotonic() - stored_at > self.ttl:
+            del self._data[key]
+            return None
+        self._data.move_to_end(key)
+        return value
+
+    def put(self, key, value):
+        self._data[key] = (value, time.monotonic())
+        self._data.move_to_end(key)
+        while len(self._data) > self.maxsize:
+            self._data.popitem(last=False)
+
+
+class DiskGeoCache:
+    """SQLite-backed ip -> (city, country, lat, lon) store with per-entry timestamps"""
+
+    def __init__(self, path):
+        self._conn = None
+        if not path:
+            return
+        try:
+            os.makedirs(os.path.dirname(path) or ".", exist_ok=True)
+            self._conn = sqlite3.connect(path)
+            self._conn.execute("CREATE TABLE IF NOT EXISTS geo (ip TEXT PRIMARY KEY, city TEXT, country TEXT, "
+                               "lat REAL, lon REAL, stored_at REAL NOT NULL)")
+            self._conn.commit()
+        except (OSError, sqlite3.Error) as e:
+            print(f"[!] GeoIP disk cache disabled: {e}")
+            self._conn = None
+
+    def load(self, max_age):
+        """Return all entries younger than max_age seconds"""
+        if self._conn is None:
+            return {}
+        try:
+            rows = self._conn.execute("SELECT ip, city, country, lat, lon FROM geo WHERE stored_at > ?",
+                                      (time.time() - max_age,))
+            return {ip: (city, country, lat, lon) for ip, city, country, lat, lon in rows}
+        except sqlite3.Error:
+            return {}
+
+    def put_many(self, items):
+        if self._conn is None or not items:
+            return
+        now = time.time()
+        try:
+            self._conn.executemany("INSERT OR REPLACE INTO geo VALUES (?, ?, ?, ?, ?, ?)",
+                                   [(ip, *val, now) for ip, val in items.items()])
+            self._conn.commit()
+        except sqlite3.Error:
+            pass
+
+
 class JitoHunterDebug:
     def __init__(self):
-        self.client = Client(RPC_HTTPS_URL)
+        self.client = None  # AsyncClient, created inside the event loop by run()
         self.cluster_map = {} 
-        self.geo_cache = {}   
-        print("[*] Initializing... Mapping Network Nodes (Please Wait)...")
-        self.refresh_cluster_nodes()
+        self.leader_info = {}  # leader pubkey -> (city, country, hub), precomputed per map refresh
+        self.geo_cache = TTLCache(GEO_CACHE_SIZE, GEO_CACHE_TTL)
+        self.leader_cache = TTLCache(LEADER_CACHE_SIZE, LEADER_CACHE_TTL)
+        # Seed from disk so a restart doesn't re-query every validator IP
+        self.geo_store = DiskGeoCache(GEO_DISK_CACHE_PATH)
+        for ip, val in self.geo_store.load(GEO_DISK_CACHE_TTL).items():
+            self.geo_cache.put(ip, val)
+        self.session = requests.Session()  # keep-alive fallback when httpx is missing
+        self._http = None  # httpx.AsyncClient, created inside the event loop by run()
+        self._connected = False  # set once the current socket is subscribed (resets reconnect backoff)
+        self._exec = None  # ThreadPoolExecutor for the requests fallback, created by run()
+        self._pkts = 0  # packets received since the last stats line
+        self._pending_geo = {}  # ip -> Future, waiting for the next batch flush
+        self._geo_wakeup = None  # asyncio.Event, created inside the event loop by run()
 
-    def refresh_cluster_nodes(self):
+    async def refresh_cluster_nodes(self):
         try:
-            nodes = self.client.get_cluster_nodes()
+            nodes = await self.client.get_cluster_nodes()
             count = 0
             for node in nodes.value:
                 ip_port = node.tpu if node.tpu else node.gossip
@@ -56,89 +193,263 @@ class JitoHunterDebug:
         except Exception as e:
             print(f"[!] Map update failed: {e}")
 
-    def get_geoip(self, ip):
-        if ip in self.geo_cache: return self.geo_cache[ip]
-        try:
-            r = requests.get(f"http://ip-api.com/json/{ip}?fields=lat,lon,city,countryCode", timeout=2)
-            if r.status_code == 200:
-                data = r.json()
-                val = (data.get('city', '?'), data.get('countryCode', '?'), data.get('lat', 0), data.get('lon', 0))
-                self.geo_cache[ip] = val
-                return val
-        except:
-            pass
-        return ("Unknown", "??", 0, 0)
+    def build_leader_info(self):
+        """Precompute location + hub for every mapped validator whose IP is already geolocated"""
+        leader_info = {}
+        for pubkey, ip in self.cluster_map.items():
+            geo = self.geo_cache.get(ip)
+            if geo is not None:
+                city, country, lat, lon = geo
+                leader_info[pubkey] = (city, country, self.classify_hub(lat, lon))
+        self.leader_info = leader_info
+        print(f"[*] Located {len(leader_info)} validators.")
+
+    async def refresh_locations(self):
+        await self.refresh_cluster_nodes()
+        await self.warm_geo_cache()
+        self.build_leader_info()
+
+    async def refresh_loop(self):
+        while True:
+            await asyncio.sleep(CLUSTER_REFRESH_SECONDS)
+            await self.refresh_locations()
+
+    async def http_request(self, method, url, **kwargs):
+        """Send over the shared async client, or the keep-alive requests session off the event loop"""
+        if self._http is not None:
+            return await self._http.request(method, url, timeout=kwargs.pop("timeout", 2), **kwargs)
+        call = functools.partial(self.session.request, method, url, timeout=kwargs.pop("timeout", 2), **kwargs)
+        return await asyncio.get_running_loop().run_in_executor(self._exec, call)
+
+    async def geo_batch(self, ips):
+        """Resolve up to GEOIP_BATCH_SIZE IPs in one ip-api /batch request; caches and returns the successes"""
+        r = await self.http_request("POST", GEOIP_BATCH_URL, params={"fields": GEOIP_FIELDS},
+                                    json=[{"query": ip} for ip in ips], timeout=10)
+        found = {}
+        if r.status_code == 200:
+            for data in r.json():
+                if data.get("status") == "success":
+                    val = (data.get('city', '?'), data.get('countryCode', '?'), data.get('lat', 0), data.get('lon', 0))
+                    self.geo_cache.put(data["query"], val)
+                    found[data["query"]] = val
+        # Only successes are persisted - failed lookups are retried next time
+        self.geo_store.put_many(found)
+        return found
+
+    async def warm_geo_cache(self):
+        """Resolve all mapped validator IPs up front (100 IPs per request)"""
+        new_ips = [ip for ip in set(self.cluster_map.values()) if self.geo_cache.get(ip) is None]
+        for start in range(0, len(new_ips), GEOIP_BATCH_SIZE):
+            try:
+                if not await self.geo_batch(new_ips[start:start + GEOIP_BATCH_SIZE]):
+                    break  # rate limited - the rest resolve on demand
+            except Exception:
+                break
+
+    async def geo_flusher(self):
+        """Resolve lookups queued within a GEOIP_COALESCE_SECONDS window with one batch request"""
+        while True:
+            await self._geo_wakeup.wait()
+            await asyncio.sleep(GEOIP_COALESCE_SECONDS)
+            self._geo_wakeup.clear()
+            pending, self._pending_geo = self._pending_geo, {}
+            ips = list(pending)
+            for start in range(0, len(ips), GEOIP_BATCH_SIZE):
+                chunk = ips[start:start + GEOIP_BATCH_SIZE]
+                try:
+                    found = await self.geo_batch(chunk)
+                except Exception:
+                    found = {}
+                for ip in chunk:
+                    if not pending[ip].done():
+                        pending[ip].set_result(found.get(ip, UNKNOWN_GEO))
+
+    def geoip_cached(self, ip):
+        """Synchronous cache-hit path - no coroutine or event-loop trip when the IP is known"""
+        return self.geo_cache.get(ip)
+
+    async def get_geoip(self, ip):
+        cached = self.geo_cache.get(ip)
+        if cached is not None: return cached
+        # Join the pending batch (one request for every IP looked up in this window)
+        fut = self._pending_geo.get(ip)
+        if fut is None:
+            fut = asyncio.get_running_loop().create_future()
+            self._pending_geo[ip] = fut
+            self._geo_wakeup.set()
+        return await asyncio.shield(fut)
 
     def classify_hub(self, lat, lon):
         if lat == 0 and lon == 0: return "Unknown"
-        best_hub = "Unknown"
-        min_dist = float('inf')
-        for hub_name, (h_lat, h_lon) in JITO_HUBS.items():
-            dist = math.sqrt((lat - h_lat)**2 + (lon - h_lon)**2)
-            if dist < min_dist:
-                min_dist = dist
-                best_hub = hub_name
-        return best_hub
+        # Haversine term a grows monotonically with great-circle distance - argmin on it directly
+        lat_r, lon_r = np.radians(lat), np.radians(lon)
+        a = np.sin((HUB_LAT_R - lat_r) / 2)**2 + np.cos(lat_r) * HUB_COS_LAT * np.sin((HUB_LON_R - lon_r) / 2)**2
+        return HUB_NAMES[int(a.argmin())]
 
     async def run(self):
+        # RPC calls are awaited so a leader lookup never blocks the socket reader
+        self.client = AsyncClient(RPC_HTTPS_URL)
+        if HTTPX_SUPPORTED:
+            self._http = httpx.AsyncClient(limits=httpx.Limits(max_connections=32))
+        else:
+            self._exec = ThreadPoolExecutor(max_workers=HTTP_FALLBACK_WORKERS)
+        self._geo_wakeup = asyncio.Event()
+        flusher = asyncio.create_task(self.geo_flusher())
+        refresher = None
+        try:
+            print("[*] Initializing... Mapping Network Nodes (Please Wait)...")
+            await self.refresh_locations()
+            refresher = asyncio.create_task(self.refresh_loop())
+            await self.stream()
+        finally:
+            flusher.cancel()
+            if refresher is not None:
+                refresher.cancel()
+            await self.client.close()
+            if self._http is not None:
+                await self._http.aclose()
+            if self._exec is not None:
+                self._exec.shutdown(wait=False)
+
+    async def stream(self):
         target = Pubkey.from_string(TARGET_ACCOUNT)
         print(f"[*] Connecting to Stream for Account: {TARGET_ACCOUNT[:8]}...")
         
-        async with connect(RPC_WSS_URL) as websocket:
+        # Fixed worker pool instead of a task per message - bounds memory and applies backpressure
+        self.queue = asyncio.Queue(maxsize=BUNDLE_QUEUE_SIZE)
+        workers = [asyncio.create_task(self.worker()) for _ in range(BUNDLE_WORKERS)]
+        stats = asyncio.create_task(self.report_stats())
+        try:
+            await self.read_stream(target)
+        finally:
+            for task in workers + [stats]:
+                task.cancel()
+
+    async def report_stats(self):
+        """Once a second, report packet throughput (replaces a flushed print per packet)"""
+        while True:
+            await asyncio.sleep(1)
+            if self._pkts:
+                print(f"[*] pkts/s={self._pkts}", flush=True)
+                self._pkts = 0
+
+    async def worker(self):
+        queue = self.queue
+        while True:
+            # Drain whatever else is already queued so a burst shares its leader lookups
+            batch = [await queue.get()]
+            while len(batch) < BUNDLE_BATCH:
+                try:
+                    batch.append(queue.get_nowait())
+                except asyncio.QueueEmpty:
+                    break
+            try:
+                failed = await self.prefetch_leaders({slot for _, slot in batch})
+                await asyncio.gather(*(self.process_bundle(sig, slot, failed) for sig, slot in batch))
+            finally:
+                for _ in batch:
+                    queue.task_done()
+
+    async def prefetch_leaders(self, slots):
+        """One concurrent leader lookup per uncached slot in a batch; returns the slots whose lookup failed"""
+        missing = [slot for slot in slots if self.leader_cache.get(slot) is None]
+        if not missing:
+            return set()
+        leaders = await asyncio.gather(*(self.lookup_leader(slot) for slot in missing))
+        failed = set()
+        for slot, leader_pub in zip(missing, leaders):
+            if leader_pub is not None:
+                self.leader_cache.put(slot, leader_pub)
+            else:
+                failed.add(slot)
+        return failed
+
+    async def read_stream(self, target):
+        # A dead socket raises on every recv() - reconnect with jittered exponential backoff instead of spinning
+        backoff = 1
+        while True:
+            try:
+                await self.read_connection(target)
+            except ConnectionClosed as e:
+                print(f"[!] Connection Closed: {e}")
+            except Exception as e:
+                print(f"[!] Socket Error: {e}")
+            else:
+                print("[!] Stream Ended")
+            if self._connected:
+                backoff = 1  # the connection was up - start over after it drops
+            delay = min(backoff, WS_BACKOFF_MAX) + random.random()
+            print(f"[*] Reconnecting in {delay:.1f}s...")
+            await asyncio.sleep(delay)
+            backoff = min(backoff * 2, WS_BACKOFF_MAX)  # used only if this next attempt fails too
+
+    async def read_connection(self, target):
+        self._connected = False
+        async with connect(RPC_WSS_URL, **WS_CONNECT_KWARGS) as websocket:
             await websocket.logs_subscribe(
                 filter_=RpcTransactionLogsFilterMentions(target),
                 commitment="confirmed"
             )
             print("[*] Connection Established. Waiting for data...")
+            self._connected = True
 
+            queue = self.queue
             while True:
-                # 1. Receive Raw Data
-                try:
-                    messages = await websocket.recv()
-                except Exception as e:
-                    print(f"[!] Socket Error: {e}")
-                    continue
+                # 1. Receive Raw Data (errors end this connection - read_stream reconnects)
+                messages = await websocket.recv()
 
                 # 2. Iterate (Handling the 'list' update from Solders)
+                self._pkts += len(messages)
                 for item in messages:
-                    # Print a 'dot' for every raw packet so you know it's alive
-                    print(".", end="", flush=True) 
+                    if DEBUG_DOTS:
+                        print(".", end="", flush=True)
                     
-                    try:
-                        # Convert to Dict
-                        if hasattr(item, 'to_json'):
-                            payload = json.loads(item.to_json())
-                        else:
-                            payload = item
-                        
-                        # Process
-                        if "method" in payload and "result" in payload["params"]:
-                             asyncio.create_task(self.process_bundle(payload["params"]["result"]))
-                    except Exception as e:
-                        print(f"\n[!] Parse Error: {e}")
-
-    async def process_bundle(self, data):
-        try:
-            # Add delay to let RPC index the block
-            await asyncio.sleep(2)
+                    # Read the typed solders fields directly - no to_json()/json.loads round-trip
+                    if isinstance(item, LogsNotification):
+                        result = item.result
+                        await queue.put((str(result.value.signature), result.context.slot))
 
-            sig = data["value"]["signature"]
-            slot = data["context"]["slot"]
-            
+    async def lookup_leader(self, slot):
+        """Leader of a given slot (the schedule is known ahead - no need to wait for indexing); backs off on errors"""
+        error = None
+        for delay in LEADER_RETRY_DELAYS + (None,):
+            try:
+                leaders = (await self.client.get_slot_leaders(slot, 1)).value
+                if leaders:
+                    return str(leaders[0])
+            except Exception as e:
+                error = e
+            if delay is not None:
+                await asyncio.sleep(delay)
+        print(f"    [!] Leader Lookup Failed: {error or 'empty schedule'}")
+        return None
+
+    async def process_bundle(self, sig, slot, failed_slots=()):
+        try:
             # Print immediately that we found something
             print(f"\n[+] Analyzing Bundle: {sig[:8]}... (Slot {slot})")
 
             # 1. Get Leader
-            try:
-                leader_pub = str(self.client.get_slot_leader(slot=slot).value)
-            except Exception as e:
-                print(f"    [!] Leader Lookup Failed: {e}")
-                return
+            # Many bundles land in the same slot - look each leader up once
+            leader_pub = self.leader_cache.get(slot)
+            if leader_pub is None:
+                if slot in failed_slots:
+                    return  # the batch prefetch already retried (and reported) this slot
+                leader_pub = await self.lookup_leader(slot)
+                if leader_pub is None:
+                    return
+                self.leader_cache.put(slot, leader_pub)
 
-            # 2. Geolocate
-            leader_ip = self.cluster_map.get(leader_pub, None)
-            if leader_ip:
-                city, country, lat, lon = self.get_geoip(leader_ip)
+            # 2. Geolocate (steady state: a dict lookup into the precomputed table)
+            info = self.leader_info.get(leader_pub)
+            if info:
+                city, country, hub = info
+                print(f"    -> Location: {city}, {country} ({hub})")
+            elif (leader_ip := self.cluster_map.get(leader_pub)):
+                geo = self.geoip_cached(leader_ip)
+                if geo is None:
+                    geo = await self.get_geoip(leader_ip)
+                city, country, lat, lon = geo
                 hub = self.classify_hub(lat, lon)
                 print(f"    -> Location: {city}, {country} ({hub})")
             else:
@@ -149,6 +460,8 @@ class JitoHunterDebug:
 
 if __name__ == "__main__":
     hunter = JitoHunterDebug()
+    if UVLOOP_SUPPORTED:
+        uvloop.install()
     try:
         asyncio.run(hunter.run())
     except KeyboardInterrupt:
@@ -7,6 +7,14 @@ import uvicorn
 import sys
 import os
 
+# Auto-reload is for development only (GATOR_DEV=1 or --reload). One worker by
+# default: stalker connections and watch state live in-process, so with several
+# workers each one holds its own subscriptions and clients only see wallets watched
+# through their own worker. GATOR_WORKERS opts into more (stateless API use only).
+# uvicorn's "auto" loop/http settings pick uvloop and httptools when installed.
+DEV_MODE = os.getenv("GATOR_DEV") == "1" or "--reload" in sys.argv[1:]
+WORKERS = 1 if DEV_MODE else int(os.getenv("GATOR_WORKERS", "1"))
+
 if __name__ == "__main__":
     print("=" * 60)
     print("Gator OSINT Backend Server")
@@ -14,6 +22,7 @@ if __name__ == "__main__":
     print("\nStarting server...")
     print("Frontend will be available at: http://localhost:8000")
     print("API docs will be available at: http://localhost:8000/docs")
+    print(f"Mode: {'development (auto-reload)' if DEV_MODE else f'production ({WORKERS} workers)'}")
     print("\nPress Ctrl+C to stop the server\n")
     
     try:
@@ -21,7 +30,10 @@ if __name__ == "__main__":
             "backend_api:app",
             host="0.0.0.0",
             port=8000,
-            reload=True,  # Auto-reload on code changes
+            reload=DEV_MODE,  # Auto-reload on code changes
+            workers=WORKERS,
+            loop="auto",
+            http="auto",
             log_level="info"
         )
     except KeyboardInterrupt:
@@ -22,16 +22,35 @@
 import sys
 import os
 import argparse
+import threading
+import time
 import requests
+from requests.adapters import HTTPAdapter
 import pandas as pd
 import matplotlib.pyplot as plt
 import matplotlib.patches as mpatches
+from matplotlib.collections import LineCollection, PatchCollection
 import numpy as np
-from datetime import datetime, timezone
+from datetime import datetime
 from dataclasses import dataclass, field
+from concurrent.futures import ThreadPoolExecutor
+from functools import lru_cache
 from typing import Optional, List, Dict, Tuple
 from dotenv import load_dotenv
 
+# Optional JIT compilation for numeric kernels
+try:
+    from numba import njit
+    NUMBA_SUPPORTED = True
+except ImportError:
+    NUMBA_SUPPORTED = False
+
+    def njit(*args, **kwargs):
+        """No-op stand-in for numba.njit when numba is not installed"""
+        if len(args) == 1 and callable(args[0]) and not kwargs:
+            return args[0]
+        return lambda func: func
+
 # Load environment variables from .env file
 load_dotenv()
 
@@ -140,8 +159,69 @@ class WalletConnection:
     tx_hashes: List[str] = field(default_factory=list)
 
 
-def api_call(chain: str, params: dict):
-    """Make API call - uses V2 API for all chains"""
+# Sized for concurrent API requests from the backend's worker threads
+API_POOL_SIZE = 32
+
+
+def create_api_session(pool_size: int = API_POOL_SIZE) -> requests.Session:
+    """Create a pooled keep-alive session for explorer API calls"""
+    session = requests.Session()
+    adapter = HTTPAdapter(pool_connections=pool_size, pool_maxsize=pool_size)
+    session.mount("https://", adapter)
+    session.mount("http://", adapter)
+    return session
+
+
+# Shared across all API calls so TCP/TLS connections are reused
+API_SESSION = create_api_session()
+
+# Wallets fetched concurrently by find_connections (api_call enforces the rate limit)
+CONNECT_MAX_WORKERS = 4
+
+# Etherscan free tier allows 5 calls/s per key; shared by every thread calling api_call
+API_CALLS_PER_SECOND = float(os.getenv("ETHERSCAN_CALLS_PER_SECOND", "5"))
+
+# Retries when the explorer still answers "Max calls per sec rate limit reached"
+API_RATE_LIMIT_RETRIES = 3
+
+
+class TokenBucket:
+    """Thread-safe token-bucket rate limiter"""
+    
+    def __init__(self, rate: float, burst: int):
+        self.rate = rate
+        self.capacity = burst
+        self._tokens = float(burst)
+        self._updated = time.monotonic()
+        self._lock = threading.Lock()
+    
+    def take(self):
+        """Block until a token is available, then consume it"""
+        while True:
+            with self._lock:
+                now = time.monotonic()
+                self._tokens = min(self.capacity, self._tokens + (now - self._updated) * self.rate)
+                self._updated = now
+                
+                if self._tokens >= 1:
+                    self._tokens -= 1
+                    return
+                wait = (1 - self._tokens) / self.rate
+            time.sleep(wait)
+
+
+# Burst of one: calls are spaced evenly, so no one-second window goes over the limit
+_api_bucket = TokenBucket(API_CALLS_PER_SECOND, 1)
+
+# Connection maps with this many edges or more skip per-edge tx count labels
+EDGE_LABEL_LIMIT = 30
+
+# Connection maps with more edges than this are saved at 100 dpi instead of 150
+SAVE_LOW_DPI_EDGES = 100
+
+
+def api_call(chain: str, params: dict, verbose: bool = True):
+    """Make API call - uses V2 API for all chains (verbose=False drops the [DEBUG] trace)"""
     
     # Get chainid for the chain
     chainid = CHAIN_IDS.get(chain, 1)
@@ -150,18 +230,27 @@ def api_call(chain: str, params: dict):
     params["chainid"] = chainid
     
     try:
-        response = requests.get(api_url, params=params, timeout=30)
-        data = response.json()
+        for attempt in range(API_RATE_LIMIT_RETRIES + 1):
+            _api_bucket.take()
+            response = API_SESSION.get(api_url, params=params, timeout=30)
+            data = response.json()
+            # A rate-limited reply is status 0 like an empty result - retry instead of returning []
+            if "rate limit" not in str(data.get("result", "")).lower() or attempt == API_RATE_LIMIT_RETRIES:
+                break
+            if verbose:
+                print(f"[DEBUG] Rate limited - retrying ({attempt + 1}/{API_RATE_LIMIT_RETRIES})")
+            time.sleep(1)
         
         # Debug: Print API response for troubleshooting
-        print(f"[DEBUG] Chain: {chain} (chainid: {chainid})")
-        print(f"[DEBUG] API URL: {api_url}")
-        print(f"[DEBUG] Status: {data.get('status')}, Message: {data.get('message')}")
-        if isinstance(data.get('result'), list):
-            print(f"[DEBUG] Result count: {len(data.get('result', []))}")
-        elif isinstance(data.get('result'), str):
-            result_str = str(data.get('result'))
-            print(f"[DEBUG] Result: {result_str[:150]}")
+        if verbose:
+            print(f"[DEBUG] Chain: {chain} (chainid: {chainid})")
+            print(f"[DEBUG] API URL: {api_url}")
+            print(f"[DEBUG] Status: {data.get('status')}, Message: {data.get('message')}")
+            if isinstance(data.get('result'), list):
+                print(f"[DEBUG] Result count: {len(data.get('result', []))}")
+            elif isinstance(data.get('result'), str):
+                result_str = str(data.get('result'))
+                print(f"[DEBUG] Result: {result_str[:150]}")
         
         status = data.get("status")
         result = data.get("result")
@@ -170,11 +259,13 @@ def api_call(chain: str, params: dict):
         if status == "1":
             # Success - return the result
             if isinstance(result, str) and result == "0":
-                print("[DEBUG] API returned string '0' - treating as empty")
+                if verbose:
+                    print("[DEBUG] API returned string '0' - treating as empty")
                 return []
             if isinstance(result, list):
                 return result
-            print(f"[DEBUG] Unexpected result type: {type(result)}")
+            if verbose:
+                print(f"[DEBUG] Unexpected result type: {type(result)}")
             return []
         elif status == "0":
             # Status 0 means error or no results
@@ -198,15 +289,18 @@ def api_call(chain: str, params: dict):
                 print(f"[!] ")
                 return []
             elif "no transactions found" in message.lower():
-                print("[DEBUG] No transactions found (valid empty result)")
+                if verbose:
+                    print("[DEBUG] No transactions found (valid empty result)")
                 return []
             elif "not found" in message.lower() or "invalid" in message.lower():
                 print(f"[!] API Error: {message}")
                 return []
             else:
-                print(f"[DEBUG] Status 0: {message}")
+                if verbose:
+                    print(f"[DEBUG] Status 0: {message}")
                 return []
-        print(f"[DEBUG] Unexpected API response status: {status}")
+        if verbose:
+            print(f"[DEBUG] Unexpected API response status: {status}")
         return []
     except Exception as e:
         print(f"\n[!] Request failed: {str(e)}")
@@ -215,23 +309,24 @@ def api_call(chain: str, params: dict):
         return []
 
 
-def fetch_transactions(address: str, chain: str = "ethereum", limit: int = 100):
+def fetch_transactions(address: str, chain: str = "ethereum", limit: int = 100, verbose: bool = True):
     params = {
         "module": "account", "action": "txlist", "address": address,
         "startblock": 0, "endblock": 99999999, "page": 1, "offset": limit, "sort": "desc"
     }
-    return api_call(chain, params) or []
+    return api_call(chain, params, verbose) or []
 
 
-def fetch_token_transfers(address: str, chain: str = "ethereum", limit: int = 100):
+def fetch_token_transfers(address: str, chain: str = "ethereum", limit: int = 100, verbose: bool = True):
     """Fetch ERC20 token transfers for an address"""
     params = {
         "module": "account", "action": "tokentx", "address": address,
         "startblock": 0, "endblock": 99999999, "page": 1, "offset": limit, "sort": "desc"
     }
-    return api_call(chain, params) or []
+    return api_call(chain, params, verbose) or []
 
 
+@lru_cache(maxsize=4096)
 def get_label(address: str) -> str:
     return KNOWN_LABELS.get(address.lower(), address[:8] + "..." + address[-4:])
 
@@ -245,6 +340,16 @@ def classify_gas(gas: int) -> dict:
     else: return {"type": "Complex/Mixer", "complexity": "heavy"}
 
 
+# Gas tier upper bounds (inclusive) and per-tier colors
+GAS_THRESHOLDS = np.array([65000, 150000, 300000])
+GAS_COLORS = np.array(['#22c55e', '#eab308', '#f97316', '#ef4444'])
+
+
+def gas_colors(gas: np.ndarray) -> list:
+    """Vectorized get_gas_color over an array of gas values"""
+    return GAS_COLORS[np.searchsorted(GAS_THRESHOLDS, gas, side='left')].tolist()
+
+
 def get_gas_color(gas: int) -> str:
     if gas <= 65000: return '#22c55e'
     elif gas <= 150000: return '#eab308'
@@ -259,18 +364,24 @@ def get_gas_label(gas: float) -> str:
     else: return 'Heavy'
 
 
-def analyze_wallet(address: str, chain: str = "ethereum", limit: int = 100) -> Tuple[pd.DataFrame, List[dict]]:
-    """Analyze wallet and return (DataFrame, tx_details_list) for reaction speed analysis"""
-    print(f"\n[*] Fetching {limit} transactions on {chain.upper()}...")
-    txs = fetch_transactions(address, chain, limit)
+def analyze_wallet(address: str, chain: str = "ethereum", limit: int = 100, verbose: bool = True) -> Tuple[pd.DataFrame, List[dict]]:
+    """
+    Analyze wallet and return (DataFrame, tx_details_list) for reaction speed analysis.
+    verbose=False silences the progress output (for concurrent calls that print their own summary).
+    """
+    if verbose:
+        print(f"\n[*] Fetching {limit} transactions on {chain.upper()}...")
+    txs = fetch_transactions(address, chain, limit, verbose)
     
     # Also fetch token transfers
-    print(f"[*] Fetching token transfers...")
-    token_txs = fetch_token_transfers(address, chain, limit)
+    if verbose:
+        print(f"[*] Fetching token transfers...")
+    token_txs = fetch_token_transfers(address, chain, limit, verbose)
     
     if (not txs or len(txs) == 0) and (not token_txs or len(token_txs) == 0):
-        print("[!] No transactions or token transfers found for this address")
-        print(f"[!] Check the address on https://etherscan.io/address/{address}")
+        if verbose:
+            print("[!] No transactions or token transfers found for this address")
+            print(f"[!] Check the address on https://etherscan.io/address/{address}")
         return pd.DataFrame(), []
     
     # Merge and sort all transactions by timestamp
@@ -287,19 +398,37 @@ def analyze_wallet(address: str, chain: str = "ethereum", limit: int = 100) -> T
     # Sort by timestamp (DESCENDING - most recent first, matches Solana behavior)
     all_txs.sort(key=lambda x: int(x.get("timeStamp", 0)), reverse=True)
     
-    print(f"[+] Found {len(all_txs)} total transactions ({len(txs) if txs else 0} regular, {len(token_txs) if token_txs else 0} token)\n")
+    if verbose:
+        print(f"[+] Found {len(all_txs)} total transactions ({len(txs) if txs else 0} regular, {len(token_txs) if token_txs else 0} token)\n")
+    
+    # Struct-of-arrays layout: fill preallocated columns by index, build the DataFrame once
+    n = len(all_txs)
+    address_lower = address.lower()
+    hashes = [None] * n
+    tx_types = [None] * n
+    tos = [None] * n
+    froms = [None] * n
+    timestamps = np.zeros(n, dtype=np.int64)
+    gas_used_col = np.zeros(n, dtype=np.int64)
+    gas_price_gwei = np.zeros(n, dtype=np.float64)
+    tx_fee_eth = np.zeros(n, dtype=np.float64)
+    value_eth = np.zeros(n, dtype=np.float64)
+    is_outgoing = np.zeros(n, dtype=bool)
+    is_contract = np.zeros(n, dtype=bool)
+    success = np.zeros(n, dtype=bool)
+    k = 0
     
-    transactions = []
     tx_details_list = []
     
+    progress_step = max(1, len(all_txs) // 50)  # Redraw the bar ~50 times, not per transaction
     for idx, tx in enumerate(all_txs):
-        bar = '#' * int((idx+1)/len(all_txs)*40) + '.' * (40-int((idx+1)/len(all_txs)*40))
-        print(f"\r    [{bar}] {idx+1}/{len(all_txs)}", end="", flush=True)
+        if verbose and ((idx+1) % progress_step == 0 or idx+1 == len(all_txs)):
+            bar = '#' * int((idx+1)/len(all_txs)*40) + '.' * (40-int((idx+1)/len(all_txs)*40))
+            print(f"\r    [{bar}] {idx+1}/{len(all_txs)}", end="", flush=True)
         
         try:
             timestamp = int(tx.get("timeStamp", 0))
             if not timestamp: continue
-            utc_time = datetime.fromtimestamp(timestamp, tz=timezone.utc)
             tx_type = tx.get("_type", "regular")
             
             if tx_type == "regular":
@@ -307,42 +436,30 @@ def analyze_wallet(address: str, chain: str = "ethereum", limit: int = 100) -> T
                 gas_price = int(tx.get("gasPrice", 0))
                 value = int(tx.get("value", 0))
                 
-                transactions.append({
-                    "hash": tx.get("hash", ""),
-                    "timestamp": utc_time,
-                    "hour": utc_time.hour,
-                    "day_of_week": utc_time.weekday(),
-                    "gas_used": gas_used,
-                    "gas_price_gwei": gas_price / 1e9,
-                    "tx_fee_eth": (gas_used * gas_price) / 1e18,
-                    "value_eth": value / 1e18,
-                    "is_outgoing": tx.get("from", "").lower() == address.lower(),
-                    "is_contract": tx.get("input", "0x") != "0x",
-                    "success": tx.get("isError", "0") == "0",
-                    "tx_type": classify_gas(gas_used)["type"],
-                    "to": tx.get("to", ""),
-                    "from": tx.get("from", ""),
-                })
+                gas_price_gwei[k] = gas_price / 1e9
+                tx_fee_eth[k] = (gas_used * gas_price) / 1e18
+                value_eth[k] = value / 1e18
+                is_contract[k] = tx.get("input", "0x") != "0x"
+                success[k] = tx.get("isError", "0") == "0"
+                tx_types[k] = classify_gas(gas_used)["type"]
             else:
                 # Token transfer - add to transactions for analysis
                 gas_used = 65000  # Typical ERC20 transfer gas
                 
-                transactions.append({
-                    "hash": tx.get("hash", ""),
-                    "timestamp": utc_time,
-                    "hour": utc_time.hour,
-                    "day_of_week": utc_time.weekday(),
-                    "gas_used": gas_used,
-                    "gas_price_gwei": 0,
-                    "tx_fee_eth": 0,
-                    "value_eth": 0,
-                    "is_outgoing": tx.get("from", "").lower() == address.lower(),
-                    "is_contract": True,
-                    "success": True,
-                    "tx_type": "ERC20 Transfer",
-                    "to": tx.get("to", ""),
-                    "from": tx.get("from", ""),
-                })
+                gas_price_gwei[k] = 0
+                tx_fee_eth[k] = 0
+                value_eth[k] = 0
+                is_contract[k] = True
+                success[k] = True
+                tx_types[k] = "ERC20 Transfer"
+            
+            hashes[k] = tx.get("hash", "")
+            timestamps[k] = timestamp
+            gas_used_col[k] = gas_used
+            is_outgoing[k] = tx.get("from", "").lower() == address_lower
+            tos[k] = tx.get("to", "")
+            froms[k] = tx.get("from", "")
+            k += 1
             
             # Store raw tx data for reaction speed analysis
             tx_details_list.append({
@@ -351,8 +468,32 @@ def analyze_wallet(address: str, chain: str = "ethereum", limit: int = 100) -> T
             })
         except: continue
     
-    print(f"\n[+] Analyzed {len(transactions)} transactions\n")
-    return pd.DataFrame(transactions), tx_details_list
+    if verbose:
+        print(f"\n[+] Analyzed {k} transactions\n")
+    
+    if k == 0:
+        return pd.DataFrame(), tx_details_list
+    
+    utc_times = pd.to_datetime(timestamps[:k], unit="s", utc=True)
+    
+    df = pd.DataFrame({
+        "hash": hashes[:k],
+        "timestamp": utc_times,
+        "hour": utc_times.hour,
+        "day_of_week": utc_times.dayofweek,
+        "gas_used": gas_used_col[:k],
+        "gas_price_gwei": gas_price_gwei[:k],
+        "tx_fee_eth": tx_fee_eth[:k],
+        "value_eth": value_eth[:k],
+        "is_outgoing": is_outgoing[:k],
+        "is_contract": is_contract[:k],
+        "success": success[:k],
+        "tx_type": tx_types[:k],
+        "to": tos[:k],
+        "from": froms[:k],
+    })
+    
+    return df, tx_details_list
 
 
 def has_token_receive(tx_details: dict, wallet: str) -> bool:
@@ -428,55 +569,25 @@ def analyze_reaction_speed(wallet: str, tx_details_list: list) -> ReactionSpeedA
     # Sort by timestamp (oldest first)
     transactions = sorted(tx_details_list, key=lambda x: x["timestamp"])
     
-    reaction_times = []
-    instant_count = 0
-    fast_count = 0
-    human_count = 0
-    
     total_transactions = len(transactions)
     
-    # Look for receive -> action patterns (not necessarily consecutive)
-    # For each receive, find the next action within 1 hour
-    for i in range(total_transactions):
-        # Show progress
-        if i % 20 == 0 or i == total_transactions - 1:
-            progress = (i + 1) / total_transactions
-            bar_len = 30
-            filled = int(bar_len * progress)
-            bar = '#' * filled + '.' * (bar_len - filled)
-            print(f"\r    [{bar}] {i + 1}/{total_transactions}", end="", flush=True)
-        
-        current_tx = transactions[i]
-        current_has_receive = has_token_receive(current_tx["details"], wallet)
-        
-        # If this is a receive, look for the next action
-        if current_has_receive:
-            # Look ahead for the next action within 1 hour (3600 seconds)
-            for j in range(i + 1, total_transactions):
-                next_tx = transactions[j]
-                
-                # Calculate time delta in seconds
-                time_delta = next_tx["timestamp"] - current_tx["timestamp"]
-                
-                # Only consider actions within 1 hour for reaction speed analysis
-                if time_delta > 3600:
-                    break  # Too far apart, stop looking
-                
-                next_has_action = has_token_action(next_tx["details"], wallet)
-                
-                if next_has_action:
-                    reaction_times.append(time_delta)
-                    
-                    if time_delta < 5:
-                        instant_count += 1
-                    elif time_delta < 30:
-                        fast_count += 1
-                    else:
-                        human_count += 1
-                    
-                    break  # Found an action, move to next receive
-    
-    print()  # New line after progress bar
+    # Classify every transaction once instead of re-checking actions inside the look-ahead
+    timestamps = np.fromiter((tx["timestamp"] for tx in transactions), dtype=np.int64, count=total_transactions)
+    recv = np.fromiter((has_token_receive(tx["details"], wallet) for tx in transactions), dtype=bool, count=total_transactions)
+    act = np.fromiter((has_token_action(tx["details"], wallet) for tx in transactions), dtype=bool, count=total_transactions)
+    print(f"\r    [{'#' * 30}] {total_transactions}/{total_transactions}")
+    
+    # For each receive, the next action is the first action index after it;
+    # it counts as a reaction if it happens within 1 hour (3600 seconds)
+    receive_idx = np.flatnonzero(recv)
+    action_idx = np.flatnonzero(act)
+    next_pos = np.searchsorted(action_idx, receive_idx, side='right')
+    has_next = next_pos < len(action_idx)
+    receive_idx = receive_idx[has_next]
+    next_action = action_idx[next_pos[has_next]]
+    
+    deltas = timestamps[next_action] - timestamps[receive_idx]
+    reaction_times = deltas[deltas <= 3600]
     
     # Calculate metrics
     total_reactions = len(reaction_times)
@@ -484,9 +595,13 @@ def analyze_reaction_speed(wallet: str, tx_details_list: list) -> ReactionSpeedA
     if total_reactions == 0:
         return ReactionSpeedAnalysis()
     
-    avg_reaction = sum(reaction_times) / total_reactions
-    median_reaction = sorted(reaction_times)[total_reactions // 2] if total_reactions > 0 else 0
-    fastest_reaction = min(reaction_times) if reaction_times else 0
+    instant_count = int(np.count_nonzero(reaction_times < 5))
+    fast_count = int(np.count_nonzero((reaction_times >= 5) & (reaction_times < 30)))
+    human_count = total_reactions - instant_count - fast_count
+    
+    avg_reaction = float(reaction_times.mean())
+    median_reaction = float(np.median(reaction_times))  # same definition as the Solana analysis
+    fastest_reaction = float(reaction_times.min())
     
     # Bot confidence calculation
     instant_ratio = instant_count / total_reactions
@@ -522,63 +637,90 @@ def analyze_reaction_speed(wallet: str, tx_details_list: list) -> ReactionSpeedA
 
 
 def detect_sleep_window(hourly_counts: list) -> SleepWindow:
-    min_sum, sleep_start = float('inf'), 0
-    total_tx = sum(hourly_counts)
-    for i in range(24):
-        window_sum = sum(hourly_counts[(i + j) % 24] for j in range(6))
-        if window_sum < min_sum:
-            min_sum, sleep_start = window_sum, i
+    # 6-hour window sums for every start hour (wrapping midnight) in one convolution
+    hourly = np.asarray(hourly_counts, dtype=np.int64)
+    windows = np.convolve(np.concatenate([hourly, hourly[:5]]), np.ones(6, dtype=np.int64), mode='valid')
+    sleep_start = int(windows.argmin())
+    min_sum = int(windows[sleep_start])
+    total_tx = int(hourly.sum())
     confidence = max(0, min(100, (1 - (min_sum / total_tx if total_tx else 0) * 4) * 100))
     return SleepWindow(sleep_start, (sleep_start + 6) % 24, min_sum, confidence)
 
 
-def calculate_probabilities(df: pd.DataFrame, hourly_counts: list, daily_counts: list, sleep: SleepWindow, reaction: ReactionSpeedAnalysis) -> ProfileProbabilities:
-    probs = ProfileProbabilities()
-    total_tx = len(df)
-    if total_tx == 0: return probs
-    
-    outgoing = df[df["is_outgoing"] == True]
-    hourly_std = np.std(hourly_counts)
-    hourly_range = max(hourly_counts) - min(hourly_counts)
+@njit(cache=True)
+def _calc_probs_core(hourly: np.ndarray, daily: np.ndarray, sleep_activity: float, sleep_confidence: float,
+                     sleep_start: int, reaction_bot: float, out_gas: np.ndarray, out_value: np.ndarray,
+                     out_success: np.ndarray, total_tx: int) -> tuple:
+    """
+    Numeric core of calculate_probabilities (JIT-compiled when numba is available).
+    Takes outgoing-tx columns as arrays; returns raw
+    (bot, mev_bot, privacy_user, eu, us, asia, retail, professional, whale, degen) scores.
+    """
+    hourly_range = hourly.max() - hourly.min()
     
     # Bot detection - combine sleep pattern and reaction speed
-    sleep_bot_score = 0
-    if hourly_range < 3: sleep_bot_score = 90
-    elif hourly_range < 5: sleep_bot_score = 65
-    elif sleep.activity_during_sleep > total_tx * 0.2: sleep_bot_score = 55
-    else: sleep_bot_score = max(0, 25 - sleep.confidence * 0.25)
-    
-    # Combine sleep pattern and reaction speed bot scores
-    probs.bot = max(sleep_bot_score, reaction.bot_confidence)
+    if hourly_range < 3: sleep_bot_score = 90.0
+    elif hourly_range < 5: sleep_bot_score = 65.0
+    elif sleep_activity > total_tx * 0.2: sleep_bot_score = 55.0
+    else: sleep_bot_score = max(0.0, 25.0 - sleep_confidence * 0.25)
+    bot = max(sleep_bot_score, reaction_bot)
     
     # MEV/Privacy
-    if len(outgoing) > 0:
-        high_gas = (outgoing["gas_used"] > 300000).sum() / len(outgoing)
-        if probs.bot > 60 and high_gas > 0.5: probs.mev_bot = 80
-        mixer = (outgoing["gas_used"] > 1000000).sum() / len(outgoing)
-        if mixer > 0.2: probs.privacy_user = 70
+    n_out = len(out_gas)
+    mev_bot = privacy_user = 0.0
+    if n_out > 0:
+        high_gas = np.count_nonzero(out_gas > 300000) / n_out
+        if bot > 60 and high_gas > 0.5: mev_bot = 80.0
+        mixer = np.count_nonzero(out_gas > 1000000) / n_out
+        if mixer > 0.2: privacy_user = 70.0
     
     # Geographic
-    s = sleep.start_hour
-    if 20 <= s or s <= 2: probs.eu_trader = 85
-    elif 3 <= s <= 8: probs.us_trader = 85
-    elif 12 <= s <= 18: probs.asia_trader = 85
-    else: probs.eu_trader = probs.us_trader = probs.asia_trader = 33
+    s = sleep_start
+    eu = us = asia = 0.0
+    if 20 <= s or s <= 2: eu = 85.0
+    elif 3 <= s <= 8: us = 85.0
+    elif 12 <= s <= 18: asia = 85.0
+    else: eu = us = asia = 33.0
     
     # Occupation
-    weekend = daily_counts[5] + daily_counts[6]
-    weekday = sum(daily_counts[:5])
-    ratio = (weekend/2) / (weekday/5) if weekday > 0 else 1
-    if ratio > 1.5: probs.retail_hobbyist, probs.professional = 80, 20
-    elif ratio < 0.5: probs.retail_hobbyist, probs.professional = 20, 80
-    else: probs.retail_hobbyist = probs.professional = 50
+    weekend = daily[5] + daily[6]
+    weekday = daily[:5].sum()
+    ratio = (weekend / 2) / (weekday / 5) if weekday > 0 else 1.0
+    if ratio > 1.5: retail, professional = 80.0, 20.0
+    elif ratio < 0.5: retail, professional = 20.0, 80.0
+    else: retail, professional = 50.0, 50.0
     
     # Whale/Degen
-    if len(outgoing) > 0:
-        if outgoing["value_eth"].max() > 10: probs.whale = 85
-        elif outgoing["value_eth"].mean() > 1: probs.whale = 60
-        fail_rate = (~outgoing["success"]).sum() / len(outgoing)
-        if fail_rate > 0.2: probs.degen = 80
+    whale = degen = 0.0
+    if n_out > 0:
+        if out_value.max() > 10: whale = 85.0
+        elif out_value.mean() > 1: whale = 60.0
+        fail_rate = np.count_nonzero(~out_success) / n_out
+        if fail_rate > 0.2: degen = 80.0
+    
+    return bot, mev_bot, privacy_user, eu, us, asia, retail, professional, whale, degen
+
+
+def calculate_probabilities(df: pd.DataFrame, hourly_counts: list, daily_counts: list, sleep: SleepWindow, reaction: ReactionSpeedAnalysis) -> ProfileProbabilities:
+    probs = ProfileProbabilities()
+    total_tx = len(df)
+    if total_tx == 0: return probs
+    
+    # Hand raw arrays to the numeric core
+    outgoing = df[df["is_outgoing"] == True]
+    (probs.bot, probs.mev_bot, probs.privacy_user, probs.eu_trader, probs.us_trader, probs.asia_trader,
+     probs.retail_hobbyist, probs.professional, probs.whale, probs.degen) = _calc_probs_core(
+        np.asarray(hourly_counts, dtype=np.float64),
+        np.asarray(daily_counts, dtype=np.float64),
+        float(sleep.activity_during_sleep),
+        float(sleep.confidence),
+        int(sleep.start_hour),
+        float(reaction.bot_confidence),
+        outgoing["gas_used"].to_numpy(dtype=np.int64),
+        outgoing["value_eth"].to_numpy(dtype=np.float64),
+        outgoing["success"].to_numpy(dtype=np.bool_),
+        total_tx,
+    )
     
     probs.normalize()
     return probs
@@ -632,11 +774,8 @@ def print_report(df, address, chain, probs, sleep, reaction: ReactionSpeedAnalys
 
 def visualize_profile(df, address, chain, probs, sleep, reaction: ReactionSpeedAnalysis):
     outgoing = df[df["is_outgoing"] == True]
-    hourly = [0]*24
-    daily = [0]*7
-    for _, r in outgoing.iterrows():
-        hourly[r["hour"]] += 1
-        daily[r["day_of_week"]] += 1
+    hourly = np.bincount(outgoing["hour"].to_numpy(dtype=np.int64), minlength=24)
+    daily = np.bincount(outgoing["day_of_week"].to_numpy(dtype=np.int64), minlength=7)
     
     plt.style.use('dark_background')
     fig = plt.figure(figsize=(16, 12))  # Increased size for reaction speed panel
@@ -700,7 +839,7 @@ def visualize_profile(df, address, chain, probs, sleep, reaction: ReactionSpeedA
     ax4 = fig.add_subplot(3, 2, 4)
     ax4.set_facecolor(panel_color)
     if len(outgoing) > 0:
-        colors_scatter = [get_gas_color(g) for g in outgoing["gas_used"]]
+        colors_scatter = gas_colors(outgoing["gas_used"].to_numpy())
         ax4.scatter(outgoing["hour"], outgoing["gas_used"], c=colors_scatter, alpha=0.7, s=30)
     ax4.set_title("GAS COMPLEXITY", color=accent_orange, fontsize=11, fontweight='bold', loc='left')
     ax4.set_xlabel("Hour (UTC)", color=text_color)
@@ -717,16 +856,16 @@ def visualize_profile(df, address, chain, probs, sleep, reaction: ReactionSpeedA
         counts = [reaction.instant_reactions, reaction.fast_reactions, reaction.human_reactions]
         bar_colors_react = [accent_red, accent_orange, accent_green]
         
-        bars = ax5.bar(categories, counts, color=bar_colors_react, alpha=0.7, edgecolor='white', linewidth=1)
+        ax5.bar(categories, counts, color=bar_colors_react, alpha=0.7, edgecolor='white', linewidth=1)
         
-        # Add counts on bars
-        max_count = max(counts) if counts else 1
-        for bar, count in zip(bars, counts):
+        # Add counts on bars - label positions for all bars at once (categorical bars sit at x = 0, 1, 2)
+        count_arr = np.asarray(counts, dtype=np.float64)
+        max_count = count_arr.max()
+        percentages = count_arr / reaction.total_reaction_pairs * 100
+        text_ys = count_arr + max_count * 0.05
+        for x, count, percentage, text_y in zip(range(len(counts)), counts, percentages, text_ys):
             if count > 0:
-                percentage = (count / reaction.total_reaction_pairs) * 100
-                text_y = bar.get_height() + max_count * 0.05
-                ax5.text(bar.get_x() + bar.get_width()/2, text_y,
-                        f'{count}\n({percentage:.1f}%)', ha='center', va='bottom', 
+                ax5.text(x, text_y, f'{count}\n({percentage:.1f}%)', ha='center', va='bottom',
                         color='white', fontsize=10, fontweight='bold')
         
         # Add metrics text box
@@ -773,11 +912,19 @@ def visualize_profile(df, address, chain, probs, sleep, reaction: ReactionSpeedA
 
 def find_connections(addresses, chain, limit):
     print(f"\n[*] Analyzing {len(addresses)} wallets...")
+    
+    def fetch(addr):
+        df, _ = analyze_wallet(addr, chain, limit, verbose=False)  # Unpack tuple, ignore tx_details_list
+        return df
+    
+    # Wallet histories are independent - fetch them concurrently (quietly, so threads don't
+    # interleave progress output), then join pairwise
+    print(f"[-] Fetching transactions for {len(addresses)} wallets...")
     wallet_txs = {}
-    for addr in addresses:
-        print(f"[-] Fetching {get_label(addr)}...")
-        df, _ = analyze_wallet(addr, chain, limit)  # Unpack tuple, ignore tx_details_list
-        wallet_txs[addr] = df
+    with ThreadPoolExecutor(max_workers=max(1, min(CONNECT_MAX_WORKERS, len(addresses)))) as executor:
+        for addr, df in zip(addresses, executor.map(fetch, addresses)):
+            wallet_txs[addr] = df
+            print(f"    [+] {get_label(addr)}: {len(df)} transactions")
     
     connections = {}
     for i, a in enumerate(addresses):
@@ -829,18 +976,24 @@ def visualize_connections(connections, addresses):
     
     n = len(addresses)
     angles = np.linspace(0, 2*np.pi, n, endpoint=False)
-    pos = {a: (3*np.cos(angles[i]), 3*np.sin(angles[i])) for i, a in enumerate(addresses)}
-    
-    max_tx = max([c.tx_count for c in connections.values()]) if connections else 1
-    for (a, b), c in connections.items():
-        x1, y1 = pos[a]
-        x2, y2 = pos[b]
-        width = 1 + (c.tx_count / max_tx) * 4
-        ax.plot([x1, x2], [y1, y2], color='#06b6d4', linewidth=width, alpha=0.6)
-        ax.text((x1+x2)/2, (y1+y2)/2, str(c.tx_count), color='white', fontsize=8, ha='center')
-    
-    for a, (x, y) in pos.items():
-        ax.add_patch(plt.Circle((x, y), 0.3, color='#22c55e'))
+    coords = np.stack([3*np.cos(angles), 3*np.sin(angles)], axis=1)
+    addr_idx = {a: i for i, a in enumerate(addresses)}
+    
+    # One collection for all edges and one for all nodes instead of an artist each
+    if connections:
+        tx_counts = np.array([c.tx_count for c in connections.values()])
+        ia = np.fromiter((addr_idx[a] for a, _ in connections), dtype=np.intp, count=len(connections))
+        ib = np.fromiter((addr_idx[b] for _, b in connections), dtype=np.intp, count=len(connections))
+        segments = np.stack([coords[ia], coords[ib]], axis=1)
+        widths = 1 + (tx_counts / tx_counts.max()) * 4
+        # Rasterized on save: one bitmap instead of a vector path per edge
+        ax.add_collection(LineCollection(segments, linewidths=widths, colors='#06b6d4', alpha=0.6, rasterized=True))
+        if len(connections) < EDGE_LABEL_LIMIT:
+            for (mx, my), count in zip(segments.mean(axis=1), tx_counts):
+                ax.text(mx, my, str(count), color='white', fontsize=8, ha='center')
+    
+    ax.add_collection(PatchCollection([plt.Circle(xy, 0.3) for xy in coords], color='#22c55e', zorder=2))
+    for a, (x, y) in zip(addresses, coords):
         ax.text(x, y-0.6, get_label(a), color='white', fontsize=8, ha='center')
     
     ax.set_xlim(-5, 5)
@@ -879,10 +1032,8 @@ def main():
             print("[!] No data"); sys.exit(1)
         
         out = df[df["is_outgoing"]==True]
-        hourly, daily = [0]*24, [0]*7
-        for _, r in out.iterrows():
-            hourly[r["hour"]] += 1
-            daily[r["day_of_week"]] += 1
+        hourly = np.bincount(out["hour"].to_numpy(dtype=np.int64), minlength=24).tolist()
+        daily = np.bincount(out["day_of_week"].to_numpy(dtype=np.int64), minlength=7).tolist()
         
         sleep = detect_sleep_window(hourly)
         reaction = analyze_reaction_speed(args.address, tx_details_list)
@@ -902,7 +1053,7 @@ def main():
         
         if not args.no_plot and conns:
             fig = visualize_connections(conns, args.addresses)
-            if args.save: fig.savefig(args.save, dpi=150, facecolor='#0a0a0a')
+            if args.save: fig.savefig(args.save, dpi=100 if len(conns) > SAVE_LOW_DPI_EDGES else 150, facecolor='#0a0a0a')
             plt.show()
     
     else:
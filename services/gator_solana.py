@@ -25,19 +25,86 @@ import sys
 import os
 import argparse
 import requests
+from requests.adapters import HTTPAdapter
 import pandas as pd
 import matplotlib.pyplot as plt
 import matplotlib.patches as mpatches
+import matplotlib.colors as mcolors
+from matplotlib.collections import LineCollection, PatchCollection
 import numpy as np
 from datetime import datetime, timezone
 from dataclasses import dataclass, field
 from typing import Optional, List, Dict, Set, Tuple
-from collections import defaultdict
+from collections import defaultdict, OrderedDict
 import json
-from concurrent.futures import ThreadPoolExecutor, as_completed
+import sqlite3
+import struct
+import zlib
+import xml.etree.ElementTree as ET
+from concurrent.futures import ThreadPoolExecutor
+import queue
+import random
+import threading
 import time
+from heapq import nlargest
+from functools import lru_cache
+from operator import attrgetter, itemgetter
 from dotenv import load_dotenv
 
+# Optional JIT compilation for numeric kernels
+try:
+    from numba import njit
+    NUMBA_SUPPORTED = True
+except ImportError:
+    NUMBA_SUPPORTED = False
+
+    def njit(*args, **kwargs):
+        """No-op stand-in for numba.njit when numba is not installed"""
+        if len(args) == 1 and callable(args[0]) and not kwargs:
+            return args[0]
+        return lambda func: func
+
+# Base58 decoding for raw instruction data (Rust-backed based58 preferred)
+try:
+    from based58 import b58decode
+    BASE58_SUPPORTED = True
+except ImportError:
+    try:
+        from base58 import b58decode
+        BASE58_SUPPORTED = True
+    except ImportError:
+        BASE58_SUPPORTED = False
+
+# Optional fast JSON parsing for RPC responses
+try:
+    import orjson
+    ORJSON_SUPPORTED = True
+except ImportError:
+    ORJSON_SUPPORTED = False
+
+# Optional HTTP/2 transport for RPC calls (concurrent requests share one multiplexed connection)
+try:
+    import httpx
+    import h2  # noqa: F401 - httpx needs h2 for http2=True
+    HTTPX_SUPPORTED = True
+except ImportError:
+    HTTPX_SUPPORTED = False
+
+# Optional fast CSV writer
+try:
+    import pyarrow as pa
+    import pyarrow.csv as pacsv
+    PYARROW_SUPPORTED = True
+except ImportError:
+    PYARROW_SUPPORTED = False
+
+# Optional interactive HTML network view
+try:
+    from pyvis.network import Network
+    PYVIS_SUPPORTED = True
+except ImportError:
+    PYVIS_SUPPORTED = False
+
 # Load environment variables from .env file
 load_dotenv()
 
@@ -53,8 +120,59 @@ if not HELIUS_API_KEY:
     sys.exit(1)
 
 RPC_URL = f"https://mainnet.helius-rpc.com/?api-key={HELIUS_API_KEY}"
+HELIUS_API_URL = "https://api.helius.xyz/v0"
 DEFAULT_LIMIT = 100
 
+# Process-wide RPC rate limit (HTTP requests per second; bursts up to 2x)
+HELIUS_RPS = int(os.getenv("HELIUS_RPS", "10"))
+
+# Attempts per HTTP request; 429/5xx and network errors back off exponentially (capped, Retry-After honored)
+RPC_MAX_ATTEMPTS = 5
+RPC_MAX_BACKOFF = 30  # seconds
+RPC_RETRY_STATUSES = frozenset({429, 502, 503, 504})
+
+# Max transactions per Helius parsed-history page
+HELIUS_HISTORY_PAGE_SIZE = 100
+
+# Signature page size when streaming pages into transaction fetching
+SIGNATURE_PAGE_SIZE = 250
+
+# Seconds a blocked page hand-off waits before re-checking whether the consumer stopped
+PAGE_PUT_TIMEOUT = 0.5
+
+# Max requests per JSON-RPC batch POST
+RPC_BATCH_SIZE = 100
+
+# Max pubkeys per getMultipleAccounts call
+MULTIPLE_ACCOUNTS_SIZE = 100
+
+# Wallets analyzed concurrently per scan_network level
+SCAN_MAX_WORKERS = 16
+
+# Above this many wallets a matplotlib graph is unreadable - export GraphML instead
+LARGE_GRAPH_THRESHOLD = 200
+
+# Connection maps with this many edges or more skip per-edge tx count labels
+EDGE_LABEL_LIMIT = 30
+
+# Connection maps with more edges than this are saved at 100 dpi instead of 150
+SAVE_LOW_DPI_EDGES = 100
+
+# getTransaction config shared by single and batched fetches
+TX_FETCH_CONFIG = {"encoding": "jsonParsed", "maxSupportedTransactionVersion": 0}
+
+# RPC fetch memoization (transactions are immutable; signature lists go stale, so they expire)
+TX_CACHE_SIZE = 4096
+SIGNATURE_CACHE_SIZE = 1024
+SIGNATURE_CACHE_TTL = 60  # seconds
+
+# Persistent transaction cache (finalized transactions never change); set GATOR_TX_CACHE="" to disable
+TX_DISK_CACHE_PATH = os.path.expanduser(os.getenv("GATOR_TX_CACHE", "~/.gator/tx_cache.sqlite"))
+
+# Stop scanning a wallet pair once this many shared transactions are found
+# (the report only needs the strongest links, not exhaustive counts)
+FIND_CONNECTIONS_EARLY_EXIT = 20
+
 # Configure stdout encoding for Windows compatibility
 import sys
 import io
@@ -74,8 +192,10 @@ KNOWN_LABELS = {
     "ComputeBudget111111111111111111111111111111": "Compute Budget Program",
 }
 
+COMPUTE_BUDGET_PROGRAM = "ComputeBudget111111111111111111111111111111"
+
 # Jito tip accounts for private execution detection
-JITO_TIP_ACCOUNTS = [
+JITO_TIP_ACCOUNTS = frozenset({
     "96gYZGLnJYVFmbjzopPSU6QiEV5fGqZNyN9nmNhvrZU5",
     "HFqU5x63VTqvTsszeoPhtUYj9rdag4djXeFQiDmJzTMX",
     "Cw8CFyM9FkoPhlTnrKMhTHqXheqJZNs4Fl31iWBP6UBu",
@@ -83,7 +203,7 @@ JITO_TIP_ACCOUNTS = [
     "DttWaMuVvTiduZRNgLcGW9t66tePvm6znsc5tqQZFQk6",
     "3AVi9Tg9Uo68tJfuvoKvqKNWKkC5wPdSSdeBnIzKZ6jJ",
     "DoPtqvycNsD9nuNSqMZ5J1GzV91qfQ4t7x1qF4aPiPce",
-]
+})
 
 
 # ═══════════════════════════════════════════════════════════════════════════════
@@ -101,6 +221,7 @@ class ProfileProbabilities:
     professional: float = 0.0
     whale: float = 0.0
     degen: float = 0.0
+    compute_units_known: bool = True  # False in --fast/--enhanced runs: whale/degen are not scored
     
     def normalize(self):
         geo_total = self.eu_trader + self.us_trader + self.asia_trader
@@ -153,6 +274,199 @@ class ReactionSpeedAnalysis:
 # RPC FUNCTIONS
 # ═══════════════════════════════════════════════════════════════════════════════
 
+def loads_json(content: bytes):
+    """Parse a JSON payload, using orjson when available"""
+    return orjson.loads(content) if ORJSON_SUPPORTED else json.loads(content)
+
+
+def dumps_json(obj) -> bytes:
+    """Serialize to compact JSON bytes, using orjson when available"""
+    if ORJSON_SUPPORTED:
+        return orjson.dumps(obj)
+    return json.dumps(obj, separators=(",", ":")).encode()
+
+
+class FetchCache:
+    """Thread-safe LRU cache with optional TTL for RPC fetch results"""
+    
+    def __init__(self, maxsize: int, ttl: Optional[float] = None):
+        self.maxsize = maxsize
+        self.ttl = ttl
+        self._data: OrderedDict = OrderedDict()
+        self._lock = threading.Lock()
+    
+    def get(self, key):
+        with self._lock:
+            entry = self._data.get(key)
+            if entry is None:
+                return None
+            
+            value, stored_at = entry
+            if self.ttl is not None and time.monotonic() - stored_at > self.ttl:
+                del self._data[key]
+                return None
+            
+            self._data.move_to_end(key)
+            return value
+    
+    def put(self, key, value):
+        with self._lock:
+            self._data[key] = (value, time.monotonic())
+            self._data.move_to_end(key)
+            while len(self._data) > self.maxsize:
+                self._data.popitem(last=False)
+
+
+class TokenBucket:
+    """Thread-safe token-bucket rate limiter"""
+    
+    def __init__(self, rate: float, burst: int):
+        self.rate = rate
+        self.capacity = burst
+        self._tokens = float(burst)
+        self._updated = time.monotonic()
+        self._lock = threading.Lock()
+    
+    def take(self):
+        """Block until a token is available, then consume it"""
+        while True:
+            with self._lock:
+                now = time.monotonic()
+                self._tokens = min(self.capacity, self._tokens + (now - self._updated) * self.rate)
+                self._updated = now
+                
+                if self._tokens >= 1:
+                    self._tokens -= 1
+                    return
+                wait = (1 - self._tokens) / self.rate
+            time.sleep(wait)
+
+
+class DiskTxCache:
+    """SQLite-backed transaction store keyed by signature (zlib-compressed JSON values)"""
+    
+    def __init__(self, path: str):
+        self._lock = threading.Lock()
+        self._conn = None
+        if not path:
+            return
+        try:
+            os.makedirs(os.path.dirname(path) or ".", exist_ok=True)
+            self._conn = sqlite3.connect(path, check_same_thread=False)
+            self._conn.execute("CREATE TABLE IF NOT EXISTS tx (sig TEXT PRIMARY KEY, data BLOB NOT NULL)")
+            self._conn.commit()
+        except (OSError, sqlite3.Error) as e:
+            print(f"[!] Transaction disk cache disabled: {e}")
+            self._conn = None
+    
+    def get_many(self, signatures: List[str]) -> Dict[str, dict]:
+        if self._conn is None or not signatures:
+            return {}
+        
+        found = {}
+        with self._lock:
+            try:
+                # Stay well under SQLite's bound-parameter limit
+                for start in range(0, len(signatures), 500):
+                    chunk = signatures[start:start + 500]
+                    placeholders = ",".join("?" * len(chunk))
+                    rows = self._conn.execute(f"SELECT sig, data FROM tx WHERE sig IN ({placeholders})", chunk)
+                    for sig, data in rows:
+                        found[sig] = loads_json(zlib.decompress(data))
+            except (sqlite3.Error, zlib.error, ValueError):
+                pass
+        return found
+    
+    def put_many(self, items: Dict[str, dict]):
+        if self._conn is None or not items:
+            return
+        
+        rows = [(sig, zlib.compress(dumps_json(tx))) for sig, tx in items.items()]
+        with self._lock:
+            try:
+                self._conn.executemany("INSERT OR REPLACE INTO tx (sig, data) VALUES (?, ?)", rows)
+                self._conn.commit()
+            except sqlite3.Error:
+                pass
+
+
+def create_rpc_session(pool_size: int = 64) -> requests.Session:
+    """
+    Create a pooled keep-alive session for RPC calls.
+    Retries are handled by send_with_backoff, so the adapter does not retry on its own.
+    """
+    session = requests.Session()
+    adapter = HTTPAdapter(pool_connections=pool_size, pool_maxsize=pool_size, max_retries=0)
+    session.mount("https://", adapter)
+    session.mount("http://", adapter)
+    return session
+
+
+# Shared across all RPC calls so TCP/TLS connections are reused
+RPC_SESSION = create_rpc_session()
+
+# HTTP/2 client used instead of RPC_SESSION when httpx[http2] is installed
+RPC_HTTP2_CLIENT = httpx.Client(http2=True) if HTTPX_SUPPORTED else None
+
+# Only successful results are cached, so transient RPC failures are retried
+_transaction_cache = FetchCache(TX_CACHE_SIZE)
+_signature_cache = FetchCache(SIGNATURE_CACHE_SIZE, ttl=SIGNATURE_CACHE_TTL)
+_tx_disk_cache = DiskTxCache(TX_DISK_CACHE_PATH)
+
+# One bucket for every RPC POST (single or batch) made by this process
+_rpc_bucket = TokenBucket(max(1, HELIUS_RPS), max(1, HELIUS_RPS) * 2)
+
+
+JSON_HEADERS = {"Content-Type": "application/json"}
+
+# Transport errors worth retrying for either HTTP client
+RETRYABLE_ERRORS = (requests.exceptions.RequestException,) + ((httpx.HTTPError,) if HTTPX_SUPPORTED else ())
+
+
+def backoff_delay(attempt: int, retry_after: Optional[str] = None) -> float:
+    """Seconds to wait before the next attempt: Retry-After if given, else 2^attempt plus jitter"""
+    try:
+        if retry_after is not None:
+            return min(RPC_MAX_BACKOFF, max(0.0, float(retry_after)))
+    except ValueError:
+        pass
+    return min(RPC_MAX_BACKOFF, 2 ** attempt + random.random())
+
+
+def send_with_backoff(send):
+    """
+    Call send() (one rate-limited HTTP request) until it returns a non-retryable response.
+    Network errors and 429/5xx responses are retried up to RPC_MAX_ATTEMPTS times; the last error is raised.
+    """
+    for attempt in range(RPC_MAX_ATTEMPTS):
+        _rpc_bucket.take()
+        retry_after = None
+        try:
+            response = send()
+            if response.status_code not in RPC_RETRY_STATUSES:
+                return response
+            retry_after = response.headers.get("Retry-After")
+            error = RuntimeError(f"HTTP {response.status_code}")
+        except RETRYABLE_ERRORS as e:
+            error = e
+        
+        if attempt == RPC_MAX_ATTEMPTS - 1:
+            raise error
+        time.sleep(backoff_delay(attempt, retry_after))
+
+
+def post_rpc(payload, timeout: float) -> bytes:
+    """POST a JSON-RPC payload (rate-limited, with retries) and return the raw response body"""
+    body = dumps_json(payload)  # Serialized once, reused across retries
+    
+    if RPC_HTTP2_CLIENT is not None:
+        send = lambda: RPC_HTTP2_CLIENT.post(RPC_URL, content=body, headers=JSON_HEADERS, timeout=timeout)
+    else:
+        send = lambda: RPC_SESSION.post(RPC_URL, data=body, headers=JSON_HEADERS, timeout=timeout)
+    
+    return send_with_backoff(send).content
+
+
 def rpc_call(method: str, params: list) -> Optional[dict]:
     """Make an RPC call to Solana"""
     payload = {
@@ -163,8 +477,7 @@ def rpc_call(method: str, params: list) -> Optional[dict]:
     }
     
     try:
-        response = requests.post(RPC_URL, json=payload, timeout=30)
-        data = response.json()
+        data = loads_json(post_rpc(payload, timeout=30))
         
         if "error" in data:
             return None
@@ -174,57 +487,236 @@ def rpc_call(method: str, params: list) -> Optional[dict]:
         return None
 
 
+def rpc_batch_call(method: str, params_list: List[list]) -> List[Optional[dict]]:
+    """
+    Make a JSON-RPC batch call (array of requests per HTTP POST, chunked by RPC_BATCH_SIZE).
+    Returns results in the same order as params_list; failed entries are None.
+    Chunks the endpoint rejects as a batch fall back to parallel single calls.
+    """
+    results: List[Optional[dict]] = [None] * len(params_list)
+    
+    for start in range(0, len(params_list), RPC_BATCH_SIZE):
+        chunk = params_list[start:start + RPC_BATCH_SIZE]
+        payload = [
+            {"jsonrpc": "2.0", "id": start + i, "method": method, "params": params}
+            for i, params in enumerate(chunk)
+        ]
+        
+        try:
+            data = loads_json(post_rpc(payload, timeout=60))
+        except:
+            data = None
+        
+        if not isinstance(data, list):
+            # Batching not supported/allowed - fetch this chunk with single calls
+            with ThreadPoolExecutor(max_workers=10) as executor:
+                chunk_results = list(executor.map(lambda p: rpc_call(method, p), chunk))
+            results[start:start + len(chunk)] = chunk_results
+            continue
+        
+        for item in data:
+            idx = item.get("id") if isinstance(item, dict) else None
+            if isinstance(idx, int) and start <= idx < start + len(chunk) and "error" not in item:
+                results[idx] = item.get("result")
+    
+    return results
+
+
+# Signature string of a getSignaturesForAddress entry (C-level getter for map())
+get_signature = itemgetter("signature")
+
+
 def fetch_signatures(wallet: str, limit: int = 100) -> list:
     """Fetch transaction signatures for a wallet"""
+    cached = _signature_cache.get((wallet, limit))
+    if cached is not None:
+        return cached
+    
     result = rpc_call("getSignaturesForAddress", [wallet, {"limit": limit}])
+    if result:
+        _signature_cache.put((wallet, limit), result)
     return result if result else []
 
 
-def fetch_transaction(signature: str) -> Optional[dict]:
-    """Fetch full transaction details"""
-    return rpc_call("getTransaction", [signature, {"encoding": "jsonParsed", "maxSupportedTransactionVersion": 0}])
+def iter_signatures(wallet: str, total: int, page_size: int = SIGNATURE_PAGE_SIZE):
+    """Yield pages of a wallet's signatures (newest first), paginating with before=<signature>"""
+    before = None
+    remaining = total
+    
+    while remaining > 0:
+        config = {"limit": min(page_size, remaining)}
+        if before:
+            config["before"] = before
+        
+        page = rpc_call("getSignaturesForAddress", [wallet, config])
+        if not page:
+            return
+        
+        yield page
+        remaining -= len(page)
+        if len(page) < config["limit"]:
+            return
+        before = page[-1]["signature"]
 
 
-def fetch_transaction_worker(sig: str) -> tuple:
-    """Worker function to fetch a single transaction (for parallel execution)"""
+def fetch_signatures_and_transactions(wallet: str, limit: int = 100) -> Tuple[list, Dict[str, Optional[dict]]]:
+    """
+    Page through signatures on a producer thread while batch-fetching the transactions of
+    each finished page, so getSignaturesForAddress and getTransaction round trips overlap.
+    Signatures without a block time are dropped. Returns (signatures, tx_details_map).
+    """
+    pages = queue.Queue(maxsize=2)
+    stop = threading.Event()  # set when the consumer is done (or failed) - the producer gives up
+    
+    def put(item) -> bool:
+        while not stop.is_set():
+            try:
+                pages.put(item, timeout=PAGE_PUT_TIMEOUT)
+                return True
+            except queue.Full:
+                continue
+        return False
+    
+    def produce():
+        try:
+            for page in iter_signatures(wallet, limit):
+                if not put(page):
+                    return
+        finally:
+            put(None)
+    
+    producer = threading.Thread(target=produce, daemon=True)
+    producer.start()
+    
+    signatures = []
+    tx_details_map = {}
     try:
-        time.sleep(0.05)  # Small delay to avoid overwhelming the API
-        result = fetch_transaction(sig)
-        return (sig, result)
-    except Exception as e:
-        return (sig, None)
+        while True:
+            page = pages.get()
+            if page is None:
+                break
+            
+            page = [sig_info for sig_info in page if sig_info.get("blockTime")]
+            signatures.extend(page)
+            tx_details_map.update(fetch_transactions_parallel(list(map(get_signature, page))))
+    finally:
+        # Unblocks a producer waiting on the full queue if fetching raised
+        stop.set()
+    
+    producer.join()
+    return signatures, tx_details_map
 
 
-def fetch_transactions_parallel(signatures: List[str], max_workers: int = 10) -> Dict[str, Optional[dict]]:
+def fetch_funded_accounts(accounts: List[str]) -> Set[str]:
     """
-    Fetch multiple transactions in parallel using ThreadPoolExecutor.
-    More reliable than batch RPC calls for rate-limited endpoints.
-    Returns dict mapping signature -> transaction data
+    Return the accounts that exist on-chain with a non-zero balance.
+    One getMultipleAccounts lookup per MULTIPLE_ACCOUNTS_SIZE accounts, sent as a single batch;
+    dataSlice of length 0 skips the account data.
     """
-    results = {}
-    total_fetched = 0
-    
-    # Use ThreadPoolExecutor for parallel fetching with controlled concurrency
-    with ThreadPoolExecutor(max_workers=max_workers) as executor:
-        # Submit all tasks
-        future_to_sig = {executor.submit(fetch_transaction_worker, sig): sig for sig in signatures}
-        
-        # Process completed tasks
-        completed = 0
-        for future in as_completed(future_to_sig):
-            sig, result = future.result()
-            results[sig] = result
-            if result is not None:
-                total_fetched += 1
-            
-            completed += 1
-            if completed % 20 == 0:  # Progress update every 20 transactions
-                print(f"\r    [{completed}/{len(signatures)}] fetched...", end="", flush=True)
+    chunks = [accounts[i:i + MULTIPLE_ACCOUNTS_SIZE] for i in range(0, len(accounts), MULTIPLE_ACCOUNTS_SIZE)]
+    config = {"encoding": "base64", "dataSlice": {"offset": 0, "length": 0}}
+    results = rpc_batch_call("getMultipleAccounts", [[chunk, config] for chunk in chunks])
     
-    print(f"\r    [+] Successfully fetched {total_fetched}/{len(signatures)} transactions")
-    return results
+    funded = set()
+    for chunk, result in zip(chunks, results):
+        values = (result or {}).get("value") or []
+        funded.update(acc for acc, info in zip(chunk, values) if info and info.get("lamports", 0) > 0)
+    return funded
 
 
+def fetch_helius_parsed_history(wallet: str, limit: int = 100) -> list:
+    """
+    Fetch parsed transaction history from the Helius enhanced API.
+    Returns up to limit transactions (newest first), paginating with before=<signature>.
+    """
+    history = []
+    before = None
+    
+    while len(history) < limit:
+        params = {"api-key": HELIUS_API_KEY, "limit": min(HELIUS_HISTORY_PAGE_SIZE, limit - len(history))}
+        if before:
+            params["before"] = before
+        
+        url = f"{HELIUS_API_URL}/addresses/{wallet}/transactions"
+        try:
+            response = send_with_backoff(lambda: RPC_SESSION.get(url, params=params, timeout=30))
+            page = loads_json(response.content)
+        except:
+            break
+        
+        if not isinstance(page, list) or not page:
+            break
+        
+        history.extend(page)
+        before = page[-1].get("signature")
+        if not before or len(page) < params["limit"]:
+            break
+    
+    return history[:limit]
+
+
+def fetch_transaction(signature: str) -> Optional[dict]:
+    """Fetch full transaction details"""
+    cached = _transaction_cache.get(signature)
+    if cached is not None:
+        return cached
+    
+    cached = _tx_disk_cache.get_many([signature]).get(signature)
+    if cached is not None:
+        _transaction_cache.put(signature, cached)
+        return cached
+    
+    result = rpc_call("getTransaction", [signature, TX_FETCH_CONFIG])
+    if result is not None:
+        _transaction_cache.put(signature, result)
+        _tx_disk_cache.put_many({signature: result})
+    return result
+
+
+def fetch_transactions_batch(signatures: List[str], max_workers: int = 1) -> Dict[str, Optional[dict]]:
+    """
+    Fetch multiple transactions via JSON-RPC batch requests.
+    Uncached signatures are split into RPC_BATCH_SIZE chunks; max_workers chunks are POSTed concurrently.
+    Returns dict mapping signature -> transaction data
+    """
+    found = {sig: _transaction_cache.get(sig) for sig in signatures}
+    missing = [sig for sig, tx in found.items() if tx is None]
+    
+    # Finalized transactions from previous runs come from disk instead of the RPC
+    for sig, tx in _tx_disk_cache.get_many(missing).items():
+        found[sig] = tx
+        _transaction_cache.put(sig, tx)
+    missing = [sig for sig in missing if found[sig] is None]
+    chunks = [missing[i:i + RPC_BATCH_SIZE] for i in range(0, len(missing), RPC_BATCH_SIZE)]
+    
+    def fetch_chunk(chunk: List[str]) -> List[Optional[dict]]:
+        return rpc_batch_call("getTransaction", [[sig, TX_FETCH_CONFIG] for sig in chunk])
+    
+    fetched = {}
+    with ThreadPoolExecutor(max_workers=max(1, max_workers)) as executor:
+        for chunk, results in zip(chunks, executor.map(fetch_chunk, chunks)):
+            for sig, result in zip(chunk, results):
+                found[sig] = result
+                if result is not None:
+                    _transaction_cache.put(sig, result)
+                    fetched[sig] = result
+    _tx_disk_cache.put_many(fetched)
+    
+    total_fetched = sum(1 for tx in found.values() if tx is not None)
+    print(f"\r    [+] Successfully fetched {total_fetched}/{len(found)} transactions")
+    return found
+
+
+def fetch_transactions_parallel(signatures: List[str], max_workers: int = 3) -> Dict[str, Optional[dict]]:
+    """
+    Fetch multiple transactions as concurrent JSON-RPC batch chunks.
+    Parallelism is per chunk of RPC_BATCH_SIZE signatures, not per signature.
+    Returns dict mapping signature -> transaction data
+    """
+    return fetch_transactions_batch(signatures, max_workers=max_workers)
+
+
+@lru_cache(maxsize=4096)
 def get_label(address: str) -> str:
     """Get human-readable label for an address"""
     return KNOWN_LABELS.get(address, address[:8] + "..." + address[-4:])
@@ -234,6 +726,11 @@ def get_label(address: str) -> str:
 # MEMPOOL FORENSICS - Priority Fee & Execution Style Detection
 # ═══════════════════════════════════════════════════════════════════════════════
 
+# Little-endian compute-budget instruction arguments (u32 CU limit, u64 micro-lamport price)
+_U32 = struct.Struct('<I')
+_U64 = struct.Struct('<Q')
+
+
 def parse_compute_budget_instruction(instruction_data: bytes) -> dict:
     """
     Parse Compute Budget instruction to extract priority fee and compute unit limit.
@@ -251,13 +748,13 @@ def parse_compute_budget_instruction(instruction_data: bytes) -> dict:
             if discriminator == 2:  # SetComputeUnitLimit
                 # Next 4 bytes are u32 compute unit limit
                 if len(instruction_data) >= 5:
-                    cu_limit = int.from_bytes(instruction_data[1:5], byteorder='little')
+                    cu_limit = _U32.unpack_from(instruction_data, 1)[0]
                     return {"compute_unit_limit": cu_limit}
             
             elif discriminator == 3:  # SetComputeUnitPrice (priority fee)
                 # Next 8 bytes are u64 priority fee in microlamports
                 if len(instruction_data) >= 9:
-                    priority_fee = int.from_bytes(instruction_data[1:9], byteorder='little')
+                    priority_fee = _U64.unpack_from(instruction_data, 1)[0]
                     return {"priority_fee_microlamports": priority_fee}
     except:
         pass
@@ -265,9 +762,15 @@ def parse_compute_budget_instruction(instruction_data: bytes) -> dict:
     return None
 
 
-def detect_jito_tip(tx_details: dict) -> Tuple[bool, float]:
+def normalize_account_keys(msg: dict) -> List[str]:
+    """Return a message's account keys as plain address strings (handles dict and string forms)"""
+    return [key.get("pubkey", "") if isinstance(key, dict) else str(key) for key in msg.get("accountKeys", []) or []]
+
+
+def detect_jito_tip(tx_details: dict, accounts: Optional[List[str]] = None) -> Tuple[bool, float]:
     """
     Detect if transaction includes Jito tip (private execution indicator).
+    Pass pre-normalized account keys as accounts to avoid re-walking the message.
     Returns (has_jito_tip, tip_amount_sol).
     """
     if not tx_details or not tx_details.get("meta"):
@@ -275,20 +778,8 @@ def detect_jito_tip(tx_details: dict) -> Tuple[bool, float]:
     
     try:
         meta = tx_details["meta"]
-        msg = tx_details.get("transaction", {}).get("message", {})
-        
-        # Get all account keys
-        account_keys = msg.get("accountKeys", [])
-        if isinstance(account_keys, list) and len(account_keys) > 0:
-            # Handle both string and dict formats
-            accounts = []
-            for key in account_keys:
-                if isinstance(key, dict):
-                    accounts.append(key.get("pubkey", ""))
-                else:
-                    accounts.append(str(key))
-        else:
-            accounts = []
+        if accounts is None:
+            accounts = normalize_account_keys(tx_details.get("transaction", {}).get("message", {}))
         
         # Check pre/post balances for Jito tip accounts
         pre_balances = meta.get("preBalances", [])
@@ -326,18 +817,9 @@ def analyze_execution_profile(tx_details: dict) -> dict:
     try:
         msg = tx_details.get("transaction", {}).get("message", {})
         instructions = msg.get("instructions", [])
-        account_keys = msg.get("accountKeys", [])
-        
-        # Normalize account keys format
-        accounts = []
-        for key in account_keys:
-            if isinstance(key, dict):
-                accounts.append(key.get("pubkey", ""))
-            else:
-                accounts.append(str(key))
+        accounts = normalize_account_keys(msg)
         
         # Parse instructions for Compute Budget
-        compute_budget_program = "ComputeBudget111111111111111111111111111111"
         max_priority_fee = 0
         max_cu_limit = None
         
@@ -355,7 +837,7 @@ def analyze_execution_profile(tx_details: dict) -> dict:
                 else:
                     continue
                 
-                if program_id == compute_budget_program:
+                if program_id == COMPUTE_BUDGET_PROGRAM:
                     # Parse instruction data
                     ix_data = ix.get("data")
                     parsed_data = ix.get("parsed")
@@ -384,10 +866,9 @@ def analyze_execution_profile(tx_details: dict) -> dict:
                         if isinstance(ix_data, str):
                             try:
                                 # Try to decode as base58 (Solana standard)
-                                try:
-                                    import base58
-                                    data_bytes = base58.b58decode(ix_data)
-                                except ImportError:
+                                if BASE58_SUPPORTED:
+                                    data_bytes = b58decode(ix_data.encode())
+                                else:
                                     # Fallback: try hex if base58 not available
                                     data_bytes = bytes.fromhex(ix_data.replace("0x", ""))
                             except:
@@ -414,7 +895,7 @@ def analyze_execution_profile(tx_details: dict) -> dict:
                                         result["compute_unit_limit"] = max_cu_limit
         
         # Check for Jito tip
-        has_jito, jito_tip = detect_jito_tip(tx_details)
+        has_jito, jito_tip = detect_jito_tip(tx_details, accounts)
         result["has_jito_tip"] = has_jito
         result["jito_tip_sol"] = jito_tip
         
@@ -448,12 +929,43 @@ def analyze_execution_profile(tx_details: dict) -> dict:
     return result
 
 
+def needs_full_fetch(enhanced_tx: dict) -> bool:
+    """
+    Check whether a Helius parsed transaction could classify as anything but RETAIL.
+    Only transactions with a Compute Budget instruction or a Jito tip need the full getTransaction body.
+    """
+    for ix in enhanced_tx.get("instructions") or []:
+        if ix.get("programId") == COMPUTE_BUDGET_PROGRAM:
+            return True
+    
+    for transfer in enhanced_tx.get("nativeTransfers") or []:
+        if transfer.get("toUserAccount") in JITO_TIP_ACCOUNTS:
+            return True
+    
+    for account in enhanced_tx.get("accountData") or []:
+        if account.get("account") in JITO_TIP_ACCOUNTS and (account.get("nativeBalanceChange") or 0) > 0:
+            return True
+    
+    return False
+
+
 def analyze_wallet_execution_profiles(wallet: str, limit: int = 100) -> dict:
     """
     Analyze wallet's execution profiles across multiple transactions.
+    Parsed history is screened first so plain RETAIL transactions are counted without a
+    getTransaction call; falls back to fetching every signature if the history is unavailable.
     Returns JSON-serializable dict with aggregated execution profile statistics.
     """
-    signatures = fetch_signatures(wallet, limit)
+    profile_counts = {"RETAIL": 0, "URGENT_USER": 0, "PRO_TRADER": 0, "MEV_STYLE": 0}
+    
+    history = fetch_helius_parsed_history(wallet, limit)
+    if history:
+        signatures = [{"signature": tx["signature"]} for tx in history if tx.get("signature")]
+        to_fetch = [tx["signature"] for tx in history if tx.get("signature") and needs_full_fetch(tx)]
+        profile_counts["RETAIL"] = len(signatures) - len(to_fetch)
+    else:
+        signatures = fetch_signatures(wallet, limit)
+        to_fetch = list(map(get_signature, signatures))
     
     if not signatures:
         return {
@@ -463,17 +975,14 @@ def analyze_wallet_execution_profiles(wallet: str, limit: int = 100) -> dict:
             "aggregate_profile": "UNKNOWN"
         }
     
-    profile_counts = {"RETAIL": 0, "URGENT_USER": 0, "PRO_TRADER": 0, "MEV_STYLE": 0}
     total_priority_fee = 0
     total_jito_tips = 0.0
     jito_tip_count = 0
     
-    # Fetch all transactions in parallel
-    sig_strings = [sig_info["signature"] for sig_info in signatures]
-    tx_details_map = fetch_transactions_parallel(sig_strings, max_workers=10)
+    # Fetch only the transactions that need full details, in batched RPC requests
+    tx_details_map = fetch_transactions_parallel(to_fetch)
     
-    for sig_info in signatures:
-        signature = sig_info["signature"]
+    for signature in to_fetch:
         tx_details = tx_details_map.get(signature)
         
         if tx_details:
@@ -529,117 +1038,206 @@ def analyze_wallet_execution_profiles(wallet: str, limit: int = 100) -> dict:
 # PROFILE COMMAND - Single Wallet Analysis
 # ═══════════════════════════════════════════════════════════════════════════════
 
-def analyze_wallet(wallet: str, limit: int = 100) -> tuple:
-    """Fetch and analyze wallet transactions - returns (DataFrame, tx_details_list)"""
+def analyze_wallet(wallet: str, limit: int = 100, fast: bool = False, enhanced: bool = False) -> tuple:
+    """
+    Fetch and analyze wallet transactions - returns (DataFrame, tx_details_list).
+    In fast mode only signature-level data is used (no getTransaction calls), so
+    compute/fee columns are zero and tx_details_list is empty.
+    In enhanced mode history comes from Helius parsed pages (100 txs per request);
+    fees and instruction counts are filled, compute units are not available.
+    """
     print(f"\n[*] Fetching last {limit} transactions...")
     
-    signatures = fetch_signatures(wallet, limit)
+    enhanced_map = {}
+    if enhanced:
+        history = fetch_helius_parsed_history(wallet, limit)
+        enhanced_map = {tx["signature"]: tx for tx in history if tx.get("signature")}
+        signatures = [
+            {
+                "signature": tx["signature"],
+                "blockTime": tx.get("timestamp"),
+                "slot": tx.get("slot", 0),
+                "err": tx.get("transactionError")
+            }
+            for tx in enhanced_map.values()
+        ]
+    elif fast:
+        signatures = fetch_signatures(wallet, limit)
+    else:
+        # Signature pages stream into batched transaction fetches as they arrive
+        signatures, tx_details_map = fetch_signatures_and_transactions(wallet, limit)
     
     if not signatures:
         return pd.DataFrame(), []
     
     print(f"[+] Found {len(signatures)} transactions")
-    print(f"[-] Analyzing details...\n")
-    
-    # Extract signature strings for batch fetching
-    sig_strings = [sig_info["signature"] for sig_info in signatures]
     
-    # Fetch transactions in parallel (faster and more reliable)
-    print(f"    [*] Fetching {len(sig_strings)} transactions in parallel...")
-    tx_details_map = fetch_transactions_parallel(sig_strings, max_workers=10)
+    # Drop signatures without a block time - they would be skipped anyway (the streamed
+    # full-mode fetch has already dropped them; fast/enhanced signatures have not)
+    signatures = [sig_info for sig_info in signatures if sig_info.get("blockTime")]
     
-    # Check if batch fetch worked - if too many failures, warn user
-    valid_results = sum(1 for v in tx_details_map.values() if v is not None)
-    if valid_results < len(sig_strings) * 0.5:
-        print(f"    [!] Warning: Only {valid_results}/{len(sig_strings)} transactions fetched successfully")
-        print(f"    [!] Some data may be incomplete (RPC connection issues)")
+    if enhanced:
+        print(f"[-] Enhanced mode: using Helius parsed history\n")
+        tx_details_map = {}
+    elif fast:
+        print(f"[-] Fast mode: using signature data only (temporal metrics)\n")
+        tx_details_map = {}
+    else:
+        print(f"[-] Analyzing details...\n")
+        
+        # Check if batch fetch worked - if too many failures, warn user
+        valid_results = sum(1 for v in tx_details_map.values() if v is not None)
+        if valid_results < len(signatures) * 0.5:
+            print(f"    [!] Warning: Only {valid_results}/{len(signatures)} transactions fetched successfully")
+            print(f"    [!] Some data may be incomplete (RPC connection issues)")
     
     print()
     
-    transactions = []
+    # Struct-of-arrays layout: fill preallocated columns by index, build the DataFrame once
+    n = len(signatures)
+    sigs = [None] * n
+    block_times = np.zeros(n, dtype=np.int64)
+    slots = np.zeros(n, dtype=np.int64)
+    compute_units = np.zeros(n, dtype=np.int64)
+    fees = np.zeros(n, dtype=np.int64)
+    instructions = np.zeros(n, dtype=np.int64)
+    success = np.zeros(n, dtype=bool)
+    k = 0
+    
     tx_details_list = []
     
+    progress_step = max(1, len(signatures) // 50)  # Redraw the bar ~50 times, not per signature
     for idx, sig_info in enumerate(signatures):
-        progress = (idx + 1) / len(signatures)
-        bar_len = 40
-        filled = int(bar_len * progress)
-        bar = '█' * filled + '░' * (bar_len - filled)
-        print(f"\r    [{bar}] {idx + 1}/{len(signatures)}", end="", flush=True)
+        if (idx + 1) % progress_step == 0 or idx + 1 == len(signatures):
+            progress = (idx + 1) / len(signatures)
+            bar_len = 40
+            filled = int(bar_len * progress)
+            bar = '█' * filled + '░' * (bar_len - filled)
+            print(f"\r    [{bar}] {idx + 1}/{len(signatures)}", end="", flush=True)
         
         signature = sig_info["signature"]
-        block_time = sig_info.get("blockTime")
-        
-        if not block_time:
-            continue
+        block_time = sig_info["blockTime"]
         
         tx_details = tx_details_map.get(signature)
         
         # Skip if transaction details couldn't be fetched
-        if not tx_details:
+        if not tx_details and not (fast or enhanced):
             continue
         
-        compute_units = 0
-        fee = 0
-        instructions = 0
-        
-        if tx_details.get("meta"):
-            compute_units = tx_details["meta"].get("computeUnitsConsumed", 0) or 0
-            fee = tx_details["meta"].get("fee", 0) or 0
+        enhanced_tx = enhanced_map.get(signature)
+        if enhanced_tx:
+            fees[k] = enhanced_tx.get("fee", 0) or 0
+            instructions[k] = len(enhanced_tx.get("instructions") or [])
+        elif tx_details and tx_details.get("meta"):
+            compute_units[k] = tx_details["meta"].get("computeUnitsConsumed", 0) or 0
+            fees[k] = tx_details["meta"].get("fee", 0) or 0
             
             msg = tx_details.get("transaction", {}).get("message", {})
             if msg.get("instructions"):
-                instructions = len(msg["instructions"])
-        
-        utc_time = datetime.fromtimestamp(block_time, tz=timezone.utc)
-        
-        transactions.append({
-            "signature": signature,
-            "timestamp": utc_time,
-            "hour": utc_time.hour,
-            "day_of_week": utc_time.weekday(),
-            "day_name": utc_time.strftime("%A"),
-            "compute_units": compute_units,
-            "fee_lamports": fee,
-            "fee_sol": fee / 1e9,
-            "instructions": instructions,
-            "success": sig_info.get("err") is None,
-            "slot": sig_info.get("slot", 0),
-            "block_time": block_time
-        })
+                instructions[k] = len(msg["instructions"])
+        
+        sigs[k] = signature
+        block_times[k] = block_time
+        slots[k] = sig_info.get("slot", 0)
+        success[k] = sig_info.get("err") is None
+        k += 1
         
         # Store tx details for reaction speed analysis (only if valid)
-        tx_details_list.append({
-            "timestamp": block_time,
-            "details": tx_details
-        })
+        if tx_details:
+            tx_details_list.append({
+                "timestamp": block_time,
+                "details": tx_details
+            })
+    
+    print(f"\n[+] Analyzed {k} transactions\n")
+    
+    if k == 0:
+        return pd.DataFrame(), tx_details_list
     
-    print(f"\n[+] Analyzed {len(transactions)} transactions\n")
+    timestamps = pd.to_datetime(block_times[:k], unit="s", utc=True)
     
-    return pd.DataFrame(transactions), tx_details_list
+    df = pd.DataFrame({
+        "signature": sigs[:k],
+        "timestamp": timestamps,
+        "hour": timestamps.hour,
+        "day_of_week": timestamps.dayofweek,
+        "day_name": timestamps.day_name(),
+        "compute_units": compute_units[:k],
+        "fee_lamports": fees[:k],
+        "fee_sol": fees[:k] / 1e9,
+        "instructions": instructions[:k],
+        "success": success[:k],
+        "slot": slots[:k],
+        "block_time": block_times[:k]
+    })
+    
+    return df, tx_details_list
 
 
-def detect_sleep_window(hourly_counts: list) -> SleepWindow:
-    min_sum = float('inf')
+def int_column(df: pd.DataFrame, column: str) -> np.ndarray:
+    """Column as an int ndarray (drops NaNs if the frame was built with missing values)"""
+    values = df[column].to_numpy()
+    if values.dtype.kind not in "iu":
+        values = df[column].dropna().to_numpy().astype(np.int64)
+    return values
+
+
+def activity_histograms(df: pd.DataFrame) -> Tuple[list, list]:
+    """Hourly (24) and weekday (7) transaction counts, built with np.bincount"""
+    hourly_counts = np.bincount(int_column(df, "hour"), minlength=24).tolist()
+    daily_counts = np.bincount(int_column(df, "day_of_week"), minlength=7).tolist()
+    return hourly_counts, daily_counts
+
+
+@njit(cache=True)
+def _sleep_window_core(hourly: np.ndarray) -> tuple:
+    """
+    Numeric core of detect_sleep_window (JIT-compiled when numba is available).
+    Returns (start_hour, tx_count) of the quietest 6-hour window, wrapping midnight.
+    """
+    min_sum = -1
     sleep_start = 0
-    total_tx = sum(hourly_counts)
     
     for i in range(24):
-        window_sum = sum(hourly_counts[(i + j) % 24] for j in range(6))
-        if window_sum < min_sum:
+        window_sum = 0
+        for j in range(6):
+            window_sum += hourly[(i + j) % 24]
+        if min_sum < 0 or window_sum < min_sum:
             min_sum = window_sum
             sleep_start = i
     
+    return sleep_start, min_sum
+
+
+def detect_sleep_window(hourly_counts: list) -> SleepWindow:
+    hourly = np.asarray(hourly_counts, dtype=np.int64)
+    sleep_start, min_sum = _sleep_window_core(hourly)
+    total_tx = int(hourly.sum())
+    
     sleep_ratio = min_sum / total_tx if total_tx > 0 else 0
     confidence = max(0, min(100, (1 - sleep_ratio * 4) * 100))
     
     return SleepWindow(
-        start_hour=sleep_start,
-        end_hour=(sleep_start + 6) % 24,
-        activity_during_sleep=min_sum,
+        start_hour=int(sleep_start),
+        end_hour=(int(sleep_start) + 6) % 24,
+        activity_during_sleep=int(min_sum),
         confidence=confidence
     )
 
 
+@njit(cache=True)
+def _reaction_buckets_core(timestamps: np.ndarray, recv: np.ndarray, act: np.ndarray) -> tuple:
+    """
+    Numeric core of analyze_reaction_speed (JIT-compiled when numba is available).
+    Returns (reaction_times, instant_count, fast_count) for receive -> action pairs within 5 minutes.
+    """
+    deltas = np.diff(timestamps)
+    reaction_times = deltas[recv[:-1] & act[1:] & (deltas <= 300)]
+    instant_count = np.count_nonzero(reaction_times < 5)
+    fast_count = np.count_nonzero((reaction_times >= 5) & (reaction_times < 30))
+    return reaction_times, instant_count, fast_count
+
+
 def analyze_reaction_speed(wallet: str, tx_details_list: list) -> ReactionSpeedAnalysis:
     """
     Analyze reaction speed between token receives and subsequent actions.
@@ -653,46 +1251,15 @@ def analyze_reaction_speed(wallet: str, tx_details_list: list) -> ReactionSpeedA
     # Sort by timestamp (oldest first)
     transactions = sorted(tx_details_list, key=lambda x: x["timestamp"])
     
-    reaction_times = []
-    instant_count = 0
-    fast_count = 0
-    human_count = 0
-    
     total_pairs = len(transactions) - 1
     
-    # Analyze consecutive transactions for reaction patterns
-    for i in range(total_pairs):
-        # Show progress
-        if i % 10 == 0 or i == total_pairs - 1:
-            progress = (i + 1) / total_pairs
-            bar_len = 30
-            filled = int(bar_len * progress)
-            bar = '█' * filled + '░' * (bar_len - filled)
-            print(f"\r    [{bar}] {i + 1}/{total_pairs} pairs", end="", flush=True)
-        
-        current_tx = transactions[i]
-        next_tx = transactions[i + 1]
-        
-        # Calculate time delta in seconds
-        time_delta = next_tx["timestamp"] - current_tx["timestamp"]
-        
-        # Check if current transaction involves receiving tokens
-        # and next transaction involves sending/swapping
-        current_has_receive = has_token_receive(current_tx["details"], wallet)
-        next_has_action = has_token_action(next_tx["details"], wallet)
-        
-        # If pattern detected: receive -> action
-        if current_has_receive and next_has_action and time_delta <= 300:  # Within 5 minutes
-            reaction_times.append(time_delta)
-            
-            if time_delta < 5:
-                instant_count += 1
-            elif time_delta < 30:
-                fast_count += 1
-            else:
-                human_count += 1
+    # Classify every transaction once, then match receive -> action pairs with array masks
+    timestamps = np.fromiter((tx["timestamp"] for tx in transactions), dtype=np.int64, count=len(transactions))
+    recv = np.fromiter((has_token_receive(tx["details"], wallet) for tx in transactions), dtype=bool, count=len(transactions))
+    act = np.fromiter((has_token_action(tx["details"], wallet) for tx in transactions), dtype=bool, count=len(transactions))
     
-    print()  # New line after progress bar
+    reaction_times, instant_count, fast_count = _reaction_buckets_core(timestamps, recv, act)
+    print(f"\r    [{'█' * 30}] {total_pairs}/{total_pairs} pairs")
     
     # Calculate metrics
     total_reactions = len(reaction_times)
@@ -700,9 +1267,13 @@ def analyze_reaction_speed(wallet: str, tx_details_list: list) -> ReactionSpeedA
     if total_reactions == 0:
         return ReactionSpeedAnalysis()
     
-    avg_reaction = sum(reaction_times) / total_reactions
-    median_reaction = sorted(reaction_times)[total_reactions // 2] if total_reactions > 0 else 0
-    fastest_reaction = min(reaction_times) if reaction_times else 0
+    instant_count = int(instant_count)
+    fast_count = int(fast_count)
+    human_count = total_reactions - instant_count - fast_count
+    
+    avg_reaction = float(reaction_times.mean())
+    median_reaction = float(np.median(reaction_times))
+    fastest_reaction = float(reaction_times.min())
     
     # Bot confidence calculation
     instant_ratio = instant_count / total_reactions
@@ -737,46 +1308,39 @@ def analyze_reaction_speed(wallet: str, tx_details_list: list) -> ReactionSpeedA
     )
 
 
+def ui_amount(balance: dict) -> float:
+    """Token balance entry's uiAmount as parsed from JSON (already numeric); null counts as zero"""
+    value = (balance.get("uiTokenAmount") or {}).get("uiAmount")
+    return value if value is not None else 0.0
+
+
 def has_token_receive(tx_details: dict, wallet: str) -> bool:
     """Check if transaction involves receiving tokens"""
     if not tx_details or not tx_details.get("meta"):
         return False
     
     try:
+        meta = tx_details["meta"]
+        msg = (tx_details.get("transaction") or {}).get("message") or {}
+        
         # Check post token balances - if balance increased, tokens were received
-        post_balances = tx_details["meta"].get("postTokenBalances", [])
-        pre_balances = tx_details["meta"].get("preTokenBalances", [])
-        
-        # Create a map of pre-balances
-        pre_balance_map = {}
-        for balance in pre_balances:
-            owner = balance.get("owner")
-            if owner == wallet:
-                mint = balance.get("mint", "")
-                amount = float(balance.get("uiTokenAmount", {}).get("uiAmount", 0))
-                pre_balance_map[mint] = amount
-        
-        # Check if any post-balance increased
-        for balance in post_balances:
-            owner = balance.get("owner")
-            if owner == wallet:
-                mint = balance.get("mint", "")
-                post_amount = float(balance.get("uiTokenAmount", {}).get("uiAmount", 0))
-                pre_amount = pre_balance_map.get(mint, 0)
-                
-                if post_amount > pre_amount:
-                    return True
+        pre_balance_map = {
+            balance.get("mint", ""): ui_amount(balance)
+            for balance in meta.get("preTokenBalances") or []
+            if balance.get("owner") == wallet
+        }
+        if any(
+            balance.get("owner") == wallet and ui_amount(balance) > pre_balance_map.get(balance.get("mint", ""), 0.0)
+            for balance in meta.get("postTokenBalances") or []
+        ):
+            return True
         
         # Also check SOL balance increase
-        account_keys = tx_details.get("transaction", {}).get("message", {}).get("accountKeys", [])
-        pre_sol = tx_details["meta"].get("preBalances", [])
-        post_sol = tx_details["meta"].get("postBalances", [])
-        
-        for idx, key in enumerate(account_keys):
+        account_keys = msg.get("accountKeys") or []
+        for key, pre_sol, post_sol in zip(account_keys, meta.get("preBalances") or [], meta.get("postBalances") or []):
             addr = key.get("pubkey", "") if isinstance(key, dict) else str(key)
-            if addr == wallet and idx < len(pre_sol) and idx < len(post_sol):
-                if post_sol[idx] > pre_sol[idx]:
-                    return True
+            if addr == wallet and post_sol > pre_sol:
+                return True
         
     except Exception:
         pass
@@ -785,165 +1349,160 @@ def has_token_receive(tx_details: dict, wallet: str) -> bool:
 
 
 def has_token_action(tx_details: dict, wallet: str) -> bool:
-    """Check if transaction involves sending/swapping tokens"""
+    """
+    Check if transaction involves sending/swapping tokens.
+    Any transaction the wallet signed counts as an action, so token/SOL balance
+    decreases never change the result and are not inspected.
+    """
     if not tx_details or not tx_details.get("meta"):
         return False
     
     try:
-        # Check if wallet initiated the transaction (is signer)
-        account_keys = tx_details.get("transaction", {}).get("message", {}).get("accountKeys", [])
-        
-        for key in account_keys:
-            addr = key.get("pubkey", "") if isinstance(key, dict) else str(key)
-            is_signer = key.get("signer", False) if isinstance(key, dict) else False
-            
-            if addr == wallet and is_signer:
-                # Check if tokens were sent (balance decreased)
-                post_balances = tx_details["meta"].get("postTokenBalances", [])
-                pre_balances = tx_details["meta"].get("preTokenBalances", [])
-                
-                # Create a map of pre-balances
-                pre_balance_map = {}
-                for balance in pre_balances:
-                    owner = balance.get("owner")
-                    if owner == wallet:
-                        mint = balance.get("mint", "")
-                        amount = float(balance.get("uiTokenAmount", {}).get("uiAmount", 0))
-                        pre_balance_map[mint] = amount
-                
-                # Check if any balance decreased
-                for balance in post_balances:
-                    owner = balance.get("owner")
-                    if owner == wallet:
-                        mint = balance.get("mint", "")
-                        post_amount = float(balance.get("uiTokenAmount", {}).get("uiAmount", 0))
-                        pre_amount = pre_balance_map.get(mint, 0)
-                        
-                        if post_amount < pre_amount:
-                            return True
-                
-                # Also check SOL balance decrease (excluding fees)
-                pre_sol = tx_details["meta"].get("preBalances", [])
-                post_sol = tx_details["meta"].get("postBalances", [])
-                fee = tx_details["meta"].get("fee", 0)
-                
-                for idx, key2 in enumerate(account_keys):
-                    addr2 = key2.get("pubkey", "") if isinstance(key2, dict) else str(key2)
-                    if addr2 == wallet and idx < len(pre_sol) and idx < len(post_sol):
-                        balance_decrease = pre_sol[idx] - post_sol[idx]
-                        # If decrease is more than just the fee, tokens were sent
-                        if balance_decrease > fee * 1.5:  # 1.5x buffer
-                            return True
-                
-                return True  # Is signer, so some action was taken
-        
+        # Parse (address, is_signer) pairs once
+        account_keys = ((tx_details.get("transaction") or {}).get("message") or {}).get("accountKeys") or []
+        parsed_keys = [
+            (key.get("pubkey", ""), key.get("signer", False)) if isinstance(key, dict) else (str(key), False)
+            for key in account_keys
+        ]
+        return any(addr == wallet and is_signer for addr, is_signer in parsed_keys)
     except Exception:
         pass
     
     return False
 
 
-def calculate_probabilities(df: pd.DataFrame, hourly_counts: list, daily_counts: list, sleep: SleepWindow) -> ProfileProbabilities:
-    probs = ProfileProbabilities()
-    total_tx = len(df)
-    
-    if total_tx == 0:
-        return probs
-    
+@njit(cache=True)
+def _calc_probs_core(hourly_std: float, hourly_range: float, sleep_activity: float, sleep_confidence: float,
+                     sleep_start: int, weekend_tx: float, weekday_tx: float, avg_cu: float, avg_fee: float,
+                     fail_rate: float, high_cu_ratio: float, total_tx: int) -> tuple:
+    """
+    Numeric core of calculate_probabilities (JIT-compiled when numba is available).
+    Returns raw (bot, eu, us, asia, retail, professional, whale, degen) scores before normalization.
+    """
     # Bot detection
-    hourly_std = np.std(hourly_counts)
-    hourly_range = max(hourly_counts) - min(hourly_counts)
-    
     if hourly_range < 3 or hourly_std < 1.5:
-        probs.bot = 95.0
+        bot = 95.0
     elif hourly_range < 5:
-        probs.bot = 70.0
-    elif sleep.activity_during_sleep > total_tx * 0.2:
-        probs.bot = 60.0
-    elif sleep.confidence < 50:
-        probs.bot = 40.0
+        bot = 70.0
+    elif sleep_activity > total_tx * 0.2:
+        bot = 60.0
+    elif sleep_confidence < 50:
+        bot = 40.0
     else:
-        probs.bot = max(0, 30 - sleep.confidence * 0.3)
+        bot = max(0.0, 30.0 - sleep_confidence * 0.3)
     
     # Geographic inference
-    s = sleep.start_hour
+    s = sleep_start
     
     if 20 <= s or s <= 2:
-        probs.eu_trader = 80 + (10 if s in [22, 23, 0] else 0)
+        eu = 90.0 if (s == 22 or s == 23 or s == 0) else 80.0
     elif 18 <= s <= 19 or 3 <= s <= 4:
-        probs.eu_trader = 40
+        eu = 40.0
     else:
-        probs.eu_trader = 10
+        eu = 10.0
     
     if 3 <= s <= 8:
-        probs.us_trader = 80 + (10 if s in [5, 6, 7] else 0)
+        us = 90.0 if 5 <= s <= 7 else 80.0
     elif 9 <= s <= 10 or 1 <= s <= 2:
-        probs.us_trader = 40
+        us = 40.0
     else:
-        probs.us_trader = 10
+        us = 10.0
     
     if 12 <= s <= 18:
-        probs.asia_trader = 80 + (10 if s in [14, 15, 16] else 0)
+        asia = 90.0 if 14 <= s <= 16 else 80.0
     elif 10 <= s <= 11 or 19 <= s <= 20:
-        probs.asia_trader = 40
+        asia = 40.0
     else:
-        probs.asia_trader = 10
+        asia = 10.0
     
     # Occupation inference
-    weekend_tx = daily_counts[5] + daily_counts[6]
-    weekday_tx = sum(daily_counts[:5])
-    
     if weekday_tx > 0:
         weekend_ratio = (weekend_tx / 2) / (weekday_tx / 5)
     else:
         weekend_ratio = 2.0 if weekend_tx > 0 else 1.0
     
     if weekend_ratio > 2.0:
-        probs.retail_hobbyist = 90
-        probs.professional = 10
+        retail, professional = 90.0, 10.0
     elif weekend_ratio > 1.3:
-        probs.retail_hobbyist = 70
-        probs.professional = 30
+        retail, professional = 70.0, 30.0
     elif weekend_ratio < 0.3:
-        probs.retail_hobbyist = 10
-        probs.professional = 90
+        retail, professional = 10.0, 90.0
     elif weekend_ratio < 0.6:
-        probs.retail_hobbyist = 30
-        probs.professional = 70
+        retail, professional = 30.0, 70.0
     else:
-        probs.retail_hobbyist = 50
-        probs.professional = 50
+        retail, professional = 50.0, 50.0
     
     # Whale detection
-    avg_cu = df["compute_units"].mean()
-    avg_fee = df["fee_sol"].mean()
-    
     if avg_cu > 300000 or avg_fee > 0.01:
-        probs.whale = 85
+        whale = 85.0
     elif avg_cu > 200000 or avg_fee > 0.005:
-        probs.whale = 60
+        whale = 60.0
     elif avg_cu > 100000:
-        probs.whale = 30
+        whale = 30.0
     else:
-        probs.whale = 10
+        whale = 10.0
     
     # Degen detection
-    fail_rate = (~df["success"]).sum() / total_tx
-    high_cu_ratio = (df["compute_units"] > 200000).sum() / total_tx
-    
     if fail_rate > 0.3 or high_cu_ratio > 0.5:
-        probs.degen = 85
+        degen = 85.0
     elif fail_rate > 0.15 or high_cu_ratio > 0.3:
-        probs.degen = 60
+        degen = 60.0
     elif fail_rate > 0.08:
-        probs.degen = 40
+        degen = 40.0
     else:
-        probs.degen = 15
+        degen = 15.0
+    
+    return bot, eu, us, asia, retail, professional, whale, degen
+
+
+def calculate_probabilities(df: pd.DataFrame, hourly_counts: list, daily_counts: list, sleep: SleepWindow) -> ProfileProbabilities:
+    probs = ProfileProbabilities()
+    total_tx = len(df)
+    
+    if total_tx == 0:
+        return probs
+    
+    # Precompute scalar stats, then hand off to the numeric core
+    hourly = np.asarray(hourly_counts, dtype=np.float64)
+    cus = df["compute_units"].to_numpy()
+    fees = df["fee_sol"].to_numpy()
+    ok = df["success"].to_numpy(dtype=np.bool_)
+    
+    (probs.bot, probs.eu_trader, probs.us_trader, probs.asia_trader,
+     probs.retail_hobbyist, probs.professional, probs.whale, probs.degen) = _calc_probs_core(
+        float(hourly.std()),
+        float(hourly.max() - hourly.min()),
+        float(sleep.activity_during_sleep),
+        float(sleep.confidence),
+        int(sleep.start_hour),
+        float(daily_counts[5] + daily_counts[6]),
+        float(sum(daily_counts[:5])),
+        float(cus.mean()),
+        float(fees.mean()),
+        float((total_tx - np.count_nonzero(ok)) / total_tx),
+        float(np.count_nonzero(cus > 200000) / total_tx),
+        total_tx,
+    )
+    
+    # --fast/--enhanced runs fetch no compute units - whale/degen would be scored from zeros
+    if not cus.any():
+        probs.compute_units_known = False
+        probs.whale = probs.degen = 0.0
     
     probs.normalize()
     return probs
 
 
+# Compute-unit tier bounds (a CU value equal to a bound belongs to the next tier) and per-tier colors
+COMPLEXITY_THRESHOLDS = np.array([50000, 150000, 300000])
+COMPLEXITY_COLORS = np.array(['#22c55e', '#eab308', '#f97316', '#ef4444'])
+
+
+def complexity_colors(cus: np.ndarray) -> list:
+    """Vectorized get_complexity_color over an array of compute units"""
+    return COMPLEXITY_COLORS[np.searchsorted(COMPLEXITY_THRESHOLDS, cus, side='right')].tolist()
+
+
 def get_complexity_color(cu: int) -> str:
     if cu < 50000:
         return '#22c55e'
@@ -966,15 +1525,20 @@ def get_complexity_label(cu: float) -> str:
         return 'Heavy'
 
 
+def sleep_hour_mask(hours: np.ndarray, start_hour: int) -> np.ndarray:
+    """Boolean mask of hours falling in the 6-hour sleep window starting at start_hour (wraps midnight)"""
+    end = start_hour + 6
+    return ((start_hour <= hours) & (hours < end)) | ((end > 24) & (hours < end % 24))
+
+
 def visualize_profile(df: pd.DataFrame, wallet: str, probs: ProfileProbabilities, sleep: SleepWindow, reaction: ReactionSpeedAnalysis):
     """Generate profile visualization"""
     
-    hourly_counts = [0] * 24
-    daily_counts = [0] * 7
+    # Bind columns once as ndarrays
+    hours = df["hour"].to_numpy()
+    cus = df["compute_units"].to_numpy()
     
-    for _, row in df.iterrows():
-        hourly_counts[row["hour"]] += 1
-        daily_counts[row["day_of_week"]] += 1
+    hourly_counts, daily_counts = activity_histograms(df)
     
     peak_hour = hourly_counts.index(max(hourly_counts))
     days = ['Mon', 'Tue', 'Wed', 'Thu', 'Fri', 'Sat', 'Sun']
@@ -983,12 +1547,9 @@ def visualize_profile(df: pd.DataFrame, wallet: str, probs: ProfileProbabilities
     weekday_tx = sum(daily_counts[:5])
     weekend_ratio = (weekend_tx / 2) / (weekday_tx / 5) if weekday_tx > 0 else 0
     
-    panic_count = 0
-    for _, row in df.iterrows():
-        in_sleep = (sleep.start_hour <= row["hour"] < sleep.start_hour + 6) or \
-                   (sleep.start_hour + 6 > 24 and row["hour"] < (sleep.start_hour + 6) % 24)
-        if in_sleep and row["compute_units"] > 200000:
-            panic_count += 1
+    in_sleep = sleep_hour_mask(hours, sleep.start_hour)
+    panic_mask = in_sleep & (cus > 200000)
+    panic_count = int(panic_mask.sum())
     
     plt.style.use('dark_background')
     fig = plt.figure(figsize=(16, 16))  # Increased height for reaction speed panel
@@ -1021,8 +1582,9 @@ def visualize_profile(df: pd.DataFrame, wallet: str, probs: ProfileProbabilities
     
     bars = ax0.barh(categories, values, color=colors, alpha=0.7, edgecolor='white', linewidth=0.5)
     
-    for bar, val in zip(bars, values):
-        ax0.text(val + 1, bar.get_y() + bar.get_height()/2, f'{val:.1f}%',
+    unscored = set() if probs.compute_units_known else {6, 7}  # whale, degen without CU data
+    for i, (bar, val) in enumerate(zip(bars, values)):
+        ax0.text(val + 1, bar.get_y() + bar.get_height()/2, 'N/A' if i in unscored else f'{val:.1f}%',
                  va='center', ha='left', color='white', fontsize=9)
     
     ax0.set_xlim(0, 110)
@@ -1036,16 +1598,9 @@ def visualize_profile(df: pd.DataFrame, wallet: str, probs: ProfileProbabilities
     ax1 = fig.add_subplot(5, 2, 3)
     ax1.set_facecolor(panel_color)
     
-    bar_colors = []
-    for i in range(24):
-        in_sleep = (sleep.start_hour <= i < sleep.start_hour + 6) or \
-                   (sleep.start_hour + 6 > 24 and i < (sleep.start_hour + 6) % 24)
-        if i == peak_hour:
-            bar_colors.append(accent_green)
-        elif in_sleep:
-            bar_colors.append(accent_red)
-        else:
-            bar_colors.append(accent_cyan)
+    hour_axis = np.arange(24)
+    bar_colors = np.where(hour_axis == peak_hour, accent_green,
+                          np.where(sleep_hour_mask(hour_axis, sleep.start_hour), accent_red, accent_cyan)).tolist()
     
     ax1.bar(range(24), hourly_counts, color=bar_colors, alpha=0.7, edgecolor='white', linewidth=0.3)
     
@@ -1110,14 +1665,10 @@ def visualize_profile(df: pd.DataFrame, wallet: str, probs: ProfileProbabilities
     ax5 = fig.add_subplot(5, 2, 7)
     ax5.set_facecolor(panel_color)
     
-    colors = [get_complexity_color(cu) for cu in df["compute_units"]]
-    sizes = []
-    for _, row in df.iterrows():
-        in_sleep = (sleep.start_hour <= row["hour"] < sleep.start_hour + 6) or \
-                   (sleep.start_hour + 6 > 24 and row["hour"] < (sleep.start_hour + 6) % 24)
-        sizes.append(120 if in_sleep and row["compute_units"] > 200000 else 40)
+    colors = complexity_colors(cus)
+    sizes = np.where(panic_mask, 120, 40)
     
-    ax5.scatter(df["hour"] + np.random.uniform(-0.3, 0.3, len(df)), df["compute_units"],
+    ax5.scatter(hours + np.random.uniform(-0.3, 0.3, len(hours)), cus,
                 c=colors, s=sizes, alpha=0.7, edgecolors='white', linewidths=0.3)
     
     if sleep.start_hour + 6 <= 24:
@@ -1152,8 +1703,9 @@ def visualize_profile(df: pd.DataFrame, wallet: str, probs: ProfileProbabilities
     
     bars = ax6.bar(risk_labels, risk_values, color=risk_colors, alpha=0.7, edgecolor='white', linewidth=0.5)
     
-    for bar, val in zip(bars, risk_values):
-        ax6.text(bar.get_x() + bar.get_width()/2, val + 2, f'{val:.1f}%',
+    for i, (bar, val) in enumerate(zip(bars, risk_values)):
+        label = 'N/A' if i < 2 and not probs.compute_units_known else f'{val:.1f}%'
+        ax6.text(bar.get_x() + bar.get_width()/2, val + 2, label,
                  ha='center', va='bottom', color='white', fontsize=10, fontweight='bold')
     
     ax6.set_title("RISK PROFILE", color=accent_red, fontsize=11, fontweight='bold', loc='left')
@@ -1173,17 +1725,16 @@ def visualize_profile(df: pd.DataFrame, wallet: str, probs: ProfileProbabilities
         colors_reaction = [accent_red, accent_orange, accent_green]
         
         # Bar chart of reaction categories
-        bars = ax7.bar(categories, counts, color=colors_reaction, alpha=0.7, edgecolor='white', linewidth=1)
-        
-        # Add counts on bars with better spacing
-        max_count = max(counts) if counts else 1
-        for bar, count in zip(bars, counts):
+        ax7.bar(categories, counts, color=colors_reaction, alpha=0.7, edgecolor='white', linewidth=1)
+        
+        # Add counts on bars - label positions for all bars at once (categorical bars sit at x = 0, 1, 2)
+        count_arr = np.asarray(counts, dtype=np.float64)
+        max_count = count_arr.max()
+        percentages = count_arr / reaction.total_reaction_pairs * 100
+        text_ys = count_arr + max_count * 0.05
+        for x, count, percentage, text_y in zip(range(len(counts)), counts, percentages, text_ys):
             if count > 0:
-                percentage = (count / reaction.total_reaction_pairs) * 100
-                # Position text higher with more padding
-                text_y = bar.get_height() + max_count * 0.05
-                ax7.text(bar.get_x() + bar.get_width()/2, text_y,
-                        f'{count}\n({percentage:.1f}%)', ha='center', va='bottom', 
+                ax7.text(x, text_y, f'{count}\n({percentage:.1f}%)', ha='center', va='bottom',
                         color='white', fontsize=9, fontweight='bold')
         
         # Add metrics text box with smaller font
@@ -1235,13 +1786,15 @@ def visualize_profile(df: pd.DataFrame, wallet: str, probs: ProfileProbabilities
 def print_profile_report(df: pd.DataFrame, wallet: str, probs: ProfileProbabilities, sleep: SleepWindow, reaction: ReactionSpeedAnalysis):
     """Print profile intelligence report"""
     
+    # Bind columns once as ndarrays
+    cus = df["compute_units"].to_numpy()
+    ok = df["success"].to_numpy()
+    
     total_tx = len(df)
-    avg_cu = df["compute_units"].mean()
-    fail_rate = (~df["success"]).sum() / total_tx * 100
+    avg_cu = cus.mean()
+    fail_rate = (~ok).sum() / total_tx * 100
     
-    daily_counts = [0] * 7
-    for _, row in df.iterrows():
-        daily_counts[row["day_of_week"]] += 1
+    _, daily_counts = activity_histograms(df)
     weekend_tx = daily_counts[5] + daily_counts[6]
     weekday_tx = sum(daily_counts[:5])
     weekend_ratio = (weekend_tx / 2) / (weekday_tx / 5) if weekday_tx > 0 else 0
@@ -1263,7 +1816,10 @@ def print_profile_report(df: pd.DataFrame, wallet: str, probs: ProfileProbabilit
     print("═" * 70)
     print(f" Target:            {wallet}")
     print(f" Transactions:      {total_tx}")
-    print(f" Period:            {df['timestamp'].min().strftime('%Y-%m-%d %H:%M')} → {df['timestamp'].max().strftime('%Y-%m-%d %H:%M')} UTC")
+    block_times = df["block_time"].to_numpy()
+    period_start = datetime.fromtimestamp(int(block_times.min()), tz=timezone.utc)
+    period_end = datetime.fromtimestamp(int(block_times.max()), tz=timezone.utc)
+    print(f" Period:            {format_minutes(period_start)} → {format_minutes(period_end)} UTC")
     print("─" * 70)
     
     print("\n 🤖 ENTITY CLASSIFICATION")
@@ -1299,10 +1855,16 @@ def print_profile_report(df: pd.DataFrame, wallet: str, probs: ProfileProbabilit
     
     print("\n 📊 BEHAVIORAL PROFILE")
     print("─" * 70)
-    print(f" ├─ Avg Complexity: {avg_cu:,.0f} CU ({get_complexity_label(avg_cu)})")
-    print(f" ├─ Fail Rate:      {fail_rate:.1f}%")
-    print(f" ├─ Whale Prob.:    {probs.whale:.1f}%")
-    print(f" └─ Degen Prob.:    {probs.degen:.1f}%")
+    if probs.compute_units_known:
+        print(f" ├─ Avg Complexity: {avg_cu:,.0f} CU ({get_complexity_label(avg_cu)})")
+        print(f" ├─ Fail Rate:      {fail_rate:.1f}%")
+        print(f" ├─ Whale Prob.:    {probs.whale:.1f}%")
+        print(f" └─ Degen Prob.:    {probs.degen:.1f}%")
+    else:
+        print(f" ├─ Avg Complexity: N/A (no compute-unit data in fast/enhanced mode)")
+        print(f" ├─ Fail Rate:      {fail_rate:.1f}%")
+        print(f" ├─ Whale Prob.:    N/A")
+        print(f" └─ Degen Prob.:    N/A")
     
     # Reaction Speed Analysis Section
     if reaction.total_reaction_pairs > 0:
@@ -1327,10 +1889,30 @@ def print_profile_report(df: pd.DataFrame, wallet: str, probs: ProfileProbabilit
     print("═" * 70 + "\n")
 
 
+def save_profile_csv(df: pd.DataFrame, csv_path: str):
+    """Write profile data to CSV (pyarrow's C++ writer when available, same output either way)"""
+    if PYARROW_SUPPORTED:
+        # pyarrow writes booleans as true/false and its own timestamp format - pre-format
+        # those columns the way DataFrame.to_csv does
+        text_cols = df.select_dtypes(include=["bool", "datetime", "datetimetz"]).columns
+        df = df.assign(**{col: df[col].astype(str).where(df[col].notna(), None) for col in text_cols})
+        pacsv.write_csv(pa.Table.from_pandas(df, preserve_index=False), csv_path)
+    else:
+        df.to_csv(csv_path, index=False)
+
+
 # ═══════════════════════════════════════════════════════════════════════════════
 # CONNECT COMMAND - Find Connections Between Wallets
 # ═══════════════════════════════════════════════════════════════════════════════
 
+# Never meaningful as connections - stripped from extracted account sets
+IGNORED_ACCOUNTS = frozenset({
+    "",
+    "11111111111111111111111111111111",
+    "TokenkegQfeZyiNwAJbNbGKPFXCWuBvf9Ss623VQ5DA",
+})
+
+
 def extract_accounts_from_tx(tx_details: dict) -> Set[str]:
     """Extract all account addresses involved in a transaction"""
     accounts = set()
@@ -1340,120 +1922,149 @@ def extract_accounts_from_tx(tx_details: dict) -> Set[str]:
     
     try:
         # Get account keys from message
-        msg = tx_details.get("transaction", {}).get("message", {})
-        account_keys = msg.get("accountKeys", [])
-        
-        for key in account_keys:
-            if isinstance(key, dict):
-                accounts.add(key.get("pubkey", ""))
-            else:
-                accounts.add(str(key))
+        msg = (tx_details.get("transaction") or {}).get("message") or {}
+        accounts.update(normalize_account_keys(msg))
         
         # Also check instructions for program IDs
-        for ix in msg.get("instructions", []):
+        for ix in msg.get("instructions") or []:
             if isinstance(ix, dict):
-                if "programId" in ix:
-                    accounts.add(ix["programId"])
-                if "accounts" in ix:
-                    accounts.update(ix["accounts"])
+                program_id = ix.get("programId")
+                if program_id:
+                    accounts.add(program_id)
+                ix_accounts = ix.get("accounts")
+                if ix_accounts:
+                    accounts.update(ix_accounts)
     except:
         pass
     
     # Remove empty strings and system programs
-    accounts.discard("")
-    accounts.discard("11111111111111111111111111111111")
-    accounts.discard("TokenkegQfeZyiNwAJbNbGKPFXCWuBvf9Ss623VQ5DA")
+    accounts -= IGNORED_ACCOUNTS
     
     return accounts
 
 
+def extract_signers_from_tx(tx_details: dict) -> Set[str]:
+    """Extract the signer (wallet) addresses of a transaction"""
+    signers = set()
+    
+    if not tx_details:
+        return signers
+    
+    try:
+        account_keys = tx_details.get("transaction", {}).get("message", {}).get("accountKeys", [])
+        for key in account_keys:
+            if isinstance(key, dict) and key.get("signer"):
+                signers.add(key.get("pubkey", ""))
+    except:
+        pass
+    
+    signers.discard("")
+    return signers
+
+
+def edge_key(wallet_a: str, wallet_b: str) -> Tuple[str, str]:
+    """Canonical (order-independent) key for a connection between two wallets"""
+    return (wallet_a, wallet_b) if wallet_a < wallet_b else (wallet_b, wallet_a)
+
+
+def fetch_wallet_transactions(wallet: str, limit: int = 100) -> Tuple[List[dict], Dict[str, Set[str]]]:
+    """
+    Fetch a wallet's transactions (most recent first) for connection analysis.
+    Returns (transactions, {signature -> involved accounts}).
+    """
+    signatures = fetch_signatures(wallet, limit)
+    tx_details_map = fetch_transactions_batch(list(map(get_signature, signatures)))
+    
+    txs = []
+    accounts = {}
+    for sig_info in signatures:
+        signature = sig_info["signature"]
+        tx_details = tx_details_map.get(signature)
+        
+        if tx_details:
+            txs.append({
+                "signature": signature,
+                "block_time": sig_info.get("blockTime"),
+                "details": tx_details
+            })
+            accounts[signature] = extract_accounts_from_tx(tx_details)
+    
+    # Most recent first, so an early exit keeps the latest interactions
+    txs.sort(key=lambda tx: tx["block_time"] or 0, reverse=True)
+    return txs, accounts
+
+
 def find_connections(wallets: List[str], limit: int = 100) -> Dict[Tuple[str, str], WalletConnection]:
     """Find connections between multiple wallets"""
     
     print(f"\n[*] Analyzing connections between {len(wallets)} wallets...")
     
-    # Collect all transactions for each wallet
+    # Collect all transactions for each wallet - wallets are independent, so fetch them concurrently
     wallet_txs: Dict[str, List[dict]] = {}
     wallet_accounts: Dict[str, Dict[str, Set[str]]] = {}  # wallet -> {signature -> accounts}
     
-    for wallet in wallets:
-        print(f"\n[-] Fetching transactions for {get_label(wallet)}...")
-        signatures = fetch_signatures(wallet, limit)
-        
-        wallet_txs[wallet] = []
-        wallet_accounts[wallet] = {}
-        
-        # Fetch all transactions in parallel (MUCH FASTER!)
-        sig_strings = [sig_info["signature"] for sig_info in signatures]
-        tx_details_map = fetch_transactions_parallel(sig_strings, max_workers=10)
-        
-        for idx, sig_info in enumerate(signatures):
-            progress = (idx + 1) / len(signatures)
-            bar_len = 30
-            filled = int(bar_len * progress)
-            bar = '█' * filled + '░' * (bar_len - filled)
-            print(f"\r    [{bar}] {idx + 1}/{len(signatures)}", end="", flush=True)
-            
-            signature = sig_info["signature"]
-            tx_details = tx_details_map.get(signature)
-            
-            if tx_details:
-                wallet_txs[wallet].append({
-                    "signature": signature,
-                    "block_time": sig_info.get("blockTime"),
-                    "details": tx_details
-                })
-                wallet_accounts[wallet][signature] = extract_accounts_from_tx(tx_details)
-        
-        print()
+    print(f"\n[-] Fetching transactions for {len(wallets)} wallets...")
+    with ThreadPoolExecutor(max_workers=max(1, min(len(wallets), SCAN_MAX_WORKERS))) as executor:
+        results = executor.map(lambda w: fetch_wallet_transactions(w, limit), wallets)
+        for wallet, (txs, accounts) in zip(wallets, results):
+            wallet_txs[wallet] = txs
+            wallet_accounts[wallet] = accounts
+            print(f"    [+] {get_label(wallet)}: {len(txs)} transactions")
     
-    # Find connections
+    # Find connections: one pass over every wallet's transactions, joining each tx's
+    # account set against the wallet set instead of scanning every wallet pair
     connections: Dict[Tuple[str, str], WalletConnection] = {}
+    pair_block_times: Dict[Tuple[str, str], List[int]] = defaultdict(list)
+    pair_seen: Dict[Tuple[str, str], Set[str]] = defaultdict(set)  # O(1) dedupe; conn.signatures keeps order
+    wallet_order = {wallet: i for i, wallet in enumerate(wallets)}
     
     print("\n[*] Analyzing connections...")
     
-    for i, wallet_a in enumerate(wallets):
-        for wallet_b in wallets[i+1:]:
-            # Check for direct transactions
-            conn = WalletConnection(wallet_a=wallet_a, wallet_b=wallet_b)
-            
-            # Check if wallet_b appears in wallet_a's transactions
-            for tx in wallet_txs[wallet_a]:
-                accounts = wallet_accounts[wallet_a].get(tx["signature"], set())
-                if wallet_b in accounts:
-                    conn.tx_count += 1
-                    conn.signatures.append(tx["signature"])
-                    
-                    if tx["block_time"]:
-                        tx_time = datetime.fromtimestamp(tx["block_time"], tz=timezone.utc)
-                        if conn.first_interaction is None or tx_time < conn.first_interaction:
-                            conn.first_interaction = tx_time
-                        if conn.last_interaction is None or tx_time > conn.last_interaction:
-                            conn.last_interaction = tx_time
-            
-            # Check if wallet_a appears in wallet_b's transactions
-            for tx in wallet_txs[wallet_b]:
-                accounts = wallet_accounts[wallet_b].get(tx["signature"], set())
-                if wallet_a in accounts:
-                    if tx["signature"] not in conn.signatures:  # Avoid duplicates
-                        conn.tx_count += 1
-                        conn.signatures.append(tx["signature"])
-                        
-                        if tx["block_time"]:
-                            tx_time = datetime.fromtimestamp(tx["block_time"], tz=timezone.utc)
-                            if conn.first_interaction is None or tx_time < conn.first_interaction:
-                                conn.first_interaction = tx_time
-                            if conn.last_interaction is None or tx_time > conn.last_interaction:
-                                conn.last_interaction = tx_time
+    for wallet in wallets:
+        for tx in wallet_txs[wallet]:
+            accounts = wallet_accounts[wallet].get(tx["signature"], set())
             
-            if conn.tx_count > 0:
-                connections[(wallet_a, wallet_b)] = conn
+            for other in accounts & wallet_order.keys():
+                if other == wallet:
+                    continue
+                
+                key = edge_key(wallet, other)
+                conn = connections.get(key)
+                if conn is None:
+                    wallet_a, wallet_b = sorted((wallet, other), key=wallet_order.__getitem__)
+                    conn = connections[key] = WalletConnection(wallet_a=wallet_a, wallet_b=wallet_b)
+                
+                if conn.tx_count >= FIND_CONNECTIONS_EARLY_EXIT:
+                    continue
+                
+                signature = tx["signature"]
+                if signature in pair_seen[key]:  # Avoid duplicates
+                    continue
+                pair_seen[key].add(signature)
+                
+                conn.tx_count += 1
+                conn.signatures.append(signature)
+                
+                if tx["block_time"]:
+                    pair_block_times[key].append(tx["block_time"])
+    
+    # Convert only the extremes to datetimes, once per pair
+    for key, block_times in pair_block_times.items():
+        conn = connections[key]
+        conn.first_interaction = datetime.fromtimestamp(min(block_times), tz=timezone.utc)
+        conn.last_interaction = datetime.fromtimestamp(max(block_times), tz=timezone.utc)
     
     return connections
 
 
-def print_connection_report(connections: Dict[Tuple[str, str], WalletConnection], wallets: List[str]):
-    """Print connection analysis report"""
+def format_minutes(dt: datetime) -> str:
+    """Format as 'YYYY-MM-DD HH:MM' without strftime's locale/format-string parsing"""
+    return f"{dt.year:04d}-{dt.month:02d}-{dt.day:02d} {dt.hour:02d}:{dt.minute:02d}"
+
+
+def print_connection_report(connections: Dict[Tuple[str, str], WalletConnection], wallets: List[str],
+                            top_k: Optional[int] = None):
+    """Print connection analysis report (only the top_k strongest connections if given)"""
     
     print("\n" + "═" * 70)
     print(" 🐊 GATOR CONNECTION ANALYSIS")
@@ -1469,23 +2080,32 @@ def print_connection_report(connections: Dict[Tuple[str, str], WalletConnection]
         return
     
     # Sort by transaction count
-    sorted_conns = sorted(connections.values(), key=lambda x: x.tx_count, reverse=True)
+    if top_k is not None and top_k < len(connections):
+        sorted_conns = nlargest(top_k, connections.values(), key=attrgetter("tx_count"))
+    else:
+        sorted_conns = sorted(connections.values(), key=attrgetter("tx_count"), reverse=True)
+    
+    # Resolve each wallet's label once
+    all_wallets = {c.wallet_a for c in sorted_conns} | {c.wallet_b for c in sorted_conns}
+    labels = {w: get_label(w) for w in all_wallets}
     
     print("\n 🔗 DIRECT CONNECTIONS")
+    if len(sorted_conns) < len(connections):
+        print(f" (showing top {len(sorted_conns)} of {len(connections)})")
     print("─" * 70)
     
     for conn in sorted_conns:
-        label_a = get_label(conn.wallet_a)
-        label_b = get_label(conn.wallet_b)
+        label_a = labels[conn.wallet_a]
+        label_b = labels[conn.wallet_b]
         
         print(f"\n ┌─ {label_a}")
         print(f" │  ↕ {conn.tx_count} transactions")
         print(f" └─ {label_b}")
         
         if conn.first_interaction:
-            print(f"    First: {conn.first_interaction.strftime('%Y-%m-%d %H:%M')} UTC")
+            print(f"    First: {format_minutes(conn.first_interaction)} UTC")
         if conn.last_interaction:
-            print(f"    Last:  {conn.last_interaction.strftime('%Y-%m-%d %H:%M')} UTC")
+            print(f"    Last:  {format_minutes(conn.last_interaction)} UTC")
         
         if conn.signatures:
             print(f"    Sample: {conn.signatures[0][:20]}...")
@@ -1510,35 +2130,45 @@ def visualize_connections(connections: Dict[Tuple[str, str], WalletConnection],
     angles = np.linspace(0, 2 * np.pi, n, endpoint=False)
     radius = 3
     
-    positions = {}
-    for i, wallet in enumerate(wallets):
-        positions[wallet] = (radius * np.cos(angles[i]), radius * np.sin(angles[i]))
+    coords = np.stack([radius * np.cos(angles), radius * np.sin(angles)], axis=1)
+    wallet_idx = {wallet: i for i, wallet in enumerate(wallets)}
     
     # Draw connections
-    max_tx = max([c.tx_count for c in connections.values()]) if connections else 1
-    
-    for (wallet_a, wallet_b), conn in connections.items():
-        x1, y1 = positions[wallet_a]
-        x2, y2 = positions[wallet_b]
-        
-        # Line width based on transaction count
-        width = 1 + (conn.tx_count / max_tx) * 5
-        alpha = 0.3 + (conn.tx_count / max_tx) * 0.5
-        
-        ax.plot([x1, x2], [y1, y2], color='#06b6d4', linewidth=width, alpha=alpha)
-        
-        # Label the connection
-        mid_x, mid_y = (x1 + x2) / 2, (y1 + y2) / 2
-        ax.text(mid_x, mid_y, f"{conn.tx_count}", fontsize=8, color='white',
-                ha='center', va='center', bbox=dict(boxstyle='round', facecolor='#111111', alpha=0.8))
+    tx_counts = np.fromiter((c.tx_count for c in connections.values()), dtype=np.int32, count=len(connections))
+    max_tx = int(tx_counts.max()) if len(tx_counts) else 1
+    inv_max_tx = 1.0 / max_tx
+    
+    # All edges in one collection (one draw call instead of a Line2D per edge)
+    edges = list(connections.items())
+    if edges:
+        # Gather endpoint coordinates by index in one shot -> (E, 2, 2)
+        ia = np.fromiter((wallet_idx[wallet_a] for (wallet_a, _), _ in edges), dtype=np.intp, count=len(edges))
+        ib = np.fromiter((wallet_idx[wallet_b] for (_, wallet_b), _ in edges), dtype=np.intp, count=len(edges))
+        segments = np.stack([coords[ia], coords[ib]], axis=1)
+        
+        # Line width/alpha based on transaction count
+        weights = tx_counts * inv_max_tx
+        edge_colors = np.tile(mcolors.to_rgba('#06b6d4'), (len(edges), 1))
+        edge_colors[:, 3] = 0.3 + weights * 0.5
+        
+        edge_collection = LineCollection(segments, linewidths=1 + weights * 5, colors=edge_colors)
+        # Rasterize edges on save (one bitmap instead of a vector stroke per edge); labels stay vector
+        edge_collection.set_rasterized(True)
+        edge_collection.set_zorder(1)
+        ax.add_collection(edge_collection)
+        
+        # Label the connections (a text artist each - only on small maps)
+        midpoints = segments.mean(axis=1) if len(edges) < EDGE_LABEL_LIMIT else []
+        for (_, conn), (mid_x, mid_y) in zip(edges, midpoints):
+            ax.text(mid_x, mid_y, f"{conn.tx_count}", fontsize=8, color='white',
+                    ha='center', va='center', bbox=dict(boxstyle='round', facecolor='#111111', alpha=0.8))
     
     # Draw wallet nodes
-    for wallet, (x, y) in positions.items():
-        circle = plt.Circle((x, y), 0.4, color='#22c55e', alpha=0.8)
-        ax.add_patch(circle)
-        
-        label = get_label(wallet)
-        ax.text(x, y - 0.7, label, fontsize=9, color='white', ha='center', va='top')
+    nodes = [plt.Circle((x, y), 0.4) for x, y in coords]
+    ax.add_collection(PatchCollection(nodes, facecolor='#22c55e', edgecolor='#22c55e', alpha=0.8, zorder=2))
+    
+    for wallet, (x, y) in zip(wallets, coords):
+        ax.text(x, y - 0.7, get_label(wallet), fontsize=9, color='white', ha='center', va='top')
     
     ax.set_xlim(-5, 5)
     ax.set_ylim(-5, 5)
@@ -1551,50 +2181,135 @@ def visualize_connections(connections: Dict[Tuple[str, str], WalletConnection],
     return fig
 
 
+def visualize_connections_pyvis(connections: Dict[Tuple[str, str], WalletConnection], wallets: List[str], out_path: str):
+    """Write wallet connections as an interactive Pyvis HTML graph (pan/zoom/drag in the browser)"""
+    net = Network(height="900px", width="100%", bgcolor='#0a0a0a', font_color='white')
+    
+    for wallet in wallets:
+        net.add_node(wallet, label=get_label(wallet), title=wallet, color='#22c55e')
+    
+    for (wallet_a, wallet_b), conn in connections.items():
+        net.add_edge(wallet_a, wallet_b, value=conn.tx_count, title=f"{conn.tx_count} tx", color='#06b6d4')
+    
+    # write_html rather than show() - no browser/notebook launch from the CLI
+    net.write_html(out_path)
+
+
+def save_html_graph(connections: Dict[Tuple[str, str], WalletConnection], wallets: List[str], out_path: str):
+    if not PYVIS_SUPPORTED:
+        print("[!] --html needs pyvis (pip install pyvis)")
+        return
+    visualize_connections_pyvis(connections, wallets, out_path)
+    print(f"[+] Interactive graph saved: {out_path}")
+
+
+def export_graph(connections: Dict[Tuple[str, str], WalletConnection], wallets: List[str], path: str, fmt: str = "graphml"):
+    """
+    Write the wallet connection graph for offline rendering.
+    fmt "graphml" targets Gephi/yEd, "json" writes Cytoscape.js elements.
+    """
+    if fmt == "json":
+        elements = {
+            "nodes": [{"data": {"id": w, "label": get_label(w)}} for w in wallets],
+            "edges": [
+                {"data": {"id": f"{a}-{b}", "source": a, "target": b, "weight": conn.tx_count}}
+                for (a, b), conn in connections.items()
+            ]
+        }
+        with open(path, "w", encoding="utf-8") as f:
+            json.dump({"elements": elements}, f)
+        return
+    
+    root = ET.Element("graphml", xmlns="http://graphml.graphdrawing.org/xmlns")
+    ET.SubElement(root, "key", {"id": "label", "for": "node", "attr.name": "label", "attr.type": "string"})
+    ET.SubElement(root, "key", {"id": "weight", "for": "edge", "attr.name": "weight", "attr.type": "int"})
+    graph = ET.SubElement(root, "graph", id="G", edgedefault="undirected")
+    
+    for w in wallets:
+        node = ET.SubElement(graph, "node", id=w)
+        ET.SubElement(node, "data", key="label").text = get_label(w)
+    
+    for (a, b), conn in connections.items():
+        edge = ET.SubElement(graph, "edge", source=a, target=b)
+        ET.SubElement(edge, "data", key="weight").text = str(conn.tx_count)
+    
+    ET.ElementTree(root).write(path, encoding="utf-8", xml_declaration=True)
+
+
 # ═══════════════════════════════════════════════════════════════════════════════
 # SCAN COMMAND - Map Wallet Network (Future Feature)
 # ═══════════════════════════════════════════════════════════════════════════════
 
+def collect_wallet_neighbors(wallet: str, limit: int, skip: Set[str]) -> Tuple[List[Tuple[str, str]], Set[str]]:
+    """
+    Fetch a wallet's recent transactions and return (candidate (account, signature) edges,
+    candidates seen signing a transaction). Accounts in skip are ignored.
+    Safe to run from worker threads (read-only on skip).
+    """
+    print(f"    Analyzing {get_label(wallet)}...")
+    signatures = fetch_signatures(wallet, limit)[:limit]
+    
+    sig_strings = list(map(get_signature, signatures))
+    tx_details_map = fetch_transactions_batch(sig_strings)
+    
+    edges = []
+    signers = set()
+    for sig_info in signatures:
+        tx_details = tx_details_map.get(sig_info["signature"])
+        accounts = extract_accounts_from_tx(tx_details)
+        
+        # Find new wallets (filter out programs) - one set difference per transaction
+        new_accounts = {acc for acc in accounts if len(acc) > 40} - skip  # Likely wallets
+        edges.extend((acc, sig_info["signature"]) for acc in new_accounts)
+        
+        signers.update(extract_signers_from_tx(tx_details))
+    
+    return edges, signers - skip
+
+
 def scan_network(wallet: str, depth: int = 1, limit: int = 50):
     """Scan and map a wallet's network connections"""
     
     print(f"\n[*] Scanning network for {get_label(wallet)} (depth={depth})...")
     
     discovered: Set[str] = {wallet}
+    known_empty: Set[str] = set()  # Accounts the probe found missing or unfunded
     connections: Dict[Tuple[str, str], WalletConnection] = {}
     current_level = {wallet}
     
     for level in range(depth):
         print(f"\n[-] Level {level + 1}...")
         next_level = set()
-        
-        for w in current_level:
-            print(f"    Analyzing {get_label(w)}...")
-            signatures = fetch_signatures(w, limit)
-            
-            # Fetch transactions in parallel
-            sig_strings = [sig_info["signature"] for sig_info in signatures[:limit]]
-            tx_details_map = fetch_transactions_parallel(sig_strings, max_workers=10)
-            
-            for sig_info in signatures[:limit]:
-                tx_details = tx_details_map.get(sig_info["signature"])
-                accounts = extract_accounts_from_tx(tx_details)
+        level_wallets = list(current_level)
+        skip = discovered | known_empty
+        
+        # Wallets are independent and I/O-bound - fetch them concurrently, merge here
+        candidate_edges = []
+        active: Set[str] = set()  # Candidates known to be wallets (seen signing)
+        with ThreadPoolExecutor(max_workers=max(1, min(SCAN_MAX_WORKERS, len(level_wallets)))) as executor:
+            results = executor.map(lambda w: collect_wallet_neighbors(w, limit, skip), level_wallets)
+            for w, (edges, signers) in zip(level_wallets, results):
+                candidate_edges.extend((w, acc, signature) for acc, signature in edges)
+                active.update(signers)
+        
+        # Quick check for the rest: does this account hold SOL? (deduplicated, 100 accounts per lookup)
+        candidates = list(dict.fromkeys(acc for _, acc, _ in candidate_edges if acc not in active))
+        funded = fetch_funded_accounts(candidates)
+        known_empty.update(acc for acc in candidates if acc not in funded)
+        active |= funded
+        
+        for w, acc, signature in candidate_edges:
+            if acc not in discovered and acc in active:
+                next_level.add(acc)
+                discovered.add(acc)
                 
-                # Find new wallets (filter out programs)
-                for acc in accounts:
-                    if acc not in discovered and len(acc) > 40:  # Likely a wallet
-                        # Quick check: has this account made transactions?
-                        test_sigs = fetch_signatures(acc, 1)
-                        if test_sigs:
-                            next_level.add(acc)
-                            discovered.add(acc)
-                            
-                            # Record connection
-                            if (w, acc) not in connections and (acc, w) not in connections:
-                                connections[(w, acc)] = WalletConnection(
-                                    wallet_a=w, wallet_b=acc, tx_count=1,
-                                    signatures=[sig_info["signature"]]
-                                )
+                # Record connection
+                key = edge_key(w, acc)
+                if key not in connections:
+                    connections[key] = WalletConnection(
+                        wallet_a=w, wallet_b=acc, tx_count=1,
+                        signatures=[signature]
+                    )
         
         current_level = next_level
         print(f"    Discovered {len(next_level)} new wallets")
@@ -1647,6 +2362,8 @@ Examples:
     profile_parser.add_argument("--limit", "-l", type=int, default=100, help="Transaction limit")
     profile_parser.add_argument("--no-plot", action="store_true", help="Skip visualization")
     profile_parser.add_argument("--save", "-s", type=str, help="Save plot to file")
+    profile_parser.add_argument("--fast", action="store_true", help="Signature data only (skip transaction details)")
+    profile_parser.add_argument("--enhanced", action="store_true", help="Use Helius parsed history (fewer requests, no compute units)")
     
     # Connect command
     connect_parser = subparsers.add_parser("connect", help="Find connections between wallets")
@@ -1654,29 +2371,33 @@ Examples:
     connect_parser.add_argument("--limit", "-l", type=int, default=50, help="Transactions per wallet")
     connect_parser.add_argument("--no-plot", action="store_true", help="Skip visualization")
     connect_parser.add_argument("--save", "-s", type=str, help="Save plot to file")
+    connect_parser.add_argument("--top", type=int, help="Only report the N strongest connections")
+    connect_parser.add_argument("--format", "-f", choices=["png", "graphml", "json"], default="png",
+                                help="Graph output: matplotlib plot, GraphML or Cytoscape JSON")
+    connect_parser.add_argument("--html", type=str, metavar="PATH", help="Write an interactive Pyvis graph instead of plotting")
     
     # Scan command
     scan_parser = subparsers.add_parser("scan", help="Map wallet network")
     scan_parser.add_argument("address", help="Starting wallet address")
     scan_parser.add_argument("--depth", "-d", type=int, default=1, help="Network depth")
     scan_parser.add_argument("--limit", "-l", type=int, default=30, help="Transactions per wallet")
+    scan_parser.add_argument("--format", "-f", choices=["png", "graphml", "json"],
+                             help="Also output the network graph (large graphs fall back to GraphML)")
+    scan_parser.add_argument("--save", "-s", type=str, help="Save graph to file")
+    scan_parser.add_argument("--html", type=str, metavar="PATH", help="Write an interactive Pyvis graph")
     
     args = parser.parse_args()
     
     print_banner()
     
     if args.command == "profile":
-        df, tx_details_list = analyze_wallet(args.address, args.limit)
+        df, tx_details_list = analyze_wallet(args.address, args.limit, fast=args.fast, enhanced=args.enhanced)
         
         if df.empty:
             print("[!] No data. Exiting.")
             sys.exit(1)
         
-        hourly_counts = [0] * 24
-        daily_counts = [0] * 7
-        for _, row in df.iterrows():
-            hourly_counts[row["hour"]] += 1
-            daily_counts[row["day_of_week"]] += 1
+        hourly_counts, daily_counts = activity_histograms(df)
         
         sleep = detect_sleep_window(hourly_counts)
         probs = calculate_probabilities(df, hourly_counts, daily_counts, sleep)
@@ -1687,7 +2408,7 @@ Examples:
         print_profile_report(df, args.address, probs, sleep, reaction)
         
         csv_path = f"gator_profile_{args.address[:8]}.csv"
-        df.to_csv(csv_path, index=False)
+        save_profile_csv(df, csv_path)
         print(f"[+] Data saved: {csv_path}")
         
         if not args.no_plot:
@@ -1703,12 +2424,19 @@ Examples:
             sys.exit(1)
         
         connections = find_connections(args.addresses, args.limit)
-        print_connection_report(connections, args.addresses)
-        
-        if not args.no_plot and connections:
+        print_connection_report(connections, args.addresses, top_k=args.top)
+        
+        if connections and args.html:
+            save_html_graph(connections, args.addresses, args.html)
+        elif connections and args.format != "png":
+            graph_path = args.save or f"gator_connect.{args.format}"
+            export_graph(connections, args.addresses, graph_path, args.format)
+            print(f"[+] Graph saved: {graph_path}")
+        elif not args.no_plot and connections:
             fig = visualize_connections(connections, args.addresses)
             if args.save:
-                fig.savefig(args.save, dpi=150, facecolor='#0a0a0a', bbox_inches='tight')
+                dpi = 100 if len(connections) > SAVE_LOW_DPI_EDGES else 150
+                fig.savefig(args.save, dpi=dpi, facecolor='#0a0a0a', bbox_inches='tight')
                 print(f"[+] Plot saved: {args.save}")
             plt.show()
     
@@ -1720,6 +2448,27 @@ Examples:
         
         for wallet in discovered:
             print(f"    - {get_label(wallet)}")
+        
+        if args.html:
+            save_html_graph(connections, list(discovered), args.html)
+        
+        if args.format:
+            graph_format = args.format
+            if graph_format == "png" and len(discovered) > LARGE_GRAPH_THRESHOLD:
+                print(f"[!] {len(discovered)} wallets is too many to plot - exporting GraphML instead")
+                graph_format = "graphml"
+            
+            if graph_format == "png":
+                fig = visualize_connections(connections, list(discovered))
+                if args.save:
+                    dpi = 100 if len(connections) > SAVE_LOW_DPI_EDGES else 150
+                    fig.savefig(args.save, dpi=dpi, facecolor='#0a0a0a', bbox_inches='tight')
+                    print(f"[+] Plot saved: {args.save}")
+                plt.show()
+            else:
+                graph_path = args.save if args.save and args.format == graph_format else f"gator_scan_{args.address[:8]}.{graph_format}"
+                export_graph(connections, list(discovered), graph_path, graph_format)
+                print(f"[+] Graph saved: {graph_path}")
     
     else:
         parser.print_help()
@@ -0,0 +1,52 @@
+"""
+Hot path of the EVM stalker: decoded log notification -> watched wallets it concerns.
+
+Plain Python that Cython compiles as-is (pure Python mode - the dict/set/list
+annotations become typed C locals and bytecode dispatch disappears):
+
+    pip install cython
+    cythonize -i -3 services/stalker_hot.py
+
+When the extension has been built, Python imports it instead of this file;
+behaviour is identical either way.
+"""
+
+
+def wallet_key(address: str) -> bytes:
+    """
+    20-byte key for an EVM address, from either its 0x form or a 32-byte padded
+    topic (last 40 hex digits). Hex parsing is case-insensitive, so no lowercasing.
+    """
+    return bytes.fromhex(address[-40:])
+
+
+def match_log_event(data: dict, wallet_keys: dict):
+    """
+    Match an eth_subscription notification against the watched wallets
+    (wallet_keys: 20-byte key -> wallet address).
+    Returns (tx_hash, block_number, result, wallets) or None if it is not a
+    notification with a transaction hash. wallets is ordered and de-duplicated:
+    the emitting address first, then wallets found as topic 1 / 2 / 3.
+    """
+    if data.get("method") != "eth_subscription":
+        return None
+
+    result: dict = data.get("params", {}).get("result", {})
+    tx_hash = result.get("transactionHash")
+    if not tx_hash:
+        return None
+
+    matched: list = []
+    address = result.get("address")
+    if address:
+        wallet = wallet_keys.get(wallet_key(address))
+        if wallet:
+            matched.append(wallet)
+
+    # The subscriptions only deliver logs emitted by a watched wallet or with one as topic 1-3
+    for topic in result.get("topics", [])[1:4]:
+        wallet = wallet_keys.get(wallet_key(topic))
+        if wallet and wallet not in matched:
+            matched.append(wallet)
+
+    return tx_hash, result.get("blockNumber"), result, matched
@@ -5,25 +5,67 @@ WebSocket-based real-time wallet monitoring for EVM and Solana chains
 """
 
 import asyncio
+import atexit
+import heapq
+import inspect
+import itertools
 import json
+import logging
+import logging.handlers
 import os
-from typing import Dict, Set, Optional, Callable
+import queue
+import sys
+import threading
+import time
+from typing import Dict, List, Set, Optional, Callable, Tuple, Deque
 from datetime import datetime
-from collections import defaultdict
+from collections import defaultdict, deque
 import websockets
 from dotenv import load_dotenv
+# Compiled Cython extension when built (cythonize -i -3 services/stalker_hot.py), plain Python otherwise
+from services.stalker_hot import match_log_event, wallet_key
 
 load_dotenv()
 
+# Verbose per-message Solana output (message dumps, per-notification traces); off by default
+STALKER_DEBUG = os.getenv("STALKER_DEBUG") == "1"
+
+# Logging: the event loop only enqueues records - a QueueListener thread writes them
+# to stdout, so console I/O never blocks the listen loops
+log = logging.getLogger("stalker")
+if not log.handlers:
+    log.setLevel(logging.DEBUG if STALKER_DEBUG else logging.INFO)
+    log.propagate = False
+    _log_queue = queue.Queue(-1)
+    log.addHandler(logging.handlers.QueueHandler(_log_queue))
+    _log_listener = logging.handlers.QueueListener(_log_queue, logging.StreamHandler(sys.stdout))
+    _log_listener.start()
+    atexit.register(_log_listener.stop)
+
+# Optional fast JSON parsing for subscription notifications
+try:
+    import orjson
+    ORJSON_SUPPORTED = True
+except ImportError:
+    ORJSON_SUPPORTED = False
+
+# Optional faster event loop for the stalker thread (Linux/macOS)
+try:
+    import uvloop
+    UVLOOP_SUPPORTED = True
+except ImportError:
+    UVLOOP_SUPPORTED = False
+
 # Solana imports
 try:
     from solana.rpc.websocket_api import connect as solana_connect
     from solders.pubkey import Pubkey
     from solders.rpc.config import RpcTransactionLogsFilterMentions
+    from solders.rpc.responses import LogsNotification, SubscriptionResult
     SOLANA_SUPPORTED = True
 except ImportError:
     SOLANA_SUPPORTED = False
-    print("[!] Warning: Solana support not available (install solana, solders)")
+    log.warning("[!] Warning: Solana support not available (install solana, solders)")
 
 # TODO: Configure RPC WebSocket endpoints per chain
 EVM_WSS_ENDPOINTS = {
@@ -42,120 +84,522 @@ SOLANA_WSS_URL = os.getenv("SOLANA_WSS_URL") or (
     f"wss://mainnet.helius-rpc.com/?api-key={HELIUS_API_KEY}" if HELIUS_API_KEY else None
 )
 
+# Only frames containing this token can be log notifications - everything else
+# (subscription acks, keepalives, errors) is dropped before JSON parsing
+EVM_NOTIFICATION_TOKEN = '"eth_subscription"'
+EVM_NOTIFICATION_TOKEN_BYTES = EVM_NOTIFICATION_TOKEN.encode()
+
+# WebSocket tuning shared by both stalkers: no permessage-deflate (small JSON frames
+# gain little from it and every frame would be inflated on receive), explicit
+# 1 MB frame cap, and keepalive pings so dead connections are detected
+WS_CONNECT_KWARGS = dict(compression=None, max_size=2**20, ping_interval=20, ping_timeout=20)
+
+# Seconds connect() waits for the first connection (later drops are retried indefinitely)
+WS_CONNECT_TIMEOUT = 15
+
+# Max frames handled per wakeup when a burst is already buffered, before yielding to other tasks
+RECV_DRAIN_MAX = 64
+
+# Seconds to wait for the response to a subscribe/unsubscribe request
+RPC_RESPONSE_TIMEOUT = 10
+
+# Activity events are coalesced for this long, then handed to the callbacks as one batch
+ACTIVITY_BATCH_WINDOW = 0.05
+ACTIVITY_BATCH_MAX = 256
+
+# Run stalkers on a dedicated thread/event loop (set STALKER_THREADED=0 to share the caller's loop)
+STALKER_THREADED = os.getenv("STALKER_THREADED", "1") != "0"
+
+# Transactions remembered per wallet for debouncing (oldest evicted first)
+SEEN_TXS_PER_WALLET = 100
+
+
+def loads_json(message):
+    """Parse a JSON-RPC frame (str or bytes), using orjson when available"""
+    return orjson.loads(message) if ORJSON_SUPPORTED else json.loads(message)
+
+
+def new_seen_txs() -> Tuple[Deque[str], Set[str]]:
+    """Per-wallet seen-transaction FIFO: deque for eviction order, set for O(1) membership"""
+    return deque(maxlen=SEEN_TXS_PER_WALLET), set()
 
-class WalletStalker:
+
+def mark_seen(seen: Tuple[Deque[str], Set[str]], tx_hash: str) -> bool:
+    """Record tx_hash; returns False if it was already seen"""
+    order, members = seen
+    if tx_hash in members:
+        return False
+    if len(order) == order.maxlen:
+        members.discard(order[0])  # append() below evicts it from the deque
+    order.append(tx_hash)
+    members.add(tx_hash)
+    return True
+
+
+async def drain_activity(stalker):
     """
-    Manages live wallet monitoring via WebSocket subscriptions.
-    Supports multiple wallets over a single persistent connection per chain.
+    Deliver a stalker's queued activity events in microbatches, so the listen
+    loop never waits on callback latency. Uses on_activity_batch(list) when set,
+    otherwise on_activity(event) per event.
+    """
+    queue = stalker.activity_queue
+    while True:
+        batch = [await queue.get()]
+        await asyncio.sleep(ACTIVITY_BATCH_WINDOW)
+        while len(batch) < ACTIVITY_BATCH_MAX and not queue.empty():
+            batch.append(queue.get_nowait())
+        
+        if stalker.on_activity_batch:
+            try:
+                await stalker.on_activity_batch(batch)
+            except Exception as e:
+                log.error("[Stalker] Callback error: %s", e)
+        elif stalker.on_activity:
+            for activity_event in batch:
+                try:
+                    # Call the callback (likely triggers profile scan)
+                    await stalker.on_activity(activity_event)
+                except Exception as e:
+                    log.error("[Stalker] Callback error: %s", e)
+
+
+def dumps_json(obj) -> str:
+    """Serialize a JSON-RPC request for a text frame, using orjson when available"""
+    if ORJSON_SUPPORTED:
+        return orjson.dumps(obj).decode()
+    return json.dumps(obj, separators=(",", ":"))
+
+
+class WalletStatusCache:
+    """
+    Incrementally maintained get_watched_wallets_status() result.
+    An entry's "time ago" text only changes at a known moment (next second while
+    active, next minute within the hour, next hour after), so deadlines are kept
+    in a heap and a status call re-renders only the entries that went stale.
+    Locked: with STALKER_THREADED the stalker thread updates it while the API reads.
     """
     
-    def __init__(self, chain: str = "ethereum"):
+    def __init__(self):
+        self._state: Dict[str, Tuple[Optional[float], int]] = {}  # wallet -> (last activity, tx_count)
+        self._entries: Dict[str, dict] = {}  # wallet -> rendered status
+        self._deadlines: Dict[str, float] = {}  # wallet -> monotonic time its entry goes stale
+        self._heap: List[Tuple[float, str]] = []  # (deadline, wallet); superseded items are skipped
+        self._lock = threading.Lock()
+    
+    def add(self, wallet: str, last_activity: Optional[float], tx_count: int = 0):
+        """Start tracking a newly watched wallet"""
+        with self._lock:
+            self._state[wallet] = (last_activity, tx_count)
+            self._render(wallet, time.monotonic(), time.time())
+    
+    def touch(self, wallet: str, last_activity: float, tx_count: int):
+        """Record activity for a tracked wallet (ignored once it has been unwatched)"""
+        with self._lock:
+            if wallet in self._state:
+                self._state[wallet] = (last_activity, tx_count)
+                self._render(wallet, time.monotonic(), time.time())
+    
+    def remove(self, wallet: str):
+        with self._lock:
+            self._state.pop(wallet, None)
+            self._entries.pop(wallet, None)
+            self._deadlines.pop(wallet, None)
+    
+    def clear(self):
+        with self._lock:
+            self._state.clear()
+            self._entries.clear()
+            self._deadlines.clear()
+            self._heap.clear()
+    
+    def snapshot(self) -> Dict:
+        """Current status of all tracked wallets - O(stale entries), not O(wallets)"""
+        now = time.monotonic()
+        wall_now = time.time()
+        with self._lock:
+            while self._heap and self._heap[0][0] <= now:
+                deadline, wallet = heapq.heappop(self._heap)
+                if self._deadlines.get(wallet) == deadline:
+                    self._render(wallet, now, wall_now)
+            # Entries are replaced, never mutated, so a shallow copy is a consistent snapshot
+            return dict(self._entries)
+    
+    def _render(self, wallet: str, now: float, wall_now: float):
+        last_activity, tx_count = self._state[wallet]
+        
+        if last_activity is not None:
+            time_diff = now - last_activity
+            
+            # Determine status (and when its text next changes)
+            if time_diff < 30:  # Active in last 30 seconds
+                state = "active"
+                time_ago = f"{int(time_diff)}s ago"
+                deadline = last_activity + int(time_diff) + 1
+            elif time_diff < 3600:  # Active in last hour
+                state = "idle"
+                time_ago = f"{int(time_diff / 60)}m ago"
+                deadline = last_activity + (int(time_diff / 60) + 1) * 60
+            else:
+                state = "idle"
+                time_ago = f"{int(time_diff / 3600)}h ago"
+                deadline = last_activity + (int(time_diff / 3600) + 1) * 3600
+            self._deadlines[wallet] = deadline
+            heapq.heappush(self._heap, (deadline, wallet))
+        else:
+            state = "idle"
+            time_ago = "Never"
+            self._deadlines.pop(wallet, None)
+        
+        self._entries[wallet] = {
+            "state": state,
+            "last_activity": time_ago,
+            "last_activity_timestamp": datetime.utcfromtimestamp(wall_now - time_diff).isoformat() if last_activity is not None else None,
+            "tx_count": tx_count
+        }
+
+
+class BaseWalletStalker:
+    """
+    Chain-independent part of a stalker: watched-wallet state, debouncing, status,
+    and activity delivery. Subclasses own the connection and subscriptions
+    (connect / disconnect / watch_wallet / unwatch_wallet / _process_message).
+    """
+    
+    def __init__(self, chain: str):
         self.chain = chain
-        self.ws_url = EVM_WSS_ENDPOINTS.get(chain)
-        self.websocket: Optional[websockets.WebSocketClientProtocol] = None
+        self.websocket = None
         
         # State management
         self.watched_wallets: Set[str] = set()  # Wallets currently being watched
-        self.subscription_ids: Dict[str, str] = {}  # wallet -> subscription_id
-        self.last_seen_txs: Dict[str, Set[str]] = defaultdict(set)  # wallet -> {tx_hashes}
-        self.last_activity: Dict[str, datetime] = {}  # wallet -> last_activity_time
+        self.last_seen_txs: Dict[str, Tuple[Deque[str], Set[str]]] = defaultdict(new_seen_txs)  # wallet -> (order, tx_hashes)
+        self.last_activity: Dict[str, float] = {}  # wallet -> last activity (time.monotonic())
+        self._status = WalletStatusCache()  # get_watched_wallets_status(), maintained incrementally
         
         # Callbacks
         self.on_activity: Optional[Callable] = None  # Called when wallet becomes active
+        self.on_activity_batch: Optional[Callable] = None  # Called with a list of events (preferred)
+        self.activity_queue: Optional[asyncio.Queue] = None
+        self.drain_task = None
+    
+    def _start_drain(self):
+        """Start delivering queued activity to the callbacks (call from connect())"""
+        self.activity_queue = asyncio.Queue()
+        self.drain_task = asyncio.create_task(drain_activity(self))
+    
+    def _track_wallet(self, wallet: str, now: float):
+        self.watched_wallets.add(wallet)
+        self.last_activity[wallet] = now
+        self._status.add(wallet, now)
+    
+    def _untrack_wallet(self, wallet: str):
+        self.watched_wallets.discard(wallet)
+        self.last_activity.pop(wallet, None)
+        self.last_seen_txs.pop(wallet, None)
+        self._status.remove(wallet)
+    
+    def _handle_activity(self, wallet: str, tx_hash: str, extras: dict):
+        """
+        Handle detected wallet activity with debouncing.
+        extras fills in the chain-specific event fields (block_number, event_data).
+        """
+        # Debounce: Skip if we've already seen this transaction (keeps the last 100 per wallet, FIFO)
+        seen = self.last_seen_txs[wallet]
+        if not mark_seen(seen, tx_hash):
+            return
         
-        # Connection state
-        self.connected = False
+        # Update last activity timestamp (and this wallet's status entry only)
+        self.last_activity[wallet] = time.monotonic()
+        self._status.touch(wallet, self.last_activity[wallet], len(seen[1]))
+        
+        # Log detection
+        log.info("[Stalker] 🚨 TARGET ACTIVE on %s! %s... | Tx: %s... | Block: %s",
+                 self.chain, wallet[:10], tx_hash[:10], extras.get("block_number"))
+        
+        # Queue for the callbacks if registered (delivered in batches by drain_activity)
+        if self.on_activity or self.on_activity_batch:
+            activity_event = {
+                "wallet": wallet,
+                "tx_hash": tx_hash,
+                "block_number": None,
+                "timestamp": datetime.utcnow().isoformat(),
+                "chain": self.chain,
+                "event_data": None
+            }
+            activity_event.update(extras)
+            self.activity_queue.put_nowait(activity_event)
+    
+    def get_watched_wallets_status(self) -> Dict:
+        """
+        Get current status of all watched wallets.
+        Returns dict with wallet info for frontend display.
+        """
+        return self._status.snapshot()
+
+
+class WalletStalker(BaseWalletStalker):
+    """
+    Manages live wallet monitoring via WebSocket subscriptions.
+    Supports multiple wallets over a single persistent connection per chain.
+    """
+    
+    def __init__(self, chain: str = "ethereum"):
+        super().__init__(chain)
+        self.ws_url = EVM_WSS_ENDPOINTS.get(chain)
+        self.websocket: Optional[websockets.WebSocketClientProtocol] = None
+        
+        self.subscription_ids: Dict[str, str] = {}  # filter ("emitter"/"topic1".."topic3") -> subscription_id
+        self._wallet_keys: Dict[bytes, str] = {}  # 20-byte address -> wallet (matches addresses and topics)
+        
+        # JSON-RPC responses are routed by id from the listen loop (it owns recv())
+        self._request_ids = itertools.count(1)
+        self._pending: Dict[int, asyncio.Future] = {}  # request id -> response future
+        self._subscribe_lock = asyncio.Lock()  # one subscription swap at a time
+        
+        # Connection state (connection_task reconnects; listen_task serves the current socket)
+        self._connection_up = asyncio.Event()
         self.connection_task = None
+        self.listen_task = None
+    
+    @property
+    def connected(self) -> bool:
+        return self._connection_up.is_set()
         
     async def connect(self):
-        """Establish persistent WebSocket connection to EVM RPC"""
+        """
+        Establish persistent WebSocket connection to EVM RPC.
+        Fails if the first connection cannot be made in WS_CONNECT_TIMEOUT;
+        after that, dropped connections are re-established automatically.
+        """
         if not self.ws_url:
             raise ValueError(f"No WebSocket endpoint configured for chain: {self.chain}")
         
+        # Start the connection manager and the callback drainer
+        self._start_drain()
+        self.connection_task = asyncio.create_task(self._run())
+        
+        up = asyncio.create_task(self._connection_up.wait())
+        await asyncio.wait({up, self.connection_task}, timeout=WS_CONNECT_TIMEOUT, return_when=asyncio.FIRST_COMPLETED)
+        if not up.done():
+            up.cancel()
+            self.connection_task.cancel()
+            self.drain_task.cancel()
+            log.error("[Stalker] Connection to %s failed", self.chain)
+            raise ConnectionError(f"Could not connect to {self.chain} WebSocket")
+    
+    async def _run(self):
+        """
+        Connection manager. websockets.connect() used as an async iterator reconnects
+        with jittered exponential backoff; every new connection restores all watched
+        wallets in one batch frame, then listens until it drops.
+        """
+        # TODO: Add authentication headers if required by RPC provider
+        async for websocket in websockets.connect(self.ws_url, close_timeout=1, **WS_CONNECT_KWARGS):
+            self.websocket = websocket
+            self.listen_task = asyncio.create_task(self._listen_loop())
+            self._connection_up.set()
+            log.info("[Stalker] Connected to %s WebSocket", self.chain)
+            try:
+                await self._resubscribe_all()
+                await self.listen_task
+            finally:
+                self._connection_up.clear()
+                self.listen_task.cancel()
+                # Responses to requests in flight died with the connection
+                for future in self._pending.values():
+                    if not future.done():
+                        future.set_exception(ConnectionError("WebSocket connection lost"))
+            log.info("[Stalker] Reconnecting to %s...", self.chain)
+    
+    async def _resubscribe_all(self):
+        """Restore the log subscriptions on a fresh connection (the old ids died with the old one)"""
+        self.subscription_ids = {}
+        if not self._wallet_keys:
+            return
         try:
-            # TODO: Add authentication headers if required by RPC provider
-            self.websocket = await websockets.connect(self.ws_url)
-            self.connected = True
-            print(f"[Stalker] Connected to {self.chain} WebSocket")
-            
-            # Start listening loop
-            self.connection_task = asyncio.create_task(self._listen_loop())
-            
+            await self._replace_subscriptions()
+            log.info("[Stalker] Resubscribed %s wallets on %s", len(self._wallet_keys), self.chain)
         except Exception as e:
-            print(f"[Stalker] Connection failed: {e}")
-            self.connected = False
-            raise
+            log.error("[Stalker] Resubscribe failed: %s", e)
     
     async def disconnect(self):
         """Cleanly close WebSocket connection"""
-        self.connected = False
-        
-        # Unsubscribe all wallets
-        for wallet in list(self.watched_wallets):
-            await self.unwatch_wallet(wallet)
+        # Unsubscribe (while the listen loop can still receive confirmations)
+        self.watched_wallets.clear()
+        self._status.clear()
+        self._wallet_keys.clear()
+        self.last_seen_txs.clear()
+        await self._unsubscribe(list(self.subscription_ids.values()))
+        self.subscription_ids.clear()
         
-        # Close connection
+        # Stop reconnecting, then close the connection
+        if self.connection_task:
+            self.connection_task.cancel()
+            try:
+                await self.connection_task
+            except asyncio.CancelledError:
+                pass
         if self.websocket:
             await self.websocket.close()
-            print(f"[Stalker] Disconnected from {self.chain}")
+            log.info("[Stalker] Disconnected from %s", self.chain)
         
-        # Cancel listening task
-        if self.connection_task:
-            self.connection_task.cancel()
+        # Cancel the drain task
+        if self.drain_task:
+            self.drain_task.cancel()
     
     async def watch_wallet(self, wallet_address: str):
         """
         Subscribe to real-time events for a specific wallet address.
         Uses eth_subscribe with logs filter.
         """
+        if wallet_address.lower() in self.watched_wallets:
+            log.info("[Stalker] Already watching %s...", wallet_address[:10])
+            return
+        
+        results = await self.watch_wallets([wallet_address])
+        return results.get(wallet_address.lower(), False)
+    
+    async def watch_wallets(self, wallet_addresses: List[str]) -> Dict[str, bool]:
+        """
+        Subscribe to several wallets at once.
+        The provider filters server-side: all watched wallets share four log
+        subscriptions (wallet as emitting address / topic 1-3), sent in one JSON-RPC batch
+        frame and replaced whenever the watch list changes.
+        """
         if not self.connected or not self.websocket:
             raise RuntimeError("WebSocket not connected. Call connect() first.")
         
-        wallet_address = wallet_address.lower()
+        wallets = []
+        for wallet_address in wallet_addresses:
+            wallet_address = wallet_address.lower()
+            if wallet_address in self.watched_wallets or wallet_address in wallets:
+                log.info("[Stalker] Already watching %s...", wallet_address[:10])
+                continue
+            wallets.append(wallet_address)
         
-        if wallet_address in self.watched_wallets:
-            print(f"[Stalker] Already watching {wallet_address[:10]}...")
-            return
+        results = {}
+        keys = {}
+        for wallet_address in wallets:
+            try:
+                key = wallet_key(wallet_address)
+                if len(key) != 20:
+                    raise ValueError(wallet_address)
+                keys[key] = wallet_address
+            except ValueError:
+                log.error("[Stalker] Invalid EVM address: %s", wallet_address)
+                results[wallet_address] = False
+        wallets = list(keys.values())
         
-        # Subscribe to logs mentioning this address
-        # This captures both FROM and TO transactions
-        subscription_request = {
-            "jsonrpc": "2.0",
-            "id": 1,
-            "method": "eth_subscribe",
-            "params": [
-                "logs",
-                {
-                    "address": None,  # Any contract
-                    "topics": [
-                        None,  # Any event signature
-                        # Listen for address in any topic position (flexible)
-                        # TODO: May need to adjust based on specific event patterns
-                    ]
-                }
-            ]
-        }
+        if not wallets:
+            return results
         
         try:
-            await self.websocket.send(json.dumps(subscription_request))
-            response = await self.websocket.recv()
-            result = json.loads(response)
+            sub_ids = await self._replace_subscriptions(keys)
+        except Exception as e:
+            log.error("[Stalker] Failed to watch wallets: %s", e)
+            results.update({wallet: False for wallet in wallets})
+            return results
+        
+        now = time.monotonic()
+        for wallet_address in wallets:
+            self._track_wallet(wallet_address, now)
+            log.info("[Stalker] 👁️  Now watching: %s... (subs: %s)", wallet_address[:10], ', '.join(sub_ids))
+        
+        results.update({wallet: True for wallet in wallets})
+        return results
+    
+    async def _replace_subscriptions(self, extra: Optional[Dict[bytes, str]] = None) -> List[str]:
+        """
+        Subscribe to logs emitted by any watched wallet (plus extra), or with one as
+        topic 1 (e.g. Transfer "from"), topic 2 ("to") or topic 3, then drop the previous
+        subscriptions. Only matching logs are streamed - the provider does the filtering
+        instead of sending every log.
+        """
+        async with self._subscribe_lock:
+            sub_ids = await self._swap_subscriptions(list(self._wallet_keys) + list(extra or {}))
+            # Register under the lock so a concurrent swap includes these wallets
+            self._wallet_keys.update(extra or {})
+            return sub_ids
+    
+    async def _swap_subscriptions(self, keys: List[bytes]) -> List[str]:
+        old_sub_ids = list(self.subscription_ids.values())
+        new_sub_ids = {}
+        
+        if keys:
+            # EVM addresses in topics are padded to 32 bytes
+            addresses = ["0x" + key.hex() for key in keys]
+            padded_topics = ["0x" + key.hex().zfill(64) for key in keys]
+            filters = {
+                "emitter": {"address": addresses},
+                "topic1": {"topics": [None, padded_topics]},
+                "topic2": {"topics": [None, None, padded_topics]},
+                "topic3": {"topics": [None, None, None, padded_topics]},
+            }
+            subscription_requests = [{
+                "jsonrpc": "2.0",
+                "method": "eth_subscribe",
+                "params": ["logs", log_filter]
+            } for log_filter in filters.values()]
             
-            if "result" in result:
-                sub_id = result["result"]
-                self.subscription_ids[wallet_address] = sub_id
-                self.watched_wallets.add(wallet_address)
-                self.last_activity[wallet_address] = datetime.utcnow()
-                
-                print(f"[Stalker] 👁️  Now watching: {wallet_address[:10]}... (sub: {sub_id})")
-                return True
-            else:
-                print(f"[Stalker] Subscription failed: {result}")
-                return False
-                
+            responses = await self._send_requests(subscription_requests)
+            if not all("result" in response for response in responses):
+                # Keep the old subscriptions; drop any of the new set that succeeded
+                stray = [response["result"] for response in responses if "result" in response]
+                await self._unsubscribe(stray)
+                raise RuntimeError(f"Subscription failed: {responses}")
+            new_sub_ids = {name: response["result"] for name, response in zip(filters, responses)}
+        
+        # Swap in the new set before unsubscribing so no matching log is missed
+        self.subscription_ids = new_sub_ids
+        await self._unsubscribe(old_sub_ids)
+        return list(new_sub_ids.values())
+    
+    async def _unsubscribe(self, sub_ids: List[str]):
+        """Cancel subscriptions in one batch frame (errors are logged, not raised)"""
+        if not sub_ids:
+            return
+        try:
+            await self._send_requests([{
+                "jsonrpc": "2.0",
+                "method": "eth_unsubscribe",
+                "params": [sub_id]
+            } for sub_id in sub_ids])
         except Exception as e:
-            print(f"[Stalker] Failed to watch wallet: {e}")
-            return False
+            log.error("[Stalker] Unsubscribe error: %s", e)
+    
+    async def _send_requests(self, requests: List[dict]) -> List[dict]:
+        """
+        Send JSON-RPC requests in a single frame (a batch array when there are
+        several) and wait for their responses, which the listen loop resolves by id.
+        """
+        if not self.listen_task or self.listen_task.done():
+            raise RuntimeError("Listen loop is not running")
+        
+        loop = asyncio.get_running_loop()
+        futures = []
+        for request in requests:
+            request["id"] = next(self._request_ids)
+            future = loop.create_future()
+            self._pending[request["id"]] = future
+            futures.append(future)
+        
+        try:
+            await self.websocket.send(dumps_json(requests[0] if len(requests) == 1 else requests))
+            return await asyncio.wait_for(asyncio.gather(*futures), RPC_RESPONSE_TIMEOUT)
+        finally:
+            for request in requests:
+                self._pending.pop(request["id"], None)
+    
+    def _resolve_responses(self, message):
+        """Hand JSON-RPC responses (single or batch) to the requests waiting on them"""
+        try:
+            data = loads_json(message)
+        except ValueError:
+            return
+        for response in data if isinstance(data, list) else [data]:
+            if isinstance(response, dict):
+                future = self._pending.get(response.get("id"))
+                if future is not None and not future.done():
+                    future.set_result(response)
     
     async def unwatch_wallet(self, wallet_address: str):
         """Unsubscribe from wallet events"""
@@ -164,187 +608,103 @@ class WalletStalker:
         if wallet_address not in self.watched_wallets:
             return
         
-        sub_id = self.subscription_ids.get(wallet_address)
-        if sub_id and self.websocket:
-            unsubscribe_request = {
-                "jsonrpc": "2.0",
-                "id": 1,
-                "method": "eth_unsubscribe",
-                "params": [sub_id]
-            }
-            
+        # Clean up state
+        self._untrack_wallet(wallet_address)
+        self._wallet_keys.pop(wallet_key(wallet_address), None)
+        
+        # Re-subscribe with the shorter wallet list (or just unsubscribe if it is empty)
+        if self.websocket:
             try:
-                await self.websocket.send(json.dumps(unsubscribe_request))
-                await self.websocket.recv()  # Confirmation
+                await self._replace_subscriptions()
             except Exception as e:
-                print(f"[Stalker] Unsubscribe error: {e}")
+                log.error("[Stalker] Unsubscribe error: %s", e)
         
-        # Clean up state
-        self.watched_wallets.discard(wallet_address)
-        self.subscription_ids.pop(wallet_address, None)
-        self.last_seen_txs.pop(wallet_address, None)
-        
-        print(f"[Stalker] Stopped watching: {wallet_address[:10]}...")
+        log.info("[Stalker] Stopped watching: %s...", wallet_address[:10])
     
     async def _listen_loop(self):
         """
         Continuous loop that listens for incoming WebSocket messages.
         Processes events and triggers callbacks.
         """
+        # websockets >= 14 can hand text frames over as raw bytes (decode=False), skipping
+        # per-frame UTF-8 decoding/validation; both JSON parsers accept bytes directly
+        recv_kwargs = {"decode": False} if "decode" in inspect.signature(self.websocket.recv).parameters else {}
+        # Frame buffer of the legacy websockets protocol (absent on the newer asyncio client)
+        buffered = getattr(self.websocket, "messages", None)
         try:
-            while self.connected and self.websocket:
-                message = await self.websocket.recv()
+            while True:
+                message = await self.websocket.recv(**recv_kwargs)
                 await self._process_message(message)
                 
+                # Burst: drain frames that are already buffered in one pass (recv() returns
+                # them without suspending), then yield once so other tasks are not starved
+                if buffered:
+                    for _ in range(RECV_DRAIN_MAX - 1):
+                        if not buffered:
+                            break
+                        await self._process_message(await self.websocket.recv(**recv_kwargs))
+                    await asyncio.sleep(0)
+                
         except websockets.exceptions.ConnectionClosed:
-            print("[Stalker] Connection closed")
-            self.connected = False
+            log.info("[Stalker] Connection closed")
         except asyncio.CancelledError:
-            print("[Stalker] Listen loop cancelled")
+            log.debug("[Stalker] Listen loop cancelled")
+            raise  # swallowing it would leave a cancelled connection manager running
         except Exception as e:
-            print(f"[Stalker] Listen loop error: {e}")
-            self.connected = False
+            # Returning ends this connection; the connection manager opens a new one
+            log.error("[Stalker] Listen loop error: %s", e)
     
-    async def _process_message(self, message: str):
+    async def _process_message(self, message):
         """
         Process incoming WebSocket message.
         Detects wallet activity and triggers callbacks.
         """
+        # Fast path: substring test instead of a full parse for non-notification frames
+        token = EVM_NOTIFICATION_TOKEN_BYTES if isinstance(message, bytes) else EVM_NOTIFICATION_TOKEN
+        if token not in message:
+            if self._pending:
+                self._resolve_responses(message)
+            return
+        
         try:
-            data = json.loads(message)
+            # Parse + match is pure CPU work in stalker_hot (Cython-compilable); this
+            # coroutine only dispatches the matched wallets
+            event = match_log_event(loads_json(message), self._wallet_keys)
+            if event is None:
+                return
             
-            # Check if this is a subscription notification
-            if "method" in data and data["method"] == "eth_subscription":
-                params = data.get("params", {})
-                result = params.get("result", {})
-                
-                # Extract transaction hash and address info
-                tx_hash = result.get("transactionHash")
-                topics = result.get("topics", [])
-                address = result.get("address")
-                block_number = result.get("blockNumber")
-                
-                if not tx_hash:
-                    return
-                
-                # Check which watched wallet this event relates to
-                # TODO: More sophisticated matching based on topics/address
-                for wallet in self.watched_wallets:
-                    # Simple check: see if wallet appears in topics or address
-                    # EVM addresses in topics are padded to 32 bytes
-                    wallet_padded = "0x" + wallet[2:].zfill(64)
-                    
-                    found_match = False
-                    if address and wallet.lower() == address.lower():
-                        found_match = True
-                    elif any(wallet.lower() in topic.lower() or wallet_padded.lower() == topic.lower() for topic in topics):
-                        found_match = True
-                    
-                    if found_match:
-                        await self._handle_wallet_activity(wallet, tx_hash, block_number, result)
+            tx_hash, block_number, result, matched = event
+            for wallet in matched:
+                self._handle_activity(wallet, tx_hash, {"block_number": block_number, "event_data": result})
                         
-        except json.JSONDecodeError:
-            pass  # Ignore malformed messages
+        except ValueError:
+            pass  # Ignore malformed messages (json and orjson decode errors are both ValueErrors)
         except Exception as e:
-            print(f"[Stalker] Message processing error: {e}")
-    
-    async def _handle_wallet_activity(self, wallet: str, tx_hash: str, block_number: str, event_data: dict):
-        """
-        Handle detected wallet activity with debouncing.
-        """
-        # Debounce: Skip if we've already seen this transaction
-        if tx_hash in self.last_seen_txs[wallet]:
-            return
-        
-        # Add to seen transactions (keep last 100 per wallet)
-        self.last_seen_txs[wallet].add(tx_hash)
-        if len(self.last_seen_txs[wallet]) > 100:
-            # Remove oldest (simple FIFO)
-            self.last_seen_txs[wallet].pop()
-        
-        # Update last activity timestamp
-        self.last_activity[wallet] = datetime.utcnow()
-        
-        # Log detection
-        print(f"[Stalker] 🚨 TARGET ACTIVE! {wallet[:10]}... | Tx: {tx_hash[:10]}... | Block: {block_number}")
-        
-        # Trigger callback if registered
-        if self.on_activity:
-            activity_event = {
-                "wallet": wallet,
-                "tx_hash": tx_hash,
-                "block_number": block_number,
-                "timestamp": datetime.utcnow().isoformat(),
-                "chain": self.chain,
-                "event_data": event_data
-            }
-            
-            try:
-                # Call the callback (likely triggers profile scan)
-                await self.on_activity(activity_event)
-            except Exception as e:
-                print(f"[Stalker] Callback error: {e}")
-    
-    def get_watched_wallets_status(self) -> Dict:
-        """
-        Get current status of all watched wallets.
-        Returns dict with wallet info for frontend display.
-        """
-        status = {}
-        now = datetime.utcnow()
-        
-        for wallet in self.watched_wallets:
-            last_activity = self.last_activity.get(wallet)
-            
-            if last_activity:
-                time_diff = (now - last_activity).total_seconds()
-                
-                # Determine status
-                if time_diff < 30:  # Active in last 30 seconds
-                    state = "active"
-                    time_ago = f"{int(time_diff)}s ago"
-                elif time_diff < 3600:  # Active in last hour
-                    state = "idle"
-                    time_ago = f"{int(time_diff / 60)}m ago"
-                else:
-                    state = "idle"
-                    time_ago = f"{int(time_diff / 3600)}h ago"
-            else:
-                state = "idle"
-                time_ago = "Never"
-            
-            status[wallet] = {
-                "state": state,
-                "last_activity": time_ago,
-                "last_activity_timestamp": last_activity.isoformat() if last_activity else None,
-                "tx_count": len(self.last_seen_txs.get(wallet, set()))
-            }
-        
-        return status
+            log.error("[Stalker] Message processing error: %s", e)
 
 
-class SolanaWalletStalker:
+class SolanaWalletStalker(BaseWalletStalker):
     """
     Solana-specific wallet monitoring via WebSocket subscriptions.
     Uses logsSubscribe to monitor wallet activity.
     """
     
     def __init__(self):
+        super().__init__("solana")
         self.ws_url = SOLANA_WSS_URL
-        self.websocket = None
         
-        # State management
-        self.watched_wallets: Set[str] = set()
         self.subscription_ids: Dict[str, int] = {}  # wallet -> subscription_id
-        self.last_seen_txs: Dict[str, Set[str]] = defaultdict(set)
-        self.last_activity: Dict[str, datetime] = {}
         
-        # Callbacks
-        self.on_activity: Optional[Callable] = None
+        # All subscriptions share one socket; notifications are routed by subscription id
+        self._request_ids = itertools.count(1)
+        self._pending_subs: Dict[int, str] = {}  # logsSubscribe request id -> wallet
+        self._cancelled_subs: Set[int] = set()  # request ids unwatched before their ack (unsubscribed on arrival)
+        self._sub_to_wallet: Dict[int, str] = {}  # subscription id -> wallet
         
         # Connection state
         self.connected = False
         self.listen_task = None
+        self._debug_count = 0  # messages dumped so far (STALKER_DEBUG only)
         
     async def connect(self):
         """Establish persistent WebSocket connection to Solana RPC"""
@@ -356,16 +716,17 @@ class SolanaWalletStalker:
         
         try:
             # Enter the context manager properly
-            self.websocket = solana_connect(self.ws_url)
+            self.websocket = solana_connect(self.ws_url, **WS_CONNECT_KWARGS)
             self.websocket = await self.websocket.__aenter__()
             self.connected = True
-            print(f"[Stalker] Connected to Solana WebSocket")
+            log.info("[Stalker] Connected to Solana WebSocket")
             
-            # Start listening loop
+            # Start listening loop and the callback drainer
+            self._start_drain()
             self.listen_task = asyncio.create_task(self._listen_loop())
             
         except Exception as e:
-            print(f"[Stalker] Solana connection failed: {e}")
+            log.error("[Stalker] Solana connection failed: %s", e)
             self.connected = False
             raise
     
@@ -377,7 +738,9 @@ class SolanaWalletStalker:
         for wallet in list(self.watched_wallets):
             await self.unwatch_wallet(wallet)
         
-        # Cancel listening task
+        # Cancel listening and drain tasks
+        if self.drain_task:
+            self.drain_task.cancel()
         if self.listen_task:
             self.listen_task.cancel()
             try:
@@ -390,8 +753,8 @@ class SolanaWalletStalker:
             try:
                 await self.websocket.__aexit__(None, None, None)
             except Exception as e:
-                print(f"[Stalker] Error closing Solana connection: {e}")
-            print(f"[Stalker] Disconnected from Solana")
+                log.error("[Stalker] Error closing Solana connection: %s", e)
+            log.info("[Stalker] Disconnected from Solana")
     
     async def watch_wallet(self, wallet_address: str):
         """
@@ -402,29 +765,31 @@ class SolanaWalletStalker:
             raise RuntimeError("WebSocket not connected. Call connect() first.")
         
         if wallet_address in self.watched_wallets:
-            print(f"[Stalker] Already watching {wallet_address[:10]}...")
+            log.info("[Stalker] Already watching %s...", wallet_address[:10])
             return True
         
         try:
             # Convert wallet address to Pubkey
             pubkey = Pubkey.from_string(wallet_address)
             
-            # Subscribe to logs mentioning this wallet
+            # Subscribe to logs mentioning this wallet (the provider filters; a mentions
+            # filter takes a single pubkey). The subscription id arrives on the listen
+            # loop as a SubscriptionResult carrying this request id.
+            request_id = next(self._request_ids)
+            self._pending_subs[request_id] = wallet_address
             await self.websocket.logs_subscribe(
                 filter_=RpcTransactionLogsFilterMentions(pubkey),
-                commitment="confirmed"
+                commitment="confirmed",
+                request_id=request_id
             )
             
-            # Note: Solana WebSocket doesn't return subscription ID the same way
-            # We'll track by wallet address
-            self.watched_wallets.add(wallet_address)
-            self.last_activity[wallet_address] = datetime.utcnow()
+            self._track_wallet(wallet_address, time.monotonic())
             
-            print(f"[Stalker] 👁️  Now watching Solana: {wallet_address[:10]}...")
+            log.info("[Stalker] 👁️  Now watching Solana: %s...", wallet_address[:10])
             return True
                 
         except Exception as e:
-            print(f"[Stalker] Failed to watch Solana wallet: {e}")
+            log.error("[Stalker] Failed to watch Solana wallet: %s", e)
             return False
     
     async def unwatch_wallet(self, wallet_address: str):
@@ -432,39 +797,46 @@ class SolanaWalletStalker:
         if wallet_address not in self.watched_wallets:
             return
         
-        # Note: Solana WebSocket API doesn't have easy unsubscribe for logs
-        # We'll just stop tracking it
-        self.watched_wallets.discard(wallet_address)
-        self.subscription_ids.pop(wallet_address, None)
-        self.last_seen_txs.pop(wallet_address, None)
+        self._untrack_wallet(wallet_address)
+        for request_id in [rid for rid, wallet in self._pending_subs.items() if wallet == wallet_address]:
+            del self._pending_subs[request_id]
+            self._cancelled_subs.add(request_id)
         
-        print(f"[Stalker] Stopped watching Solana: {wallet_address[:10]}...")
+        sub_id = self.subscription_ids.pop(wallet_address, None)
+        if sub_id is not None:
+            self._sub_to_wallet.pop(sub_id, None)
+            if self.websocket:
+                try:
+                    await self.websocket.logs_unsubscribe(sub_id)
+                except Exception as e:
+                    log.error("[Stalker] Unsubscribe error: %s", e)
+        
+        log.info("[Stalker] Stopped watching Solana: %s...", wallet_address[:10])
     
     async def _listen_loop(self):
         """
         Continuous loop that listens for incoming WebSocket messages from Solana.
         """
-        print("[Stalker] Solana listen loop started")
+        log.debug("[Stalker] Solana listen loop started")
         try:
             while self.connected and self.websocket:
                 try:
                     # Receive messages from Solana WebSocket
                     messages = await self.websocket.recv()
-                    print(f"[Stalker] Received {len(messages) if messages else 0} Solana messages")
                     
                     # Process each message
                     for message in messages:
                         await self._process_message(message)
                         
                 except asyncio.CancelledError:
-                    print("[Stalker] Solana listen loop cancelled")
+                    log.debug("[Stalker] Solana listen loop cancelled")
                     break
                 except Exception as e:
-                    print(f"[Stalker] Solana listen error: {e}")
+                    log.error("[Stalker] Solana listen error: %s", e)
                     await asyncio.sleep(1)
                     
         except Exception as e:
-            print(f"[Stalker] Solana listen loop error: {e}")
+            log.error("[Stalker] Solana listen loop error: %s", e)
             self.connected = False
     
     async def _process_message(self, message):
@@ -472,132 +844,156 @@ class SolanaWalletStalker:
         Process incoming WebSocket message from Solana.
         Detects wallet activity and triggers callbacks.
         """
+        # Fast path: solana-py has already decoded the frame into typed solders objects -
+        # route by type and subscription id before serializing anything
+        if isinstance(message, SubscriptionResult):
+            wallet = self._pending_subs.pop(message.id, None)
+            if wallet is not None:
+                self.subscription_ids[wallet] = message.result
+                self._sub_to_wallet[message.result] = wallet
+            elif message.id in self._cancelled_subs:
+                # Unwatched while the subscription was in flight - drop it server-side now
+                self._cancelled_subs.discard(message.id)
+                try:
+                    await self.websocket.logs_unsubscribe(message.result)
+                except Exception as e:
+                    log.error("[Stalker] Unsubscribe error: %s", e)
+            return
+        
+        if not isinstance(message, LogsNotification):
+            return
+        
+        # The subscription id identifies the wallet directly (no fan-out to every watched wallet)
+        wallet = self._sub_to_wallet.get(message.subscription)
+        if wallet is None:
+            return
+        
         try:
-            # Convert message to dict if needed
-            if hasattr(message, 'to_json'):
-                data = json.loads(message.to_json())
-            else:
-                data = message
+            data = loads_json(message.to_json())
             
-            # Show what we're actually receiving (first 3 times for debugging)
-            if not hasattr(self, '_debug_count'):
-                self._debug_count = 0
+            # Show what we're actually receiving (first 3 messages, debug runs only)
+            if STALKER_DEBUG and self._debug_count < 3:
+                self._debug_dump(message, data)
             
-            if self._debug_count < 3:
-                print(f"[Stalker] DEBUG #{self._debug_count + 1} - Full message:")
-                print(f"  Type: {type(message)}")
-                print(f"  Data type: {type(data)}")
-                print(f"  Data: {data}")
-                print(f"  Keys: {list(data.keys()) if isinstance(data, dict) else 'N/A'}")
-                self._debug_count += 1
+            value = data.get("params", {}).get("result", {}).get("value", {})
+            signature = value.get("signature")
+            if not signature:
+                return
             
-            # Check if this is a logs notification
-            method = data.get("method", "")
+            if STALKER_DEBUG:
+                log.debug("[Stalker] Signature: %s... for %s", signature[:10], wallet[:10])
             
-            if method == "logsNotification":
-                print("[Stalker] ✅ Logs notification received!")
-                params = data.get("params", {})
-                result = params.get("result", {})
-                value = result.get("value", {})
-                
-                signature = value.get("signature")
-                logs = value.get("logs", [])
-                
-                if not signature:
-                    print("[Stalker] No signature in notification")
-                    return
-                
-                print(f"[Stalker] Signature: {signature[:10]}... for {len(self.watched_wallets)} watched wallets")
-                
-                # Check which watched wallet this relates to
-                # For Solana, we check if any watched wallet is in the logs
-                for wallet in self.watched_wallets:
-                    # For now, alert on any activity for watched wallets
-                    print(f"[Stalker] Triggering activity for wallet: {wallet[:10]}...")
-                    await self._handle_wallet_activity(wallet, signature, value)
-            elif self._debug_count >= 3:
-                # After debug phase, just count unknown
-                pass
+            # Solana uses slots, not block numbers
+            self._handle_activity(wallet, signature, {"event_data": value})
                         
         except Exception as e:
-            print(f"[Stalker] Solana message processing error: {e}")
-            import traceback
-            traceback.print_exc()
+            log.exception("[Stalker] Solana message processing error: %s", e)
     
-    async def _handle_wallet_activity(self, wallet: str, signature: str, log_data: dict):
-        """
-        Handle detected Solana wallet activity with debouncing.
-        """
-        # Debounce: Skip if we've already seen this signature
-        if signature in self.last_seen_txs[wallet]:
-            return
-        
-        # Add to seen transactions
-        self.last_seen_txs[wallet].add(signature)
-        if len(self.last_seen_txs[wallet]) > 100:
-            self.last_seen_txs[wallet].pop()
-        
-        # Update last activity timestamp
-        self.last_activity[wallet] = datetime.utcnow()
-        
-        # Log detection
-        print(f"[Stalker] 🚨 SOLANA TARGET ACTIVE! {wallet[:10]}... | Tx: {signature[:10]}...")
-        
-        # Trigger callback if registered
-        if self.on_activity:
-            activity_event = {
-                "wallet": wallet,
-                "tx_hash": signature,
-                "block_number": None,  # Solana uses slots
-                "timestamp": datetime.utcnow().isoformat(),
-                "chain": "solana",
-                "event_data": log_data
-            }
-            
+    def _debug_dump(self, message, data):
+        self._debug_count += 1
+        log.debug("[Stalker] DEBUG #%s - Full message:", self._debug_count)
+        log.debug("  Type: %s", type(message))
+        log.debug("  Data type: %s", type(data))
+        log.debug("  Data: %s", data)
+        log.debug("  Keys: %s", list(data.keys()) if isinstance(data, dict) else 'N/A')
+
+
+class StalkerRunner:
+    """
+    Dedicated thread with its own event loop for the stalkers.
+    recv() never waits behind slow work on the application's loop (which could
+    also trip server ping timeouts); only coalesced activity batches cross back.
+    """
+    
+    def __init__(self):
+        # uvicorn's loop="auto" only covers the server's own loop - this one is created here
+        self.loop = uvloop.new_event_loop() if UVLOOP_SUPPORTED else asyncio.new_event_loop()
+        self.thread = threading.Thread(target=self.loop.run_forever, name="stalker-loop", daemon=True)
+        self.thread.start()
+    
+    async def call(self, coro):
+        """Run a coroutine on the stalker loop and await its result from the caller's loop"""
+        return await asyncio.wrap_future(asyncio.run_coroutine_threadsafe(coro, self.loop))
+    
+    def stop(self):
+        self.loop.call_soon_threadsafe(self.loop.stop)
+        self.thread.join(timeout=5)
+
+
+class ThreadedStalker:
+    """
+    Caller-side handle for a stalker running on a StalkerRunner.
+    Same interface as the stalker: async methods are forwarded to the stalker
+    loop, and activity callbacks are invoked on the caller's loop.
+    """
+    
+    def __init__(self, runner: StalkerRunner, stalker, caller_loop: asyncio.AbstractEventLoop):
+        self._runner = runner
+        self._stalker = stalker
+        self._caller_loop = caller_loop
+        self.on_activity: Optional[Callable] = None
+        self.on_activity_batch: Optional[Callable] = None
+        stalker.on_activity_batch = self._forward_batch
+    
+    async def _forward_batch(self, events: List[dict]):
+        """Runs on the stalker loop - hands the batch to the caller's loop without waiting"""
+        if self.on_activity_batch or self.on_activity:
+            asyncio.run_coroutine_threadsafe(self._deliver(events), self._caller_loop)
+    
+    async def _deliver(self, events: List[dict]):
+        if self.on_activity_batch:
             try:
-                await self.on_activity(activity_event)
+                await self.on_activity_batch(events)
             except Exception as e:
-                print(f"[Stalker] Callback error: {e}")
+                log.error("[Stalker] Callback error: %s", e)
+        elif self.on_activity:
+            for activity_event in events:
+                try:
+                    await self.on_activity(activity_event)
+                except Exception as e:
+                    log.error("[Stalker] Callback error: %s", e)
     
-    def get_watched_wallets_status(self) -> Dict:
-        """
-        Get current status of all watched Solana wallets.
-        """
-        status = {}
-        now = datetime.utcnow()
-        
-        for wallet in self.watched_wallets:
-            last_activity = self.last_activity.get(wallet)
-            
-            if last_activity:
-                time_diff = (now - last_activity).total_seconds()
-                
-                if time_diff < 30:
-                    state = "active"
-                    time_ago = f"{int(time_diff)}s ago"
-                elif time_diff < 3600:
-                    state = "idle"
-                    time_ago = f"{int(time_diff / 60)}m ago"
-                else:
-                    state = "idle"
-                    time_ago = f"{int(time_diff / 3600)}h ago"
-            else:
-                state = "idle"
-                time_ago = "Never"
-            
-            status[wallet] = {
-                "state": state,
-                "last_activity": time_ago,
-                "last_activity_timestamp": last_activity.isoformat() if last_activity else None,
-                "tx_count": len(self.last_seen_txs.get(wallet, set()))
-            }
-        
-        return status
+    async def watch_wallet(self, wallet_address: str):
+        return await self._runner.call(self._stalker.watch_wallet(wallet_address))
+    
+    async def watch_wallets(self, wallet_addresses: List[str]):
+        return await self._runner.call(self._stalker.watch_wallets(wallet_addresses))
+    
+    async def unwatch_wallet(self, wallet_address: str):
+        return await self._runner.call(self._stalker.unwatch_wallet(wallet_address))
+    
+    async def disconnect(self):
+        return await self._runner.call(self._stalker.disconnect())
+    
+    def __getattr__(self, name):
+        # Plain state (connected, watched_wallets, get_watched_wallets_status, ...) is read directly
+        return getattr(self._stalker, name)
+
+
+async def _connect_new(cls, *args):
+    stalker = cls(*args)
+    await stalker.connect()
+    return stalker
+
+
+async def _start_stalker(cls, *args):
+    """Create and connect a stalker - on the dedicated stalker thread when STALKER_THREADED"""
+    global _runner
+    
+    if not STALKER_THREADED:
+        return await _connect_new(cls, *args)
+    
+    if _runner is None:
+        _runner = StalkerRunner()
+    # Constructed on the stalker loop so its queues/locks belong to that loop
+    stalker = await _runner.call(_connect_new(cls, *args))
+    return ThreadedStalker(_runner, stalker, asyncio.get_running_loop())
 
 
 # Global stalker instances (one per chain)
 _stalker_instances: Dict[str, WalletStalker] = {}
 _solana_stalker: Optional[SolanaWalletStalker] = None
+_runner: Optional[StalkerRunner] = None
 
 
 async def get_stalker(chain: str = "ethereum"):
@@ -611,22 +1007,19 @@ async def get_stalker(chain: str = "ethereum"):
     # Handle Solana separately
     if chain.lower() == "solana":
         if _solana_stalker is None:
-            _solana_stalker = SolanaWalletStalker()
-            await _solana_stalker.connect()
+            _solana_stalker = await _start_stalker(SolanaWalletStalker)
         return _solana_stalker
     
     # Handle EVM chains
     if chain not in _stalker_instances:
-        stalker = WalletStalker(chain)
-        await stalker.connect()
-        _stalker_instances[chain] = stalker
+        _stalker_instances[chain] = await _start_stalker(WalletStalker, chain)
     
     return _stalker_instances[chain]
 
 
 async def cleanup_stalkers():
     """Clean up all stalker connections (call on shutdown)"""
-    global _solana_stalker
+    global _solana_stalker, _runner
     
     # Clean up EVM stalkers
     for stalker in _stalker_instances.values():
@@ -637,4 +1030,8 @@ async def cleanup_stalkers():
     if _solana_stalker:
         await _solana_stalker.disconnect()
         _solana_stalker = None
-
+    
+    # Stop the stalker thread
+    if _runner:
+        _runner.stop()
+        _runner = None